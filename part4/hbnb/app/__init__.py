@@ -1,5 +1,5 @@
 import os
-from flask import Flask, request, send_from_directory, Blueprint
+from flask import Flask, send_from_directory, Blueprint
 from flask_restx import Api
 from flask_bcrypt import Bcrypt
 from flask_jwt_extended import JWTManager
@@ -34,6 +34,26 @@ def create_app(config_class="default"):
     db.init_app(app)
     migrate.init_app(app, db)
 
+    # Consultas, tiempo de base y de serialización por petición (header Server-Timing)
+    from app import instrumentation
+    instrumentation.init_app(app)
+
+    # Métricas de Prometheus en /metrics, sumadas entre workers (archivos mapeados en METRICS_DIR)
+    from app import metrics
+    metrics.init_app(app)
+
+    # Una transacción por petición (commit al final, no en cada repositorio)
+    from app.persistence import unit_of_work
+    unit_of_work.init_app(app)
+
+    # Catálogo de amenities en memoria (una foto por proceso, versionada en la base)
+    from app.persistence import amenity_catalog
+    amenity_catalog.init_app(app)
+
+    # Caché de lectura de la fachada (detalle de lugares y reseñas)
+    from app.services import cache
+    cache.init_app(app)
+
     # Importar la fachada después de inicializar db
     from app.services.facade import HBnBFacade  
     app.facade = HBnBFacade()
@@ -48,13 +68,19 @@ def create_app(config_class="default"):
         doc="/doc"  # Swagger disponible en /api/v1/doc
     )
 
+    # Codificador JSON rápido para todas las respuestas (orjson si está instalado)
+    from app.api.v1.representations import output_json
+    api.representation('application/json')(output_json)
+
     # Importar y registrar Namespaces
-    from app.api.v1 import auth_ns, users_ns, places_ns, reviews_ns, amenities_ns
+    from app.api.v1 import auth_ns, users_ns, places_ns, reviews_ns, amenities_ns, export_ns, cache_ns
     api.add_namespace(auth_ns, path="/auth")
     api.add_namespace(users_ns, path="/users")
     api.add_namespace(places_ns, path="/places")
     api.add_namespace(reviews_ns, path="/places/reviews") # <<--- review
     api.add_namespace(amenities_ns, path="/amenities")
+    api.add_namespace(export_ns, path="/export")
+    api.add_namespace(cache_ns, path="/cache")
 
     # Registrar el Blueprint de la API
     app.register_blueprint(api_bp)
@@ -63,26 +89,23 @@ def create_app(config_class="default"):
     from app.web.views import web
     app.register_blueprint(web)
 
+    # Registrar comandos de la CLI (flask hbnb ...)
+    from app.cli import hbnb_cli
+    app.cli.add_command(hbnb_cli)
+
     # Ruta para servir archivos de Swagger UI (opcional si usas carpeta swaggerui)
     @app.route('/swaggerui/<path:filename>')
     def serve_swagger_static(filename):
         return send_from_directory(os.path.join(app.root_path, 'swaggerui'), filename)
 
-    # --- Middleware de Logging ---
-    @app.before_request
-    def log_request_info():
-        print("\nIncoming request:")
-        print(f"   Method: {request.method}")
-        print(f"   Path: {request.path}")
-        print(f"   Headers: {dict(request.headers)}")
-        print(f"   Body: {request.get_data(as_text=True)}")
-
-    @app.after_request
-    def log_response_info(response):
-        print("Outgoing response:")
-        print(f"   Status: {response.status}")
-        if not response.direct_passthrough:
-            print(f"   Body: {response.get_data(as_text=True)}")
-        return response
+    # Compresión gzip/brotli de respuestas y estáticos precomprimidos. Se
+    # registra antes que el logging: los after_request corren en orden
+    # inverso, así el log ve el cuerpo sin comprimir.
+    from app import compression
+    compression.init_app(app)
+
+    # --- Middleware de Logging --- (log estructurado de acceso, ver app/logs.py)
+    from app import logs
+    logs.init_app(app)
 
     return app
@@ -3,3 +3,5 @@ from .users import api as users_ns
 from .places import api as places_ns
 from .reviews import reviews_ns  
 from .amenities import api as amenities_ns
+from .export import api as export_ns
+from .cache import api as cache_ns
@@ -2,6 +2,9 @@ from flask import request, jsonify
 from flask_restx import Namespace, Resource, fields
 from flask_jwt_extended import jwt_required, get_jwt_identity
 from app.services.facade import facade
+from app.api.v1.conditional import not_modified, validator_headers
+from app.api.v1.pagination import get_page_args, page_response
+from app.api.v1.bulk import get_bulk_items, bulk_response
 
 api = Namespace("amenities", description="Amenity management")
 
@@ -12,10 +15,26 @@ amenity_model = api.model('Amenity', {
 
 @api.route('/')
 class AmenityList(Resource):
+    @api.doc(params={'limit': 'Page size (enables pagination)', 'cursor': 'Opaque cursor from a Link header'})
     def get(self):
-        """Retrieve all amenities."""
+        """Retrieve all amenities; supports If-None-Match."""
+        try:
+            page_args = get_page_args()
+        except ValueError as e:
+            return {"error": str(e)}, 400
+
+        validator = facade.get_amenities_validator()
+        cached = not_modified(validator)
+        if cached:
+            return cached
+        headers = validator_headers(validator)
+
+        if page_args:
+            items, status, links = page_response(facade.get_amenities_page(*page_args))
+            return items, status, {**headers, **links}
+
         amenities = facade.get_all_amenities()
-        return amenities if amenities else {"message": "No amenities found"}, 200
+        return amenities if amenities else {"message": "No amenities found"}, 200, headers
 
     @api.expect(amenity_model, validate=True)
     @jwt_required()
@@ -40,14 +59,37 @@ class AmenityList(Resource):
             return {"error": str(e)}, 400
 
 
+@api.route('/bulk')
+class AmenityBulk(Resource):
+    @api.expect([amenity_model])
+    @jwt_required()
+    def post(self):
+        """Create many amenities (Admin only); reports errors per item."""
+        user_id = get_jwt_identity()
+        current_user = facade.get_user(user_id)
+
+        if not current_user or not current_user.get("is_admin"):
+            return {"error": "Admin privileges required"}, 403
+
+        try:
+            items = get_bulk_items()
+            result = facade.create_amenities_bulk(items)
+        except ValueError as e:
+            return {"error": str(e)}, 400
+        return bulk_response(result)
+
+
 @api.route('/<string:amenity_id>')
 class AmenityResource(Resource):
     def get(self, amenity_id):
-        """Retrieve a specific amenity."""
-        amenity = facade.get_amenity(amenity_id)
-        if not amenity:
+        """Retrieve a specific amenity; supports If-None-Match / If-Modified-Since."""
+        validator = facade.get_amenity_validator(amenity_id)
+        if validator is None:
             return {"error": "Amenity not found"}, 404
-        return amenity, 200
+        cached = not_modified(validator)
+        if cached:
+            return cached
+        return facade.get_amenity(amenity_id), 200, validator_headers(validator)
 
     @api.expect(amenity_model, validate=True)
     @jwt_required()
@@ -1,7 +1,10 @@
+import logging
 from flask_jwt_extended import jwt_required, create_access_token, get_jwt_identity
 from flask_restx import Namespace, Resource, fields
 from app.services.facade import facade
 
+logger = logging.getLogger(__name__)
+
 api = Namespace('auth', description='Authentication operations')
 
 # Modelo Swagger para login
@@ -23,30 +26,24 @@ register_model = api.model('Register', {
 class Login(Resource):
     @api.expect(login_model)
     def post(self):
-        """Autenticación de usuarios con debug detallado."""
+        """Autenticación de usuarios."""
         credentials = api.payload
         email = credentials.get("email")
         password = credentials.get("password")
 
-        print(f"\n[AUTH] Iniciando login para: {email}")
+        logger.info("Iniciando login para: %s", email)
 
         user = facade.get_user_by_email(email)
         if not user:
-            print(f"[AUTH] Usuario no encontrado: {email}")
+            logger.info("Usuario no encontrado: %s", email)
             return {'error': 'Invalid credentials'}, 401
 
-        print("[AUTH] DEBUG PASSWORD:")
-        print(f"- Password ingresado: {password}")
-        print(f"- Hash en base de datos: {user.password}")
-        print(f"- Longitud del hash: {len(user.password)} caracteres")
-        print(f"- ¿Formato bcrypt ($2b$)? {'Sí' if user.password.startswith('$2b$') else 'No'}")
-
         if not user.password:
-            print("[AUTH] ERROR: Password vacío en base de datos.")
+            logger.warning("Password vacío en base de datos.")
             return {"error": "Invalid credentials"}, 401
 
         if not user.verify_password(password):
-            print("[AUTH] ERROR: Falló la verificación de password.")
+            logger.warning("Falló la verificación de password.")
             return {"error": "Invalid credentials"}, 401
 
         access_token = create_access_token(
@@ -57,7 +54,7 @@ class Login(Resource):
             }
         )
 
-        print(f"[AUTH] Login exitoso para: {email}")
+        logger.info("Login exitoso para: %s", email)
 
         return {
             'access_token': access_token,
@@ -72,23 +69,23 @@ class Register(Resource):
         """Registro de nuevos usuarios."""
         data = api.payload
 
-        print(f"[AUTH] Intentando registrar usuario con email: {data.get('email')}")
+        logger.info("Intentando registrar usuario con email: %s", data.get('email'))
 
         # Validación de existencia
         existing_user = facade.get_user_by_email(data['email'])
         if existing_user:
-            print(f"[AUTH] Error: Usuario ya existente: {data['email']}")
+            logger.info("Error: Usuario ya existente: %s", data['email'])
             return {'error': 'User already exists'}, 400
 
-        print("[AUTH] No existe, procediendo a crear usuario...")
+        logger.info("No existe, procediendo a crear usuario...")
 
         # Crear el usuario usando la fachada
         response, status = facade.create_user(data)
 
         if status == 201:
-            print(f"[AUTH] Registro exitoso para: {data['email']}")
+            logger.info("Registro exitoso para: %s", data['email'])
         else:
-            print(f"[AUTH] Error al registrar usuario: {response}")
+            logger.info("Error al registrar usuario: %s", response)
 
         return response, status
 
@@ -98,7 +95,7 @@ class ProtectedResource(Resource):
     def get(self):
         """Endpoint protegido para usuarios autenticados."""
         current_user = get_jwt_identity()
-        print(f"[AUTH] Acceso autorizado para usuario ID: {current_user}")
+        logger.info("Acceso autorizado para usuario ID: %s", current_user)
         return {
             'message': 'Access granted',
             'user_id': current_user
@@ -0,0 +1,30 @@
+from flask import request, current_app
+
+
+def get_bulk_items():
+    """
+    Lee el cuerpo de una carga masiva: un arreglo JSON de objetos.
+    Lanza ValueError si no es un arreglo, está vacío o pasa de BULK_MAX_ITEMS.
+    """
+    items = request.get_json(silent=True)
+    if not isinstance(items, list) or not items:
+        raise ValueError("Body must be a non-empty JSON array")
+    max_items = current_app.config.get('BULK_MAX_ITEMS', 50000)
+    if len(items) > max_items:
+        raise ValueError(f"At most {max_items} items per request")
+    return items
+
+
+def bulk_response(result):
+    """
+    Respuesta de una carga masiva: 201 si se crearon todos, 207 si solo
+    algunos (los errores van por índice) y 400 si ninguno. La unidad de
+    trabajo confirma los creados en 201/207 y descarta todo en 400.
+    """
+    if not result['errors']:
+        status = 201
+    elif result['created']:
+        status = 207
+    else:
+        status = 400
+    return {'created': result['created'], 'errors': result['errors']}, status
@@ -0,0 +1,17 @@
+from flask_restx import Namespace, Resource
+from flask_jwt_extended import jwt_required, get_jwt_identity
+from app.services.facade import facade
+from app.services.cache import get_cache
+
+api = Namespace('cache', description='Read-through cache diagnostics')
+
+
+@api.route('/stats')
+class CacheStats(Resource):
+    @jwt_required()
+    def get(self):
+        """Hit/miss counters of this process's cache (Admin only)."""
+        current_user = facade.get_user(get_jwt_identity())
+        if not current_user or not current_user.get("is_admin"):
+            return {"error": "Admin privileges required"}, 403
+        return get_cache().stats(), 200
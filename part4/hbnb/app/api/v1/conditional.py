@@ -0,0 +1,42 @@
+import hashlib
+from datetime import timezone
+from flask import Response, current_app, request
+from werkzeug.http import http_date
+from app.services import json_codec, place_documents
+
+
+def validator_headers(validator):
+    """
+    Headers ETag y Last-Modified de un validador (partes, última
+    modificación) de la fachada. El ETag es fuerte: incluye también cómo se
+    codifica el cuerpo, porque los bytes cambian con el codificador JSON, el
+    modo debug (sangría) y los documentos materializados.
+    """
+    parts, last_modified = validator
+    encoding = (json_codec.backend(), current_app.debug, place_documents.enabled())
+    digest = hashlib.sha256(repr((parts, encoding)).encode()).hexdigest()[:32]
+    headers = {'ETag': f'"{digest}"'}
+    if last_modified is not None:
+        headers['Last-Modified'] = http_date(last_modified.replace(tzinfo=timezone.utc))
+    return headers
+
+
+def not_modified(validator):
+    """
+    Respuesta 304 (sin cuerpo) si la petición ya tiene la versión actual
+    según If-None-Match o, si no lo envía, If-Modified-Since; si no, None.
+    El validador se calcula antes de leer el cuerpo: si algo cambia en el
+    medio, el cliente recibe datos más nuevos que su ETag y la próxima
+    petición los vuelve a pedir, nunca al revés.
+    """
+    headers = validator_headers(validator)
+    etag = headers['ETag'].strip('"')
+    if request.if_none_match:
+        fresh = request.if_none_match.contains_weak(etag)
+    elif request.if_modified_since and 'Last-Modified' in headers:
+        # HTTP tiene resolución de segundos
+        last_modified = validator[1].replace(tzinfo=timezone.utc, microsecond=0)
+        fresh = last_modified <= request.if_modified_since
+    else:
+        fresh = False
+    return Response(status=304, headers=headers) if fresh else None
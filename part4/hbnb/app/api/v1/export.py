@@ -0,0 +1,35 @@
+from flask import Response, request, stream_with_context
+from flask_restx import Namespace, Resource
+from flask_jwt_extended import jwt_required, get_jwt_identity
+from app.services.facade import facade, EXPORT_COLUMNS
+from app.services import json_codec
+
+api = Namespace('export', description='Catalog export (NDJSON)')
+
+
+@api.route('/<string:resource>.ndjson')
+@api.doc(params={'resource': f"One of: {', '.join(EXPORT_COLUMNS)}"})
+class Export(Resource):
+    @jwt_required()
+    @api.doc(params={'after': 'Resume after this id (the last id already received)'})
+    def get(self, resource):
+        """Stream a whole table as newline-delimited JSON, ordered by id (Admin only)."""
+        current_user = facade.get_user(get_jwt_identity())
+        if not current_user or not current_user.get("is_admin"):
+            return {"error": "Admin privileges required"}, 403
+
+        if resource not in EXPORT_COLUMNS:
+            return {"error": f"Unknown export: {resource}"}, 404
+
+        batches = facade.export_batches(resource, after=request.args.get('after') or None)
+
+        def generate():
+            # Una escritura por lote (no por fila); cada línea es un objeto JSON
+            for batch in batches:
+                yield b''.join(json_codec.dumps(row) + b'\n' for row in batch)
+
+        return Response(
+            stream_with_context(generate()),
+            mimetype='application/x-ndjson',
+            headers={'Content-Disposition': f'attachment; filename={resource}.ndjson'}
+        )
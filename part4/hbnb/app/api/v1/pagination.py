@@ -0,0 +1,50 @@
+from urllib.parse import urlencode
+from flask import request, current_app
+from app.persistence.pagination import decode_cursor
+
+
+def get_page_args():
+    """
+    Lee los parámetros `limit` y `cursor` de la query string.
+    Devuelve None si la petición no pide paginación, o (limit, cursor).
+    Lanza ValueError si `limit` no es un entero válido o si el cursor no
+    se puede decodificar (antes de consultar nada, p. ej. el ETag).
+    """
+    if 'limit' not in request.args and 'cursor' not in request.args:
+        return None
+
+    default_limit = current_app.config.get('PAGE_SIZE_DEFAULT', 20)
+    max_limit = current_app.config.get('PAGE_SIZE_MAX', 100)
+    raw_limit = request.args.get('limit', default_limit)
+    try:
+        limit = int(raw_limit)
+    except (TypeError, ValueError):
+        raise ValueError("limit must be an integer")
+    if not (1 <= limit <= max_limit):
+        raise ValueError(f"limit must be between 1 and {max_limit}")
+
+    cursor = request.args.get('cursor') or None
+    if cursor:
+        decode_cursor(cursor)
+    return limit, cursor
+
+
+def page_response(page, serializer=None):
+    """
+    Construye la respuesta de una página: la lista de objetos y un header
+    Link con los enlaces `next` y `prev` (RFC 8288) cuando existen.
+    """
+    items = [serializer(item) for item in page.items] if serializer else page.items
+    return items, 200, page_headers(page)
+
+
+def page_headers(page):
+    """Header Link de la página (vacío si no hay página siguiente ni anterior)."""
+    links = []
+    for rel, cursor in (('next', page.next_cursor), ('prev', page.prev_cursor)):
+        if cursor:
+            args = request.args.to_dict()
+            args['cursor'] = cursor
+            links.append(f'<{request.base_url}?{urlencode(args)}>; rel="{rel}"')
+
+    return {'Link': ', '.join(links)} if links else {}
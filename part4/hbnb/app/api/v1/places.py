@@ -1,13 +1,22 @@
-from flask import request, jsonify, current_app
+import logging
+import math
+from flask import Response, request, jsonify, current_app
 from flask_restx import Namespace, Resource, fields
 from flask_jwt_extended import jwt_required, get_jwt_identity
-from datetime import datetime
 from app.services.facade import facade  
+from app.api.v1.conditional import not_modified, validator_headers
+from app.api.v1.pagination import get_page_args, page_headers, page_response
+from app.api.v1.representations import json_array_response
+from app.services import place_documents
+from app.api.v1.bulk import get_bulk_items, bulk_response
+
+logger = logging.getLogger(__name__)
 
 api = Namespace('places', description='Place management')
 
 # -----------------------------
 # Funciones utilitarias para serializar datos
+# (las fechas las codifica la representación JSON de la API, ver representations.py)
 # -----------------------------
 def review_to_dict(review):
     return {
@@ -17,15 +26,15 @@ def review_to_dict(review):
         "user_id": review.get('user_id'),
         "user_name": review.get('user_name'),
         "place_id": review.get('place_id'),
-        "created_at": review.get('created_at').isoformat() if isinstance(review.get('created_at'), datetime) else review.get('created_at'),
-        "updated_at": review.get('updated_at').isoformat() if isinstance(review.get('updated_at'), datetime) else review.get('updated_at'),
+        "created_at": review.get('created_at'),
+        "updated_at": review.get('updated_at'),
     }
 
 def place_to_dict(place):
-    return {
+    data = {
         "id": place.get('id'),
-        "created_at": place.get('created_at').isoformat() if isinstance(place.get('created_at'), datetime) else place.get('created_at'),
-        "updated_at": place.get('updated_at').isoformat() if isinstance(place.get('updated_at'), datetime) else place.get('updated_at'),
+        "created_at": place.get('created_at'),
+        "updated_at": place.get('updated_at'),
         "title": place.get('title'),
         "description": place.get('description'),
         "price": place.get('price'),
@@ -33,9 +42,22 @@ def place_to_dict(place):
         "longitude": place.get('longitude'),
         "user_id": place.get('user_id'),
         "user_name": place.get('user_name'),
+        "review_count": place.get('review_count', 0),
+        "average_rating": place.get('average_rating'),
+        "rating_histogram": place.get('rating_histogram'),
         "amenities": [a for a in place.get('amenities', [])],
         "reviews": [review_to_dict(r) for r in place.get('reviews', [])]
     }
+    if 'distance_km' in place:
+        data["distance_km"] = place['distance_km']
+    if 'snippet' in place:
+        data["snippet"] = place['snippet']
+    return data
+
+
+def documents_response(body, status=200, headers=None):
+    """Respuesta con JSON ya codificado (documentos materializados de places)."""
+    return Response(body, status=status, headers=headers, mimetype='application/json')
 
 
 
@@ -62,38 +84,160 @@ class PlaceList(Resource):
     def post(self):
         """Create a new place (Only authenticated users)."""
         current_user_id = get_jwt_identity()
-        print("[DEBUG] Usuario autenticado (ID):", current_user_id)
+        logger.debug("Usuario autenticado (ID): %s", current_user_id)
 
         if not current_user_id:
-            print("[ERROR] Sesión de usuario inválida.")
+            logger.info("Sesión de usuario inválida.")
             return {"error": "Invalid user session"}, 401
 
         data = api.payload
-        print("[DEBUG] Payload recibido:", data)
+        logger.debug("Payload recibido: %s", data)
 
         # Asignar automáticamente el user_id
         data['user_id'] = current_user_id
-        print("[DEBUG] Payload con user_id agregado:", data)
+        logger.debug("Payload con user_id agregado: %s", data)
 
         if 'latitude' not in data or 'longitude' not in data:
-            print("[ERROR] Faltan coordenadas en la creación del lugar.")
+            logger.info("Faltan coordenadas en la creación del lugar.")
             return {"error": "Latitude and longitude are required"}, 400
 
         try:
             place = facade.create_place(data)
-            print("[SUCCESS] Lugar creado correctamente:", place)
+            logger.debug("Lugar creado correctamente: %s", place)
             return place_to_dict(place), 201
         except ValueError as e:
-            print("[ERROR] Error al crear lugar:", str(e))
+            logger.info("Error al crear lugar: %s", e)
+            return {"error": str(e)}, 400
+
+    @api.doc(params={'limit': 'Page size (enables pagination)', 'cursor': 'Opaque cursor from a Link header'})
+    def get(self):
+        """Retrieve all places (public endpoint); supports If-None-Match."""
+        try:
+            page_args = get_page_args()
+        except ValueError as e:
+            return {"error": str(e)}, 400
+
+        validator = facade.get_listing_validator('places')
+        cached = not_modified(validator)
+        if cached:
+            return cached
+        headers = validator_headers(validator)
+
+        if page_args and place_documents.enabled():
+            page = facade.get_place_documents_page(*page_args)
+            return documents_response(place_documents.json_array(page.items),
+                                      headers={**headers, **page_headers(page)})
+        if page_args:
+            items, status, links = page_response(facade.get_places_page(*page_args), place_to_dict)
+            return items, status, {**headers, **links}
+
+        if place_documents.enabled():
+            return documents_response(place_documents.json_array(facade.get_all_place_documents()), headers=headers)
+
+        logger.debug("Solicitando lista de todos los lugares...")
+        return json_array_response(facade.iter_places(), place_to_dict, headers) or ([], 200, headers)
+
+# -----------------------------
+# Carga masiva de lugares
+# -----------------------------
+@api.route('/bulk')
+class PlaceBulk(Resource):
+    @jwt_required()
+    @api.expect([place_model])
+    def post(self):
+        """Create many places owned by the authenticated user; reports errors per item."""
+        current_user_id = get_jwt_identity()
+        try:
+            items = get_bulk_items()
+            result = facade.create_places_bulk(items, current_user_id)
+        except ValueError as e:
+            logger.info("Error en la carga masiva de lugares: %s", e)
             return {"error": str(e)}, 400
+        return bulk_response(result)
 
+# -----------------------------
+# Búsqueda de lugares con filtros en el servidor
+# -----------------------------
+SEARCH_FLOAT_ARGS = ('min_price', 'max_price', 'min_lat', 'max_lat', 'min_lon', 'max_lon', 'min_rating')
+
+@api.route('/search')
+class PlaceSearch(Resource):
+    @api.doc(params={
+        'min_price': 'Minimum price per night',
+        'max_price': 'Maximum price per night',
+        'min_lat': 'Bounding box south edge',
+        'max_lat': 'Bounding box north edge',
+        'min_lon': 'Bounding box west edge',
+        'max_lon': 'Bounding box east edge',
+        'amenities': 'Required amenity IDs (repeat or comma-separated)',
+        'min_rating': 'Minimum average rating (1-5)',
+        'q': 'Keywords matched against title and description',
+        'sort': 'relevance (default with q), newest, price_asc, price_desc or rating',
+        'limit': 'Maximum number of results'
+    })
+    def get(self):
+        """Search places by keywords, price, bounding box, amenities and rating (public endpoint)."""
+        filters = {}
+        try:
+            for name in SEARCH_FLOAT_ARGS:
+                if request.args.get(name) not in (None, ''):
+                    filters[name] = float(request.args[name])
+        except ValueError:
+            return {"error": f"{name} must be a number"}, 400
+
+        amenity_ids = []
+        for value in request.args.getlist('amenities'):
+            amenity_ids.extend(a.strip() for a in value.split(',') if a.strip())
+        filters['amenities'] = amenity_ids
+        filters['sort'] = request.args.get('sort')
+        filters['q'] = request.args.get('q')
+
+        limit = request.args.get('limit')
+        max_limit = current_app.config.get('PAGE_SIZE_MAX', 100)
+        if limit is not None and (not limit.isdigit() or not 1 <= int(limit) <= max_limit):
+            return {"error": f"limit must be between 1 and {max_limit}"}, 400
+
+        try:
+            places = facade.search_places(filters, limit=int(limit) if limit else None)
+        except ValueError as e:
+            return {"error": str(e)}, 400
+        return [place_to_dict(place) for place in places], 200
+
+# -----------------------------
+# Lugares cercanos a un punto (radio en km)
+# -----------------------------
+@api.route('/nearby')
+class PlaceNearby(Resource):
+    @api.doc(params={
+        'lat': 'Latitude of the center point',
+        'lon': 'Longitude of the center point',
+        'radius_km': 'Search radius in kilometers',
+        'limit': 'Maximum number of results'
+    })
     def get(self):
-        """Retrieve all places (public endpoint)."""
-        print("[DEBUG] Solicitando lista de todos los lugares...")
-        places = facade.get_all_places()
-        serialized_places = [place_to_dict(place) for place in places]
-        print("[SUCCESS] Lista de lugares obtenida:", serialized_places)
-        return serialized_places, 200
+        """Retrieve places within a radius of a point, nearest first (public endpoint)."""
+        try:
+            latitude = float(request.args['lat'])
+            longitude = float(request.args['lon'])
+            radius_km = float(request.args.get('radius_km', 10))
+        except (KeyError, ValueError):
+            return {"error": "lat and lon are required numbers; radius_km must be a number"}, 400
+
+        if not (-90 <= latitude <= 90 and -180 <= longitude <= 180) or radius_km <= 0:
+            return {"error": "Coordinates out of range or non-positive radius"}, 400
+
+        # float() acepta 'nan' e 'inf'; un radio mayor que el máximo ya cubre toda la Tierra
+        max_radius = current_app.config.get('NEARBY_MAX_RADIUS_KM', 20000)
+        if not math.isfinite(radius_km) or radius_km > max_radius:
+            return {"error": f"radius_km must be a finite number up to {max_radius}"}, 400
+
+        limit = request.args.get('limit')
+        max_limit = current_app.config.get('PAGE_SIZE_MAX', 100)
+        if limit is not None and (not limit.isdigit() or not 1 <= int(limit) <= max_limit):
+            return {"error": f"limit must be between 1 and {max_limit}"}, 400
+
+        places = facade.get_nearby_places(latitude, longitude, radius_km, limit=int(limit) if limit else None)
+        return [place_to_dict(place) for place in places], 200
 
 # -----------------------------
 # Obtener, actualizar o eliminar un place específico
@@ -101,59 +245,73 @@ class PlaceList(Resource):
 @api.route('/<string:place_id>')
 class PlaceResource(Resource):
     def get(self, place_id):
-        """Retrieve a specific place by ID (public endpoint)."""
-        print(f"[DEBUG] Solicitando detalles del lugar ID: {place_id}")
+        """Retrieve a specific place by ID (public endpoint); supports If-None-Match / If-Modified-Since."""
+        logger.debug("Solicitando detalles del lugar ID: %s", place_id)
+        validator = facade.get_place_validator(place_id)
+        if validator is None:
+            logger.info("Lugar no encontrado.")
+            return {"error": "Place not found"}, 404
+        cached = not_modified(validator)
+        if cached:
+            return cached
+
+        if place_documents.enabled():
+            body = facade.get_place_document(place_id)
+            if body is None:
+                return {"error": "Place not found"}, 404
+            return documents_response(body, headers=validator_headers(validator))
+
         place = facade.get_place(place_id)
         if not place:
-            print("[ERROR] Lugar no encontrado.")
+            logger.info("Lugar no encontrado.")
             return {"error": "Place not found"}, 404
-        print("[SUCCESS] Lugar encontrado:", place)
-        return place_to_dict(place), 200
+        logger.debug("Lugar encontrado: %s", place)
+        return place_to_dict(place), 200, validator_headers(validator)
 
     @jwt_required()
     @api.expect(place_model, validate=True)
     def put(self, place_id):
         """Update an existing place (Owner or Admin)."""
         current_user_id = get_jwt_identity()
-        print("[DEBUG] Usuario que quiere actualizar (ID):", current_user_id)
+        logger.debug("Usuario que quiere actualizar (ID): %s", current_user_id)
 
         place = facade.get_place(place_id)
         if not place:
-            print("[ERROR] Lugar a actualizar no encontrado.")
+            logger.info("Lugar a actualizar no encontrado.")
             return {"error": "Place not found"}, 404
 
         is_admin = place.get('is_admin', False)
         is_owner = place.get('user_id') == current_user_id
 
         if not (is_admin or is_owner):
-            print("[ERROR] Acción no autorizada para actualizar.")
+            logger.warning("Acción no autorizada para actualizar.")
             return {"error": "Unauthorized action"}, 403
 
         updated_data = {key: value for key, value in api.payload.items() if key != "user_id"}
-        print("[DEBUG] Data para actualizar:", updated_data)
+        logger.debug("Data para actualizar: %s", updated_data)
 
         updated_place = facade.update_place(place_id, current_user_id, updated_data)
-        print("[SUCCESS] Lugar actualizado:", updated_place)
+        logger.debug("Lugar actualizado: %s", updated_place)
         return {"message": "Place updated successfully", "place": place_to_dict(updated_place)}, 200
 
     @jwt_required()
     def delete(self, place_id):
         """Delete a place (Owner or Admin)."""
         current_user_id = get_jwt_identity()
-        print("[DEBUG] Usuario que quiere eliminar (ID):", current_user_id)
+        logger.debug("Usuario que quiere eliminar (ID): %s", current_user_id)
 
         place = facade.get_place(place_id)
         if not place:
-            print("[ERROR] Lugar a eliminar no encontrado.")
+            logger.info("Lugar a eliminar no encontrado.")
             return {"error": "Place not found"}, 404
 
         is_admin = place.get('is_admin', False)
         is_owner = place.get('user_id') == current_user_id
 
         if not (is_admin or is_owner):
-            print("[ERROR] Acción no autorizada para eliminar.")
+            logger.warning("Acción no autorizada para eliminar.")
             return {"error": "Unauthorized action"}, 403
 
         facade.delete_place(place_id, current_user_id)
-        print("[SUCCESS] Lugar eliminado correctamente.")
+        logger.info("Lugar eliminado correctamente.")
         return {"message": "Place deleted successfully"}, 200
@@ -0,0 +1,48 @@
+from itertools import chain
+from flask import Response, current_app, make_response, stream_with_context
+from app import instrumentation
+from app.services import json_codec
+
+
+def output_json(data, code, headers=None):
+    """
+    Representación application/json de la API (reemplaza la de Flask-RESTX):
+    codifica con json_codec, que convierte fechas y UUID por su cuenta, así
+    que los serializadores de las rutas no necesitan pasar fechas a texto.
+    """
+    with instrumentation.serializing():
+        body = json_codec.dumps(data, indent=current_app.debug) + b'\n'
+    response = make_response(body, code)
+    response.headers.extend(headers or {})
+    return response
+
+
+def json_array_response(batches, serializer=None, headers=None):
+    """
+    Respuesta 200 con un arreglo JSON armado a partir de `batches` (un
+    iterable de listas, p. ej. facade.iter_places()), aplicando `serializer`
+    a cada elemento. Con STREAM_JSON el arreglo se codifica y se envía lote a
+    lote (sin sangría ni Content-Length), así que la memoria depende del
+    tamaño del lote y no del listado; sin STREAM_JSON se arma entero como
+    antes. Devuelve None si no hay ningún elemento, para que la ruta
+    responda su propio mensaje de lista vacía.
+    """
+    batches = iter(batches)
+    first = next(batches, None)
+    if first is None:
+        return None
+    batches = chain([first], batches)
+
+    if not current_app.config.get('STREAM_JSON'):
+        return [serializer(item) if serializer else item for batch in batches for item in batch], 200, headers
+
+    def generate():
+        separator = b'['
+        for batch in batches:
+            items = [serializer(item) for item in batch] if serializer else batch
+            yield separator + b','.join(json_codec.dumps(item) for item in items)
+            separator = b','
+        yield b']\n'
+
+    # stream_with_context mantiene la petición (y la sesión) mientras se leen los lotes
+    return Response(stream_with_context(generate()), mimetype='application/json', headers=headers)
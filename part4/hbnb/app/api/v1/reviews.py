@@ -1,7 +1,15 @@
+import logging
 from flask import request
 from flask_restx import Namespace, Resource, fields
 from flask_jwt_extended import jwt_required, get_jwt_identity
-from app.services.facade import facade  # Instancia del sistema HBnB
+from app.services.facade import facade, DuplicateReviewError  # Instancia del sistema HBnB
+from app.api.v1.conditional import not_modified, validator_headers
+from app.api.v1.pagination import get_page_args, page_response
+from app.api.v1.places import review_to_dict
+from app.api.v1.representations import json_array_response
+from app.api.v1.bulk import get_bulk_items, bulk_response
+
+logger = logging.getLogger(__name__)
 
 # Namespace para Reviews
 reviews_ns = Namespace('reviews', description='Review management')
@@ -19,16 +27,31 @@ review_model = reviews_ns.model('Review', {
 # -----------------------------
 @reviews_ns.route('/')
 class ReviewList(Resource):
+    @reviews_ns.doc(params={'limit': 'Page size (enables pagination)', 'cursor': 'Opaque cursor from a Link header'})
     def get(self):
-        """Retrieve all reviews (public endpoint)."""
-        print("[DEBUG] Solicitando lista de todos los reviews...")
-        reviews = [r.to_dict() for r in facade.review_repo.get_all()]
-        if reviews:
-            print(f"[SUCCESS] Reviews encontrados: {reviews}")
-            return reviews, 200
+        """Retrieve all reviews (public endpoint); supports If-None-Match."""
+        try:
+            page_args = get_page_args()
+        except ValueError as e:
+            return {"error": str(e)}, 400
+
+        validator = facade.get_listing_validator('reviews')
+        cached = not_modified(validator)
+        if cached:
+            return cached
+        headers = validator_headers(validator)
+
+        if page_args:
+            items, status, links = page_response(facade.get_reviews_page(*page_args), review_to_dict)
+            return items, status, {**headers, **links}
+
+        logger.debug("Solicitando lista de todos los reviews...")
+        response = json_array_response(facade.iter_reviews(), review_to_dict, headers)
+        if response:
+            return response
         else:
-            print("[INFO] No se encontraron reviews.")
-            return {"message": "No reviews found"}, 200
+            logger.info("No se encontraron reviews.")
+            return {"message": "No reviews found"}, 200, headers
 
     @jwt_required()
     @reviews_ns.expect(review_model, validate=True)
@@ -36,35 +59,59 @@ class ReviewList(Resource):
         """Create a new review (authenticated users only)."""
         user_id = get_jwt_identity()
         data = request.get_json()
-        print(f"[DEBUG] Creando review. Datos recibidos: {data}")
+        logger.debug("Creando review. Datos recibidos: %s", data)
 
         # Validaciones
         if not data.get('text') or not data['text'].strip():
-            print("[ERROR] El texto del review es vacío.")
+            logger.info("El texto del review es vacío.")
             return {"error": "Text cannot be empty"}, 400
 
         if not (1 <= data.get('rating', 0) <= 5):
-            print("[ERROR] Rating inválido.")
+            logger.info("Rating inválido.")
             return {"error": "Rating must be between 1 and 5"}, 400
 
         place = facade.get_place(data['place_id'])
         if not place:
-            print("[ERROR] Place no encontrado.")
+            logger.info("Place no encontrado.")
             return {"error": "Place not found"}, 404
 
         if place['user_id'] == user_id:
-            print("[ERROR] Usuario intentando reseñar su propio lugar.")
+            logger.info("Usuario intentando reseñar su propio lugar.")
             return {"error": "You cannot review your own place"}, 400
 
-        existing_review = facade.get_review_by_user_and_place(user_id, data['place_id'])
-        if existing_review:
-            print("[ERROR] Usuario ya reseñó este lugar.")
+        # Las reseñas duplicadas las rechaza la restricción única en create_review
+        data['user_id'] = user_id
+        try:
+            review = facade.create_review(data)
+        except DuplicateReviewError:
+            logger.info("Usuario ya reseñó este lugar.")
             return {"error": "You have already reviewed this place"}, 400
+        except ValueError as e:
+            logger.info("Error al crear review: %s", e)
+            return {"error": str(e)}, 400
+        logger.debug("Review creado: %s", review)
+        return review_to_dict(review), 201
 
-        data['user_id'] = user_id
-        review = facade.create_review(data)
-        print(f"[SUCCESS] Review creado: {review}")
-        return review, 201
+# -----------------------------
+# Carga masiva de reviews del usuario autenticado
+# -----------------------------
+@reviews_ns.route('/bulk')
+class ReviewBulk(Resource):
+    @jwt_required()
+    @reviews_ns.expect([review_model])
+    def post(self):
+        """Create many reviews as the authenticated user; reports errors per item."""
+        user_id = get_jwt_identity()
+        try:
+            items = get_bulk_items()
+            result = facade.create_reviews_bulk(items, user_id)
+        except DuplicateReviewError:
+            logger.info("Reseña duplicada creada en paralelo con la carga masiva.")
+            return {"error": "A review in this batch was created concurrently; retry the request"}, 409
+        except ValueError as e:
+            logger.info("Error en la carga masiva de reviews: %s", e)
+            return {"error": str(e)}, 400
+        return bulk_response(result)
 
 # -----------------------------
 # Endpoint para un Review específico (por ID)
@@ -72,53 +119,65 @@ class ReviewList(Resource):
 @reviews_ns.route('/<string:review_id>')
 class ReviewResource(Resource):
     def get(self, review_id):
-        """Retrieve a specific review by ID."""
-        print(f"[DEBUG] Buscando review ID: {review_id}")
+        """Retrieve a specific review by ID; supports If-None-Match / If-Modified-Since."""
+        logger.debug("Buscando review ID: %s", review_id)
+        validator = facade.get_review_validator(review_id)
+        if validator is None:
+            logger.info("Review no encontrado.")
+            return {"error": "Review not found"}, 404
+        cached = not_modified(validator)
+        if cached:
+            return cached
+
         review = facade.get_review(review_id)
         if not review:
-            print("[ERROR] Review no encontrado.")
+            logger.info("Review no encontrado.")
             return {"error": "Review not found"}, 404
-        print(f"[SUCCESS] Review encontrado: {review}")
-        return review, 200
+        logger.debug("Review encontrado: %s", review)
+        return review_to_dict(review), 200, validator_headers(validator)
 
     @jwt_required()
     @reviews_ns.expect(review_model, validate=True)
     def put(self, review_id):
         """Update an existing review (owner only)."""
         current_user_id = get_jwt_identity()
-        print(f"[DEBUG] Actualizando review ID: {review_id}")
+        logger.debug("Actualizando review ID: %s", review_id)
         review = facade.get_review(review_id)
 
         if not review:
-            print("[ERROR] Review no encontrado para actualizar.")
+            logger.info("Review no encontrado para actualizar.")
             return {"error": "Review not found"}, 404
 
         if review['user_id'] != current_user_id:
-            print("[ERROR] Usuario no autorizado para actualizar este review.")
+            logger.warning("Usuario no autorizado para actualizar este review.")
             return {"error": "Unauthorized action"}, 403
 
         updated_data = {key: value for key, value in request.json.items() if key not in ["id", "user_id", "place_id"]}
-        updated_review = facade.update_review(review_id, updated_data)
-        print(f"[SUCCESS] Review actualizado: {updated_review}")
-        return {"message": "Review updated successfully", "review": updated_review}, 200
+        try:
+            updated_review = facade.update_review(review_id, updated_data)
+        except ValueError as e:
+            logger.info("Error al actualizar review: %s", e)
+            return {"error": str(e)}, 400
+        logger.debug("Review actualizado: %s", updated_review)
+        return {"message": "Review updated successfully", "review": review_to_dict(updated_review)}, 200
 
     @jwt_required()
     def delete(self, review_id):
         """Delete a review (owner only)."""
         current_user_id = get_jwt_identity()
-        print(f"[DEBUG] Eliminando review ID: {review_id}")
+        logger.debug("Eliminando review ID: %s", review_id)
         review = facade.get_review(review_id)
 
         if not review:
-            print("[ERROR] Review no encontrado para eliminar.")
+            logger.info("Review no encontrado para eliminar.")
             return {"error": "Review not found"}, 404
 
         if review['user_id'] != current_user_id:
-            print("[ERROR] Usuario no autorizado para eliminar este review.")
+            logger.warning("Usuario no autorizado para eliminar este review.")
             return {"error": "Unauthorized action"}, 403
 
         facade.delete_review(review_id)
-        print("[SUCCESS] Review eliminado correctamente.")
+        logger.info("Review eliminado correctamente.")
         return {"message": "Review deleted successfully"}, 200
 
 # -----------------------------
@@ -128,19 +187,19 @@ class ReviewResource(Resource):
 class PlaceReviews(Resource):
     def get(self, place_id):
         """Retrieve all reviews for a specific place."""
-        print(f"[DEBUG] Buscando reviews para el lugar ID: {place_id}")
+        logger.debug("Buscando reviews para el lugar ID: %s", place_id)
         place = facade.get_place(place_id)
         if not place:
-            print("[ERROR] Lugar no encontrado.")
+            logger.info("Lugar no encontrado.")
             return {"error": "Place not found"}, 404
 
         reviews = facade.get_reviews_by_place(place_id)
         if not reviews:
-            print("[INFO] No hay reviews para este lugar.")
+            logger.info("No hay reviews para este lugar.")
             return {"message": "No reviews found for this place"}, 200
 
         reviews_list = [review.to_dict() for review in reviews]
-        print(f"[SUCCESS] Reviews encontrados: {reviews_list}")
+        logger.debug("Reviews encontrados: %s", reviews_list)
         return reviews_list, 200
 
     @jwt_required()
@@ -149,24 +208,27 @@ class PlaceReviews(Resource):
         """Create a review for a specific place (authenticated users only)."""
         user_id = get_jwt_identity()
         data = request.get_json()
-        print(f"[DEBUG] Intentando crear review para place ID {place_id} con datos {data}")
+        logger.debug("Intentando crear review para place ID %s con datos %s", place_id, data)
 
         place = facade.get_place(place_id)
         if not place:
-            print("[ERROR] Lugar no encontrado para review.")
+            logger.info("Lugar no encontrado para review.")
             return {"error": "Place not found"}, 404
 
         if place['user_id'] == user_id:
-            print("[ERROR] Usuario intentando reseñar su propio lugar.")
+            logger.info("Usuario intentando reseñar su propio lugar.")
             return {"error": "You cannot review your own place"}, 400
 
-        existing_review = facade.get_review_by_user_and_place(user_id, place_id)
-        if existing_review:
-            print("[ERROR] Ya existe un review del usuario para este lugar.")
-            return {"error": "You have already reviewed this place"}, 400
-
+        # Las reseñas duplicadas las rechaza la restricción única en create_review
         data['user_id'] = user_id
         data['place_id'] = place_id
-        review = facade.create_review(data)
-        print(f"[SUCCESS] Review creado: {review}")
-        return review, 201
+        try:
+            review = facade.create_review(data)
+        except DuplicateReviewError:
+            logger.info("Usuario ya reseñó este lugar.")
+            return {"error": "You have already reviewed this place"}, 400
+        except ValueError as e:
+            logger.info("Error al crear review: %s", e)
+            return {"error": str(e)}, 400
+        logger.debug("Review creado: %s", review)
+        return review_to_dict(review), 201
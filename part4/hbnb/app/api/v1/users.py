@@ -1,7 +1,12 @@
+import logging
 from flask import request
 from flask_restx import Namespace, Resource, fields
 from flask_jwt_extended import jwt_required, get_jwt_identity
 from app.services.facade import facade  # ✅ Importamos la instancia global
+from app.api.v1.pagination import get_page_args, page_response
+from app.api.v1.representations import json_array_response
+
+logger = logging.getLogger(__name__)
 
 api = Namespace('users', description='User operations')
 
@@ -19,37 +24,43 @@ class UserList(Resource):
     """Manejo de usuarios."""
 
     @jwt_required()  # Solo usuarios autenticados pueden ver la lista
+    @api.doc(params={'limit': 'Page size (enables pagination)', 'cursor': 'Opaque cursor from a Link header'})
     def get(self):
         """Retrieve all users (sin contraseñas)."""
-        print("[DEBUG] Obteniendo lista de usuarios...")
-
-        users = facade.get_all_users()
-        if not users:
-            print("[DEBUG] No hay usuarios registrados.")
+        try:
+            page_args = get_page_args()
+            if page_args:
+                return page_response(facade.get_users_page(*page_args))
+        except ValueError as e:
+            return {"error": str(e)}, 400
+
+        logger.debug("Obteniendo lista de usuarios...")
+
+        response = json_array_response(facade.iter_users())
+        if not response:
+            logger.debug("No hay usuarios registrados.")
             return {"message": "No users found"}, 200
-
-        print(f"[DEBUG] {len(users)} usuarios encontrados.")
-        return users, 200
+        return response
 
     @api.expect(user_model)
     def post(self):
         """Registrar un nuevo usuario."""
         user_data = request.json
-        print(f"[DEBUG] Intentando registrar usuario con email: {user_data.get('email')}")
+        logger.debug("Intentando registrar usuario con email: %s", user_data.get('email'))
 
         if 'password' not in user_data:
-            print("[DEBUG] Error: La contraseña es obligatoria.")
+            logger.info("Error: La contraseña es obligatoria.")
             return {'error': 'Password is required'}, 400
 
         # Verificar si el email ya está registrado
         existing_user = facade.get_user_by_email(user_data['email'])
         if existing_user:
-            print("[DEBUG] Error: El email ya está registrado.")
+            logger.info("Error: El email ya está registrado.")
             return {'error': 'Email already registered'}, 400
 
         # Crear usuario
         response, status_code = facade.create_user(user_data)
-        print(f"[DEBUG] Usuario registrado con éxito: {response}")
+        logger.debug("Usuario registrado con éxito: %s", response)
 
         return response, status_code
 
@@ -62,18 +73,18 @@ class UserResource(Resource):
     def get(self, user_id):
         """Obtener información de un usuario por ID (solo el dueño puede acceder)."""
         current_user_id = get_jwt_identity()
-        print(f"[DEBUG] Intento de acceso a usuario {user_id} por usuario autenticado {current_user_id}")
+        logger.debug("Intento de acceso a usuario %s por usuario autenticado %s", user_id, current_user_id)
 
         if str(current_user_id) != user_id:
-            print("[DEBUG] Acceso denegado: No autorizado.")
+            logger.warning("Acceso denegado: No autorizado.")
             return {"error": "Unauthorized access"}, 403
 
         user = facade.get_user(user_id)
         if not user:
-            print("[DEBUG] Error: Usuario no encontrado.")
+            logger.info("Error: Usuario no encontrado.")
             return {"error": "User not found"}, 404
 
-        print(f"[DEBUG] Información del usuario encontrada: {user}")
+        logger.debug("Información del usuario encontrada: %s", user)
         return user, 200
 
     @jwt_required()
@@ -81,40 +92,40 @@ class UserResource(Resource):
     def put(self, user_id):
         """Actualizar un usuario (No se puede modificar email ni contraseña)."""
         current_user_id = get_jwt_identity()
-        print(f"[DEBUG] Usuario {current_user_id} intenta actualizar usuario {user_id}")
+        logger.debug("Usuario %s intenta actualizar usuario %s", current_user_id, user_id)
 
         if str(current_user_id) != user_id:
-            print("[DEBUG] Acceso denegado: No autorizado para actualizar.")
+            logger.warning("Acceso denegado: No autorizado para actualizar.")
             return {"error": "Unauthorized access"}, 403
 
         data = request.get_json()
         if 'email' in data or 'password' in data:
-            print("[DEBUG] Error: No se permite modificar email ni contraseña.")
+            logger.info("Error: No se permite modificar email ni contraseña.")
             return {"error": "You cannot modify email or password"}, 400
 
         updated_user = facade.update_user(user_id, data)
         if not updated_user:
-            print("[DEBUG] Error: Usuario no encontrado.")
+            logger.info("Error: Usuario no encontrado.")
             return {'error': 'User not found'}, 404
 
-        print(f"[DEBUG] Usuario actualizado correctamente: {updated_user}")
+        logger.debug("Usuario actualizado correctamente: %s", updated_user)
         return updated_user, 200
 
     @jwt_required()
     def delete(self, user_id):
         """Eliminar un usuario por ID (solo el dueño puede eliminar su cuenta)."""
         current_user_id = get_jwt_identity()
-        print(f"[DEBUG] Usuario {current_user_id} intenta eliminar usuario {user_id}")
+        logger.debug("Usuario %s intenta eliminar usuario %s", current_user_id, user_id)
 
         if str(current_user_id) != user_id:
-            print("[DEBUG] Acceso denegado: No autorizado para eliminar usuario.")
+            logger.warning("Acceso denegado: No autorizado para eliminar usuario.")
             return {"error": "Unauthorized access"}, 403
 
         user = facade.get_user(user_id)
         if not user:
-            print("[DEBUG] Error: Usuario no encontrado para eliminar.")
+            logger.info("Error: Usuario no encontrado para eliminar.")
             return {'error': 'User not found'}, 404
 
         facade.delete_user(user_id)
-        print(f"[DEBUG] Usuario {user_id} eliminado exitosamente.")
+        logger.info("Usuario %s eliminado exitosamente.", user_id)
         return {'message': 'User deleted successfully'}, 200
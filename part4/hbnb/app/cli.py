@@ -0,0 +1,83 @@
+import click
+from flask.cli import AppGroup
+
+# Comandos de mantenimiento: `flask hbnb <comando>`
+hbnb_cli = AppGroup('hbnb', help='Comandos de mantenimiento de HBnB.')
+
+
+@hbnb_cli.command('repair-ratings')
+def repair_ratings():
+    """Recalcula review_count, rating_sum y el histograma de cada lugar."""
+    from app.services.facade import facade
+    updated = facade.recompute_place_ratings()
+    click.echo(f"Agregados de rating recalculados para {updated} lugares con reviews.")
+
+
+@hbnb_cli.command('rebuild-search-index')
+def rebuild_search_index():
+    """Reconstruye el índice de texto completo de places desde la tabla places."""
+    from app.persistence import fulltext
+    from app.persistence.unit_of_work import unit_of_work
+    with unit_of_work() as session:
+        fulltext.rebuild(session)
+    click.echo("Índice de texto completo reconstruido.")
+
+
+@hbnb_cli.command('rebuild-documents')
+def rebuild_documents():
+    """Descarta los documentos JSON materializados de places y los vuelve a armar."""
+    from sqlalchemy import select
+    from app.models.place import Place
+    from app.persistence.unit_of_work import unit_of_work
+    from app.services import place_documents
+    with unit_of_work() as session:
+        place_documents.clear(session)
+        if place_documents.enabled():
+            built = place_documents.get_many(session.scalars(select(Place.id)).all(), session)
+            click.echo(f"{len(built)} documentos de lugares reconstruidos.")
+            return
+    click.echo("Documentos descartados (PLACE_DOCUMENTS está desactivado).")
+
+
+@hbnb_cli.command('import')
+@click.argument('kind', type=click.Choice(['users', 'amenities', 'places']))
+@click.argument('path', type=click.Path(exists=True, dir_okay=False))
+@click.option('--format', 'fmt', type=click.Choice(['csv', 'ndjson']), default=None,
+              help='Formato del archivo (por defecto, según la extensión).')
+@click.option('--chunk-size', type=click.IntRange(min=1), default=1000, show_default=True,
+              help='Registros por lote; cada lote se confirma en una transacción.')
+@click.option('--checkpoint', type=click.Path(dir_okay=False), default=None,
+              help='Archivo de checkpoint (por defecto, <archivo>.checkpoint).')
+@click.option('--source-key', 'source', default=None,
+              help='Clave del origen para los IDs de los lugares (por defecto, el hash del archivo).')
+def import_data(kind, path, fmt, chunk_size, checkpoint, source):
+    """Importa usuarios, amenities o lugares desde CSV o NDJSON, reanudable tras una caída."""
+    from app.services import importer
+    try:
+        summary = importer.import_file(kind, path, fmt=fmt, chunk_size=chunk_size,
+                                       checkpoint_path=checkpoint, source=source, echo=click.echo)
+    except ValueError as e:
+        raise click.ClickException(str(e))
+    click.echo(f"Importación terminada: {summary['created']} creados, {summary['skipped']} ya existían, "
+               f"{summary['errors']} con errores.")
+
+
+@hbnb_cli.command('generate')
+@click.option('--users', type=click.IntRange(min=1), default=1000, show_default=True)
+@click.option('--places', type=click.IntRange(min=0), default=5000, show_default=True)
+@click.option('--reviews', type=click.IntRange(min=0), default=50000, show_default=True)
+@click.option('--seed', type=int, default=0, show_default=True, help='La misma semilla genera los mismos datos.')
+@click.option('--chunk-size', type=click.IntRange(min=1), default=10000, show_default=True,
+              help='Filas por lote; cada lote se confirma en una transacción.')
+def generate_data(users, places, reviews, seed, chunk_size):
+    """Llena la base con datos sintéticos (pruebas de carga y de escala)."""
+    import time
+    from app.services import synthetic
+    started = time.perf_counter()
+    try:
+        summary = synthetic.generate(users, places, reviews, seed=seed, chunk_size=chunk_size, echo=click.echo)
+    except ValueError as e:
+        raise click.ClickException(str(e))
+    click.echo(f"Datos generados en {time.perf_counter() - started:.1f} s: {summary['users']} usuarios, "
+               f"{summary['places']} lugares, {summary['reviews']} reseñas "
+               f"(contraseña '{synthetic.DEFAULT_PASSWORD}').")
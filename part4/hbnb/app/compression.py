@@ -0,0 +1,134 @@
+import gzip
+import mimetypes
+import os
+import zlib
+from flask import current_app, request, send_from_directory
+from werkzeug.security import safe_join
+
+# Compresión de respuestas negociada con Accept-Encoding (br o gzip).
+#   - Respuestas normales: se comprimen enteras si superan
+#     COMPRESSION_MIN_SIZE y su tipo está en COMPRESSION_MIMETYPES.
+#   - Respuestas en streaming (p. ej. /export): se comprime cada trozo al
+#     pasar, con un flush por trozo, sin juntar el cuerpo en memoria.
+#   - Archivos estáticos: se sirven las versiones .br/.gz que deja
+#     `python -m scripts.precompress_static` (si son más nuevas que el
+#     original); nunca se comprimen al vuelo.
+# Brotli es opcional: sin el paquete brotli (o brotlicffi) solo hay gzip.
+try:
+    import brotli
+except ImportError:
+    try:
+        import brotlicffi as brotli
+    except ImportError:
+        brotli = None
+
+# Sufijo de los archivos precomprimidos por codificación
+SUFFIXES = {'br': '.br', 'gzip': '.gz'}
+
+
+def available_encodings():
+    """Codificaciones soportadas, en orden de preferencia del servidor."""
+    return ('br', 'gzip') if brotli is not None else ('gzip',)
+
+
+def negotiate():
+    """La codificación a usar según Accept-Encoding (respeta q=0), o None."""
+    accepted = request.accept_encodings
+    best = None
+    for encoding in available_encodings():
+        quality = accepted[encoding]
+        if quality and (best is None or quality > best[1]):
+            best = (encoding, quality)
+    return best[0] if best else None
+
+
+def compress(data, encoding, config):
+    """Comprime `data` (bytes) entero."""
+    if encoding == 'br':
+        return brotli.compress(data, quality=config['COMPRESSION_BROTLI_QUALITY'])
+    return gzip.compress(data, compresslevel=config['COMPRESSION_GZIP_LEVEL'], mtime=0)
+
+
+def compress_stream(chunks, encoding, config):
+    """Generador que comprime un cuerpo en streaming trozo a trozo."""
+    if encoding == 'br':
+        compressor = brotli.Compressor(quality=config['COMPRESSION_BROTLI_QUALITY'])
+
+        def compress_chunk(data):
+            return compressor.process(data) + compressor.flush()
+        finish = compressor.finish
+    else:
+        compressor = zlib.compressobj(config['COMPRESSION_GZIP_LEVEL'], zlib.DEFLATED, 31)  # 31: formato gzip
+
+        def compress_chunk(data):
+            return compressor.compress(data) + compressor.flush(zlib.Z_SYNC_FLUSH)
+        finish = compressor.flush
+    try:
+        for chunk in chunks:
+            if isinstance(chunk, str):
+                chunk = chunk.encode()
+            if chunk:
+                yield compress_chunk(chunk)
+        yield finish()
+    finally:
+        if hasattr(chunks, 'close'):
+            chunks.close()
+
+
+def compress_response(response):
+    """after_request: comprime la respuesta si el cliente lo acepta y vale la pena."""
+    config = current_app.config
+    if (not config.get('COMPRESSION_ENABLED') or response.direct_passthrough
+            or response.status_code < 200 or response.status_code in (204, 304)
+            or 'Content-Encoding' in response.headers
+            or response.mimetype not in config['COMPRESSION_MIMETYPES']):
+        return response
+    if not response.is_streamed and len(response.get_data()) < config['COMPRESSION_MIN_SIZE']:
+        return response
+
+    response.vary.add('Accept-Encoding')
+    encoding = negotiate()
+    if encoding is None:
+        return response
+
+    if response.is_streamed:
+        response.response = compress_stream(response.response, encoding, config)
+        response.headers.pop('Content-Length', None)
+    else:
+        response.set_data(compress(response.get_data(), encoding, config))
+    response.headers['Content-Encoding'] = encoding
+    # Los bytes ya no son los del ETag fuerte: queda como débil (If-None-Match
+    # compara en forma débil, así que la revalidación sigue funcionando)
+    etag, weak = response.get_etag()
+    if etag and not weak:
+        response.set_etag(etag, weak=True)
+    return response
+
+
+def init_app(app):
+    """Registra la compresión de respuestas y los estáticos precomprimidos."""
+    app.after_request(compress_response)
+
+    serve_static = app.view_functions.get('static')
+    if serve_static is None:
+        return
+
+    def static(filename):
+        """Sirve `filename.br`/`.gz` si existe, está al día y el cliente lo acepta."""
+        encoding = negotiate()
+        source = safe_join(app.static_folder, filename)
+        if source is None or not os.path.isfile(source):
+            return serve_static(filename=filename)
+        variants = [e for e in available_encodings() if os.path.isfile(source + SUFFIXES[e])]
+        if encoding in variants and os.path.getmtime(source + SUFFIXES[encoding]) >= os.path.getmtime(source):
+            response = send_from_directory(app.static_folder, filename + SUFFIXES[encoding],
+                                           mimetype=mimetypes.guess_type(filename)[0],
+                                           max_age=app.get_send_file_max_age(filename))
+            response.headers['Content-Encoding'] = encoding
+        else:
+            response = serve_static(filename=filename)
+        if variants:
+            response.vary.add('Accept-Encoding')
+        return response
+
+    app.view_functions['static'] = static
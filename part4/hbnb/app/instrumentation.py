@@ -0,0 +1,130 @@
+import logging
+import time
+from contextlib import contextmanager
+from flask import g, has_request_context, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Mapper
+
+# Instrumentación por petición: eventos del engine y del ORM de SQLAlchemy
+# suman, para la petición en curso (flask.g), cuántas sentencias corrieron,
+# su tiempo total, cuántas entidades cargó el ORM y el tiempo de codificar el
+# JSON de la respuesta. Las entidades no son filas leídas: una fila con
+# carga joined trae varias y las filas de Core (COUNT, agregados, EXISTS)
+# no suman ninguna; el DB-API no informa las filas de un SELECT (rowcount
+# es -1 en SQLite). Al final de la petición se informan:
+#   - en el header Server-Timing (SERVER_TIMING), p. ej.
+#       db;dur=3.2, db-queries;desc="4", db-entities;desc="57", serialize;dur=1.1, app;dur=8.5
+#   - en una línea del logger 'app.sql' (INFO), con la lista de sentencias y
+#     su duración si SQL_DEBUG está activo
+# Lo que pasa después de enviar los headers (el cuerpo de una respuesta en
+# streaming) no entra en el header ni en el log.
+logger = logging.getLogger('app.sql')
+
+_STARTED_KEY = 'instrumentation_started'
+
+
+class RequestStats:
+    """Contadores de una petición."""
+
+    def __init__(self, keep_statements=False):
+        self.started = time.perf_counter()
+        self.queries = 0
+        self.db_seconds = 0.0
+        self.entities = 0
+        self.serialize_seconds = 0.0
+        self.statements = [] if keep_statements else None
+
+    def add_query(self, statement, seconds):
+        self.queries += 1
+        self.db_seconds += seconds
+        if self.statements is not None:
+            self.statements.append((statement, seconds))
+
+    def server_timing(self, total_seconds):
+        """Valor del header Server-Timing (duraciones en ms)."""
+        return (f'db;dur={self.db_seconds * 1000:.2f}, db-queries;desc="{self.queries}", '
+                f'db-entities;desc="{self.entities}", serialize;dur={self.serialize_seconds * 1000:.2f}, '
+                f'app;dur={total_seconds * 1000:.2f}')
+
+    def fields(self, total_seconds):
+        """Campos de la línea de log."""
+        fields = {'queries': self.queries, 'db_ms': round(self.db_seconds * 1000, 2),
+                  'entities': self.entities, 'serialize_ms': round(self.serialize_seconds * 1000, 2),
+                  'total_ms': round(total_seconds * 1000, 2)}
+        if self.statements is not None:
+            fields['statements'] = [{'sql': statement, 'ms': round(seconds * 1000, 3)}
+                                    for statement, seconds in self.statements]
+        return fields
+
+
+def current():
+    """Contadores de la petición en curso, o None (fuera de una petición o sin init_app)."""
+    return g.get('request_stats') if has_request_context() else None
+
+
+@contextmanager
+def serializing():
+    """Suma a la petición en curso el tiempo del bloque como tiempo de serialización."""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        stats = current()
+        if stats is not None:
+            stats.serialize_seconds += time.perf_counter() - started
+
+
+# Los eventos se registran una vez para todos los engines y mappers; sin
+# petición en curso solo cuestan la consulta a current()
+@event.listens_for(Engine, 'before_cursor_execute')
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault(_STARTED_KEY, []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, 'after_cursor_execute')
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    seconds = time.perf_counter() - conn.info[_STARTED_KEY].pop()
+    stats = current()
+    if stats is not None:
+        stats.add_query(statement, seconds)
+
+
+@event.listens_for(Engine, 'handle_error')
+def _handle_error(context):
+    # La sentencia falló: after_cursor_execute no corre
+    started = context.connection.info.get(_STARTED_KEY) if context.connection is not None else None
+    if started:
+        started.pop()
+
+
+@event.listens_for(Mapper, 'load')
+def _load(target, context):
+    stats = current()
+    if stats is not None:
+        stats.entities += 1
+
+
+def init_app(app):
+    """
+    Abre los contadores al empezar cada petición y los informa al final.
+    Se registra antes que los demás hooks para que cuente también sus
+    consultas (p. ej. el commit de la unidad de trabajo).
+    """
+
+    @app.before_request
+    def start_request_stats():
+        g.request_stats = RequestStats(keep_statements=app.config['SQL_DEBUG'])
+
+    @app.after_request
+    def report_request_stats(response):
+        stats = current()
+        if stats is None:
+            return response
+        total = time.perf_counter() - stats.started
+        if app.config['SERVER_TIMING']:
+            response.headers.add('Server-Timing', stats.server_timing(total))
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("%s %s: %s consultas en %.2f ms", request.method, request.path, stats.queries,
+                        stats.db_seconds * 1000, extra={'fields': stats.fields(total)})
+        return response
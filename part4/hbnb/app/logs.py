@@ -0,0 +1,194 @@
+import atexit
+import json
+import logging
+import logging.handlers
+import queue
+import random
+import sys
+import time
+from datetime import datetime, timezone
+from flask import g, has_request_context, request
+from app.services import json_codec
+
+# Logging estructurado de la aplicación. Cada módulo usa su propio logger
+# (logging.getLogger(__name__), bajo el logger raíz 'app') y registra con
+# argumentos diferidos (logger.debug("... %s", valor)): si el nivel está
+# apagado, logging descarta la llamada antes de armar el mensaje, así que un
+# nivel deshabilitado no cuesta formateo ni serialización.
+#   LOG_LEVEL        nivel del logger raíz 'app'
+#   LOG_LEVELS       niveles por módulo, p. ej. {'app.services.facade': 'DEBUG'}
+#   LOG_FORMAT       'json' (una línea JSON por registro) o 'text'
+#   LOG_ASYNC        escribe desde un hilo aparte (QueueHandler + QueueListener):
+#                    la petición solo encola el registro
+#   LOG_SAMPLE_RATE  fracción de peticiones cuyos registros DEBUG/INFO se
+#                    escriben (WARNING o más se escriben siempre)
+#   LOG_BODIES       agrega al log de acceso en DEBUG una muestra de los
+#                    cuerpos de petición y respuesta, de hasta LOG_BODY_MAX bytes
+# El log de acceso (logger 'app.http') escribe una línea INFO por petición y,
+# en DEBUG, los headers y (con LOG_BODIES) los cuerpos, sin credenciales ni
+# contraseñas.
+ROOT = 'app'
+access_log = logging.getLogger('app.http')
+
+# Headers y campos de los cuerpos JSON que nunca se registran
+REDACTED_HEADERS = {'authorization', 'cookie', 'set-cookie'}
+REDACTED_FIELDS = {'password', 'access_token'}
+
+_listener = None
+
+
+class JsonFormatter(logging.Formatter):
+    """Una línea JSON por registro, con los campos de `extra={'fields': {...}}`."""
+
+    def format(self, record):
+        data = {
+            'ts': datetime.fromtimestamp(record.created, timezone.utc),
+            'level': record.levelname,
+            'logger': record.name,
+            'msg': record.getMessage(),
+        }
+        data.update(getattr(record, 'fields', None) or {})
+        if record.exc_info:
+            data['exc'] = self.formatException(record.exc_info)
+        return json_codec.dumps(data).decode()
+
+
+class TextFormatter(logging.Formatter):
+    """Formato legible para desarrollo: los campos van al final como clave=valor."""
+
+    def __init__(self):
+        super().__init__('%(asctime)s %(levelname)s %(name)s: %(message)s')
+
+    def format(self, record):
+        line = super().format(record)
+        fields = getattr(record, 'fields', None)
+        if fields:
+            line += ' ' + ' '.join(f'{key}={value}' for key, value in fields.items())
+        return line
+
+
+class RequestSampler(logging.Filter):
+    """Deja pasar WARNING o más siempre; DEBUG/INFO solo en las peticiones muestreadas."""
+
+    def filter(self, record):
+        if record.levelno >= logging.WARNING or not has_request_context():
+            return True
+        return g.get('log_sampled', True)
+
+
+def configure(config, stream=None):
+    """
+    (Re)configura el logger raíz 'app' según `config`. Reemplaza los
+    handlers anteriores y detiene el hilo escritor previo, así que se puede
+    llamar más de una vez (una por create_app).
+    """
+    global _listener
+    root = logging.getLogger(ROOT)
+    stop()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+
+    handler = logging.StreamHandler(stream or sys.stderr)
+    handler.setFormatter(JsonFormatter() if config['LOG_FORMAT'] == 'json' else TextFormatter())
+    if config['LOG_ASYNC']:
+        records = queue.SimpleQueue()
+        _listener = logging.handlers.QueueListener(records, handler)
+        _listener.start()
+        handler = logging.handlers.QueueHandler(records)
+    # El muestreo corre en el hilo de la petición (necesita `g`), antes de encolar
+    handler.addFilter(RequestSampler())
+
+    root.addHandler(handler)
+    root.setLevel(config['LOG_LEVEL'])
+    root.propagate = False
+    for name, level in config['LOG_LEVELS'].items():
+        logging.getLogger(name).setLevel(level)
+
+
+def stop():
+    """Vacía la cola y detiene el hilo escritor (si hay uno)."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+atexit.register(stop)
+
+
+def redacted_headers():
+    """Headers de la petición actual, sin credenciales."""
+    return {key: '[redacted]' if key.lower() in REDACTED_HEADERS else value
+            for key, value in request.headers.items()}
+
+
+def redacted_body(data, is_json):
+    """Cuerpo como texto, con los campos de REDACTED_FIELDS ocultos si es JSON."""
+    if not is_json:
+        return data.decode(errors='replace')
+
+    def redact(value):
+        if isinstance(value, dict):
+            return {key: '[redacted]' if key in REDACTED_FIELDS else redact(item) for key, item in value.items()}
+        if isinstance(value, list):
+            return [redact(item) for item in value]
+        return value
+    try:
+        return redact(json.loads(data))
+    except ValueError:
+        return data.decode(errors='replace')
+
+
+def body_sample(data, is_json, limit):
+    """
+    Muestra acotada de un cuerpo para el log. Un JSON que entra en `limit`
+    bytes se registra con REDACTED_FIELDS ocultos; uno más largo no se puede
+    redactar sin leerlo entero, así que solo se registra su tamaño. Otros
+    tipos se cortan en `limit` bytes.
+    """
+    if len(data) <= limit:
+        return redacted_body(data, is_json)
+    if is_json:
+        return f'[{len(data)} bytes]'
+    return data[:limit].decode(errors='replace') + '…'
+
+
+def init_app(app):
+    """Configura el logging y registra el log de acceso de cada petición."""
+    configure(app.config)
+
+    def capture_bodies():
+        # Opt-in: solo con LOG_BODIES, en DEBUG y en las peticiones muestreadas
+        return app.config['LOG_BODIES'] and g.log_sampled and access_log.isEnabledFor(logging.DEBUG)
+
+    @app.before_request
+    def log_request_info():
+        rate = app.config['LOG_SAMPLE_RATE']
+        g.log_sampled = rate >= 1 or random.random() < rate
+        g.log_started = time.perf_counter()
+        if g.log_sampled and access_log.isEnabledFor(logging.DEBUG):
+            fields = {'headers': redacted_headers()}
+            if capture_bodies():
+                limit = app.config['LOG_BODY_MAX']
+                # Un cuerpo más grande que el límite no se lee (quedaría entero en memoria)
+                if request.content_length is not None and request.content_length > limit:
+                    fields['body'] = f'[{request.content_length} bytes]'
+                else:
+                    fields['body'] = body_sample(request.get_data(), request.is_json, limit)
+            access_log.debug("Petición %s %s", request.method, request.path, extra={'fields': fields})
+
+    @app.after_request
+    def log_response_info(response):
+        if access_log.isEnabledFor(logging.INFO):
+            fields = {'method': request.method, 'path': request.path, 'status': response.status_code}
+            if 'log_started' in g:
+                fields['duration_ms'] = round((time.perf_counter() - g.log_started) * 1000, 2)
+            if 'log_sampled' in g and capture_bodies():
+                # Las respuestas en streaming no se leen: se consumirían y quedarían en memoria
+                if response.direct_passthrough or response.is_streamed:
+                    fields['body'] = '[streamed]'
+                else:
+                    fields['body'] = body_sample(response.get_data(), response.is_json, app.config['LOG_BODY_MAX'])
+            access_log.info("%s %s %s", request.method, request.path, response.status_code,
+                            extra={'fields': fields})
+        return response
@@ -0,0 +1,331 @@
+import atexit
+import glob
+import json
+import logging
+import mmap
+import os
+import shutil
+import struct
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from flask import Response, g, request
+from app import db
+
+# Métricas en formato de texto de Prometheus en GET /metrics, sumadas entre
+# todos los procesos (workers pre-forked de gunicorn/uwsgi). Cada proceso
+# escribe sus valores en su propio archivo mapeado en memoria
+# (METRICS_DIR/metrics-<pid>.db): las escrituras son sumas sobre un float
+# en su lugar, sin locks entre procesos ni llamadas al sistema. Al pedir
+# /metrics, el worker que atiende lee los archivos de todos y los suma, así
+# que ninguna lectura ve solo la parte de un worker.
+#   - Contadores e histogramas: se suman todos los archivos, también los de
+#     procesos que ya terminaron (un contador nunca baja).
+#   - Gauges (estado del pool de conexiones): solo los de procesos vivos.
+# Con varios workers, METRICS_DIR debe ser el mismo para todos y vaciarse al
+# arrancar el servidor (como PROMETHEUS_MULTIPROC_DIR de prometheus_client).
+# Sin METRICS_DIR solo se puede en pruebas o desarrollo (un proceso): la
+# aplicación usa un directorio temporal propio, que borra al salir solo el
+# proceso que lo creó (no un worker hijo). Una escritura que falla se
+# registra en el log y nunca hace fallar la petición.
+logger = logging.getLogger(__name__)
+
+# name -> (tipo, ayuda)
+METRICS = {
+    'hbnb_http_requests_total': ('counter', 'HTTP requests by route, method and status.'),
+    'hbnb_http_request_duration_seconds': ('histogram', 'HTTP request latency by route and method.'),
+    'hbnb_db_pool_connections': ('gauge', 'Database pool connections by state, summed over live workers.'),
+    'hbnb_cache_operations_total': ('counter', 'Read-through cache operations by kind.'),
+    'hbnb_cache_hit_ratio': ('gauge', 'Cache hits / (hits + misses) over all workers.'),
+}
+GAUGES = {name for name, (kind, _) in METRICS.items() if kind == 'gauge'}
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+_store = None
+
+
+class MmapedDict:
+    """
+    Diccionario str -> float sobre un archivo mapeado en memoria, escrito
+    por un solo proceso. Formato: 4 bytes con los bytes usados, 4 de
+    relleno y luego entradas (largo de la clave, clave alineada a 8 bytes,
+    float64). Una entrada nueva se escribe entera antes de actualizar los
+    bytes usados, así que un lector nunca ve una entrada a medias.
+    """
+
+    INITIAL_SIZE = 1 << 16
+
+    def __init__(self, path):
+        self._file = open(path, 'a+b')
+        size = os.fstat(self._file.fileno()).st_size
+        if size == 0:
+            self._file.truncate(self.INITIAL_SIZE)
+            size = self.INITIAL_SIZE
+        self._capacity = size
+        self._map = mmap.mmap(self._file.fileno(), self._capacity)
+        self._positions = {}
+        self._used = struct.unpack_from('i', self._map, 0)[0]
+        if self._used == 0:
+            self._used = 8
+            struct.pack_into('i', self._map, 0, self._used)
+        for key, _, position in _entries(self._map, self._used):
+            self._positions[key] = position
+
+    def _position(self, key):
+        position = self._positions.get(key)
+        if position is None:
+            encoded = key.encode('utf-8')
+            padded = encoded + b' ' * (8 - (len(encoded) + 4) % 8)
+            entry = struct.pack(f'i{len(padded)}sd', len(encoded), padded, 0.0)
+            if self._used + len(entry) > self._capacity:
+                while self._used + len(entry) > self._capacity:
+                    self._capacity *= 2
+                self._map.close()
+                self._file.truncate(self._capacity)
+                self._map = mmap.mmap(self._file.fileno(), self._capacity)
+            self._map[self._used:self._used + len(entry)] = entry
+            position = self._used + 4 + len(padded)
+            self._used += len(entry)
+            struct.pack_into('i', self._map, 0, self._used)
+            self._positions[key] = position
+        return position
+
+    def add(self, key, amount):
+        position = self._position(key)
+        struct.pack_into('d', self._map, position, struct.unpack_from('d', self._map, position)[0] + amount)
+
+    def set(self, key, value):
+        struct.pack_into('d', self._map, self._position(key), value)
+
+    def close(self):
+        self._map.close()
+        self._file.close()
+
+
+def _entries(data, used):
+    """(clave, valor, posición del valor) de cada entrada de un MmapedDict."""
+    position = 8
+    while position < used:
+        length = struct.unpack_from('i', data, position)[0]
+        key_end = position + 4 + length
+        value_at = position + 4 + length + (8 - (length + 4) % 8)
+        yield data[position + 4:key_end].decode('utf-8'), struct.unpack_from('d', data, value_at)[0], value_at
+        position = value_at + 8
+
+
+def read_file(path):
+    """{clave: valor} de un archivo de métricas (de cualquier proceso)."""
+    with open(path, 'rb') as f:
+        data = f.read()
+    if len(data) < 8:
+        return {}
+    return {key: value for key, value, _ in _entries(data, struct.unpack_from('i', data, 0)[0])}
+
+
+def _alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class MetricsStore:
+    """Valores de métricas de este proceso en METRICS_DIR y su suma entre procesos."""
+
+    def __init__(self, directory, buckets):
+        self.directory = directory
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        self._pid = None
+        self._values = None
+
+    def _file(self):
+        # Un proceso hijo (fork) no escribe en el archivo del padre
+        pid = os.getpid()
+        if self._pid != pid:
+            os.makedirs(self.directory, exist_ok=True)
+            self._values = MmapedDict(os.path.join(self.directory, f'metrics-{pid}.db'))
+            self._pid = pid
+        return self._values
+
+    @contextmanager
+    def _writing(self):
+        """Escritura en el archivo de este proceso; si falla, se registra y se reabre en la próxima."""
+        with self._lock:
+            try:
+                yield self._file()
+            except Exception:
+                logger.warning("No se pudo escribir una métrica en %s", self.directory, exc_info=True)
+                self._discard()
+
+    def _discard(self):
+        if self._values is not None and self._pid == os.getpid():
+            try:
+                self._values.close()
+            except (OSError, ValueError):
+                pass
+        self._pid = self._values = None
+
+    @staticmethod
+    def key(name, labels):
+        return json.dumps([name, sorted(labels.items())], separators=(',', ':'))
+
+    def inc(self, name, labels, amount=1.0):
+        with self._writing() as values:
+            values.add(self.key(name, labels), amount)
+
+    def set(self, name, labels, value):
+        with self._writing() as values:
+            values.set(self.key(name, labels), value)
+
+    def observe(self, name, labels, value):
+        """Suma una observación al histograma `name` (buckets acumulados)."""
+        with self._writing() as values:
+            for bound in self.buckets:
+                if value <= bound:
+                    values.add(self.key(f'{name}_bucket', {**labels, 'le': _format(bound)}), 1)
+            values.add(self.key(f'{name}_bucket', {**labels, 'le': '+Inf'}), 1)
+            values.add(self.key(f'{name}_sum', labels), value)
+            values.add(self.key(f'{name}_count', labels), 1)
+
+    def close(self):
+        """Cierra el archivo de este proceso (se vuelve a abrir si se escribe de nuevo)."""
+        with self._lock:
+            self._discard()
+
+    def collect(self):
+        """{(muestra, labels ordenados): valor} sumado entre todos los procesos."""
+        totals = {}
+        for path in glob.glob(os.path.join(self.directory, 'metrics-*.db')):
+            pid = int(os.path.basename(path)[len('metrics-'):-len('.db')])
+            alive = None
+            try:
+                values = read_file(path)
+            except FileNotFoundError:  # Borrado mientras se leía el directorio
+                continue
+            for key, value in values.items():
+                name, labels = json.loads(key)
+                if name in GAUGES:
+                    if alive is None:
+                        alive = _alive(pid)
+                    if not alive:
+                        continue
+                sample = (name, tuple(tuple(label) for label in labels))
+                totals[sample] = totals.get(sample, 0.0) + value
+        return totals
+
+
+def _format(value):
+    if value == int(value):
+        return f'{value:.1f}'
+    return repr(value)
+
+
+def _base_name(sample):
+    for suffix in ('_bucket', '_sum', '_count'):
+        if sample.endswith(suffix) and sample[:-len(suffix)] in METRICS:
+            return sample[:-len(suffix)]
+    return sample
+
+
+def render(totals):
+    """Texto de Prometheus (formato 0.0.4) de las muestras sumadas."""
+    hits = totals.get(('hbnb_cache_operations_total', (('op', 'hits'),)), 0.0)
+    misses = totals.get(('hbnb_cache_operations_total', (('op', 'misses'),)), 0.0)
+    if hits + misses:
+        totals = {**totals, ('hbnb_cache_hit_ratio', ()): hits / (hits + misses)}
+
+    by_metric = {}
+    for (sample, labels), value in totals.items():
+        by_metric.setdefault(_base_name(sample), []).append((sample, labels, value))
+
+    def order(item):
+        sample, labels, _ = item
+        # Buckets en orden numérico de `le`, después _sum y _count
+        labels = dict(labels)
+        le = labels.pop('le', None)
+        bound = float('inf') if le == '+Inf' else float(le) if le is not None else 0.0
+        return sorted(labels.items()), sample, bound
+
+    lines = []
+    for name in sorted(by_metric):
+        kind, help_text = METRICS.get(name, ('untyped', ''))
+        lines.append(f'# HELP {name} {help_text}')
+        lines.append(f'# TYPE {name} {kind}')
+        for sample, labels, value in sorted(by_metric[name], key=order):
+            # `le` va al final, como lo escribe prometheus_client
+            labels = sorted(labels, key=lambda label: label[0] == 'le')
+            label_text = ','.join(f'{key}="{_escape(value_)}"' for key, value_ in labels)
+            lines.append(f'{sample}{{{label_text}}} {value!r}' if labels else f'{sample} {value!r}')
+    return '\n'.join(lines) + '\n'
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def inc(name, labels, amount=1.0):
+    """Suma a un contador del store actual (no hace nada sin init_app)."""
+    if _store is not None:
+        _store.inc(name, labels, amount)
+
+
+def record_pool(engine):
+    """Guarda el estado del pool de conexiones de `engine` (pools con tamaño fijo, p. ej. QueuePool)."""
+    pool = engine.pool
+    if _store is None or not hasattr(pool, 'checkedout'):
+        return
+    for state, value in (('size', pool.size()), ('checked_out', pool.checkedout()),
+                         ('checked_in', pool.checkedin()), ('overflow', max(pool.overflow(), 0))):
+        _store.set('hbnb_db_pool_connections', {'state': state}, value)
+
+
+def _remove_directory(directory, owner_pid):
+    """Borra el directorio temporal al salir, solo desde el proceso que lo creó (los hijos heredan el atexit)."""
+    if os.getpid() == owner_pid:
+        shutil.rmtree(directory, True)
+
+
+def init_app(app):
+    """Crea el store de la aplicación, mide cada petición y registra GET /metrics."""
+    global _store
+    # Una aplicación nueva en el mismo proceso (p. ej. en las pruebas) reemplaza el store anterior
+    if _store is not None:
+        _store.close()
+        _store = None
+    if not app.config['METRICS_ENABLED']:
+        return
+    directory = app.config['METRICS_DIR']
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    elif app.testing or app.debug:
+        directory = tempfile.mkdtemp(prefix='hbnb-metrics-')
+        atexit.register(_remove_directory, directory, os.getpid())
+    else:
+        # Cada worker tendría su propio directorio y /metrics mostraría solo una parte
+        raise ValueError("METRICS_DIR es obligatorio con METRICS_ENABLED fuera de pruebas y desarrollo")
+    _store = store = MetricsStore(directory, app.config['METRICS_BUCKETS'])
+    app.extensions['hbnb_metrics'] = store
+
+    @app.before_request
+    def start_metrics_timer():
+        g.metrics_started = time.perf_counter()
+
+    @app.after_request
+    def record_request_metrics(response):
+        if 'metrics_started' not in g:
+            return response
+        route = request.url_rule.rule if request.url_rule is not None else '<unmatched>'
+        labels = {'method': request.method, 'route': route}
+        store.observe('hbnb_http_request_duration_seconds', labels, time.perf_counter() - g.metrics_started)
+        store.inc('hbnb_http_requests_total', {**labels, 'status': str(response.status_code)})
+        record_pool(db.engine)
+        return response
+
+    @app.route('/metrics')
+    def metrics():
+        return Response(render(store.collect()), content_type=CONTENT_TYPE)
@@ -12,7 +12,8 @@ class Amenity(BaseModel, db.Model):
         super().__init__()
         self.name = self.validate_string(name, 50)
 
-    def validate_string(self, value, max_length):
+    @staticmethod
+    def validate_string(value, max_length):
         if not isinstance(value, str) or len(value) > max_length:
             raise ValueError(f"Máximo {max_length} caracteres permitidos")
         return value.strip()
@@ -22,3 +23,7 @@ class Amenity(BaseModel, db.Model):
         base = super().to_dict()
         base.update({'name': self.name})
         return base
+
+
+# Índice para la paginación por clave (created_at, id)
+db.Index('ix_amenities_created_at_id', Amenity.created_at, Amenity.id)
@@ -10,10 +10,10 @@ class BaseModel(db.Model):
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     def save(self):
-        """Actualiza el atributo 'updated_at' y guarda el objeto en la base de datos."""
+        """Actualiza 'updated_at' y envía el objeto a la base (flush; el commit lo hace la unidad de trabajo)."""
         self.updated_at = datetime.now()
         db.session.add(self)
-        db.session.commit()
+        db.session.flush()
 
     def update(self, data):
         """Actualiza los atributos del objeto con los datos proporcionados."""
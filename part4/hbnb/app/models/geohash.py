@@ -0,0 +1,125 @@
+import math
+
+# Alfabeto base32 de geohash (sin a, i, l, o)
+BASE32 = '0123456789bcdefghjkmnpqrstuvwxyz'
+# Precisión almacenada en places.geohash (~4.8m x 4.8m por celda)
+PRECISION = 9
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_DEG_LAT = 110.574
+KM_PER_DEG_LON = 111.320  # En el ecuador
+# Máximo de celdas (rangos del índice) con que se cubre un círculo
+MAX_COVER_CELLS = 16
+# Radio máximo para el que se usa el descarte equirectangular (planar_scale)
+PLANAR_MAX_RADIUS_KM = 500.0
+
+
+def encode(latitude, longitude, precision=PRECISION):
+    """Codifica una coordenada como geohash de `precision` caracteres (hasta 12)."""
+    bits = precision * 5
+    lon_bits, lat_bits = (bits + 1) // 2, bits // 2
+    lat_cell = _cell_index(latitude, -90.0, 180.0, lat_bits)
+    lon_cell = _cell_index(longitude, -180.0, 360.0, lon_bits)
+    # Intercalado de bits (el primero es de longitud): el último bit es de
+    # longitud si el total es impar y de latitud si es par
+    if bits % 2:
+        code = _spread_bits(lon_cell) | (_spread_bits(lat_cell) << 1)
+    else:
+        code = _spread_bits(lat_cell) | (_spread_bits(lon_cell) << 1)
+    return ''.join(BASE32[(code >> shift) & 31] for shift in range(bits - 5, -1, -5))
+
+
+def _cell_index(value, low, span, bits):
+    """
+    Índice de la celda de `bits` bits que contiene `value`, igual al que da
+    la bisección del geohash: los bordes low + span * i / 2**bits son
+    exactos en float, así que se corrige el redondeo de la división.
+    """
+    cells = 1 << bits
+    index = min(max(int((value - low) / span * cells), 0), cells - 1)
+    if index > 0 and value < low + span * index / cells:
+        index -= 1
+    elif index < cells - 1 and value >= low + span * (index + 1) / cells:
+        index += 1
+    return index
+
+
+def _spread_bits(value):
+    """Separa los bits de un entero de hasta 32 bits intercalando ceros (código Morton)."""
+    value = (value | (value << 16)) & 0x0000FFFF0000FFFF
+    value = (value | (value << 8)) & 0x00FF00FF00FF00FF
+    value = (value | (value << 4)) & 0x0F0F0F0F0F0F0F0F
+    value = (value | (value << 2)) & 0x3333333333333333
+    value = (value | (value << 1)) & 0x5555555555555555
+    return value
+
+
+def cell_size_deg(precision):
+    """Devuelve (alto, ancho) en grados de una celda de `precision` caracteres."""
+    lon_bits = math.ceil(precision * 5 / 2)
+    lat_bits = math.floor(precision * 5 / 2)
+    return 180.0 / (1 << lat_bits), 360.0 / (1 << lon_bits)
+
+
+def bounding_box(latitude, longitude, radius_km):
+    """
+    Devuelve (min_lat, max_lat, min_lon, max_lon) del círculo de
+    `radius_km`. Las longitudes pueden salirse de [-180, 180] si el
+    círculo cruza el antimeridiano; cerca de los polos cubre todas.
+    """
+    dlat = radius_km / KM_PER_DEG_LAT
+    min_lat, max_lat = max(latitude - dlat, -90.0), min(latitude + dlat, 90.0)
+    # Las celdas se estrechan hacia los polos: se usa la latitud más extrema del círculo
+    farthest_lat = max(abs(min_lat), abs(max_lat))
+    km_per_deg_lon = KM_PER_DEG_LON * math.cos(math.radians(farthest_lat))
+    if km_per_deg_lon <= 0 or radius_km / km_per_deg_lon >= 180.0:
+        return min_lat, max_lat, -180.0, 180.0
+    dlon = radius_km / km_per_deg_lon
+    return min_lat, max_lat, longitude - dlon, longitude + dlon
+
+
+def covering_cells(latitude, longitude, radius_km, max_cells=MAX_COVER_CELLS):
+    """
+    Devuelve los prefijos de geohash que cubren la caja del círculo de
+    `radius_km` alrededor del punto, usando la precisión más fina que no
+    pase de `max_cells` celdas. Devuelve [] si ni con celdas de un
+    carácter alcanza (hay que recorrer toda la tabla).
+    """
+    min_lat, max_lat, min_lon, max_lon = bounding_box(latitude, longitude, radius_km)
+    for precision in range(PRECISION, 0, -1):
+        height, width = cell_size_deg(precision)
+        lat_start = math.floor((min_lat + 90.0) / height) * height - 90.0
+        lon_start = math.floor((min_lon + 180.0) / width) * width - 180.0
+        rows = math.ceil((max_lat - lat_start) / height) or 1
+        cols = math.ceil((max_lon - lon_start) / width) or 1
+        if rows * cols > max_cells:
+            continue
+        cells = set()
+        for row in range(rows):
+            # Centro de cada celda para no caer justo en un borde
+            lat = min(lat_start + (row + 0.5) * height, 90.0)
+            for col in range(cols):
+                # Las celdas al otro lado del antimeridiano dan la vuelta
+                lon = (lon_start + (col + 0.5) * width + 180.0) % 360.0 - 180.0
+                cells.add(encode(lat, lon, precision))
+        return sorted(cells)
+    return []
+
+
+def planar_scale(latitude, radius_km):
+    """
+    Devuelve (km por grado de latitud, km por grado de longitud) para una
+    distancia equirectangular que nunca sobreestima la real dentro del
+    círculo: usa el coseno de la latitud más extrema, y un margen del 1%.
+    Sirve para descartar candidatos en SQL sin funciones trigonométricas.
+    """
+    farthest_lat = min(abs(latitude) + radius_km / KM_PER_DEG_LAT, 90.0)
+    return KM_PER_DEG_LAT * 0.99, KM_PER_DEG_LON * math.cos(math.radians(farthest_lat)) * 0.99
+
+
+def haversine_km(lat1, lon1, lat2, lon2):
+    """Distancia en km entre dos coordenadas sobre la esfera terrestre."""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    dphi = phi2 - phi1
+    dlambda = math.radians(lon2 - lon1)
+    a = math.sin(dphi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(dlambda / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
@@ -1,13 +1,18 @@
+import logging
 from app import db
 from app.models.base_model import BaseModel
 from app.models.user import User
 from app.models.amenity import Amenity
 from app.models.review import Review
+from app.models import geohash
+from app.persistence import amenity_catalog, fulltext
+
+logger = logging.getLogger(__name__)
 
 # Tabla intermedia para la relación muchos-a-muchos Place <-> Amenity
 place_amenity = db.Table('place_amenity',
     db.Column('place_id', db.String(60), db.ForeignKey('places.id'), primary_key=True),
-    db.Column('amenity_id', db.String(60), db.ForeignKey('amenities.id'), primary_key=True)
+    db.Column('amenity_id', db.String(60), db.ForeignKey('amenities.id'), primary_key=True, index=True)
 )
 
 class Place(BaseModel, db.Model):
@@ -17,12 +22,22 @@ class Place(BaseModel, db.Model):
 
     title = db.Column(db.String(100), nullable=False)
     description = db.Column(db.String(500), default="")
-    price = db.Column(db.Float, nullable=False)
+    price = db.Column(db.Float, nullable=False, index=True)
     latitude = db.Column(db.Float, nullable=False)
     longitude = db.Column(db.Float, nullable=False)
+    geohash = db.Column(db.String(12))  # Mantenido por _set_geohash en cada insert/update
+
+    # Agregados de rating mantenidos por HBnBFacade al crear/editar/borrar reviews
+    review_count = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    rating_sum = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    rating_hist_1 = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    rating_hist_2 = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    rating_hist_3 = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    rating_hist_4 = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    rating_hist_5 = db.Column(db.Integer, nullable=False, default=0, server_default='0')
 
     # Relación con User
-    user_id = db.Column(db.String(60), db.ForeignKey('users.id'), nullable=False)
+    user_id = db.Column(db.String(60), db.ForeignKey('users.id'), nullable=False, index=True)
 
     # Relaciones con Amenities y Reviews
     amenities = db.relationship('Amenity', secondary=place_amenity, viewonly=False)
@@ -30,7 +45,7 @@ class Place(BaseModel, db.Model):
 
     def __init__(self, title, description, price, latitude, longitude, owner, amenities=None):
         super().__init__()
-        print("[DEBUG] Creando Place...")
+        logger.debug("Creando Place...")
         self.title = self.validate_string(title, 100)
         self.description = description if description else ""
         self.price = self.validate_price(price)
@@ -38,11 +53,11 @@ class Place(BaseModel, db.Model):
         self.longitude = self.validate_longitude(longitude)
 
         if not isinstance(owner, User):
-            print("[ERROR] El owner no es una instancia de User")
+            logger.info("El owner no es una instancia de User")
             raise ValueError("El owner debe ser una instancia de User")
 
         self.user_id = owner.id  # Guardamos solo el ID, no el objeto completo
-        print(f"[DEBUG] Place creado con user_id={self.user_id}")
+        logger.debug("Place creado con user_id=%s", self.user_id)
 
         # Inicializar amenities si se pasan
         if amenities:
@@ -52,49 +67,68 @@ class Place(BaseModel, db.Model):
     def add_amenity(self, amenity):
         """Agrega un amenity si no está en la lista"""
         if isinstance(amenity, Amenity) and amenity not in self.amenities:
-            print(f"[DEBUG] Agregando amenity {amenity.id} al place")
+            logger.debug("Agregando amenity %s al place", amenity.id)
             self.amenities.append(amenity)
 
     def add_review(self, review):
         """Agrega un review si es válido"""
         if isinstance(review, Review):
-            print(f"[DEBUG] Agregando review {review.id} al place")
+            logger.debug("Agregando review %s al place", review.id)
             self.reviews.append(review)
 
-    def validate_string(self, value, max_length):
+    @property
+    def average_rating(self):
+        """Promedio de rating calculado con los agregados (sin leer reviews)"""
+        if not self.review_count:
+            return None
+        return round(self.rating_sum / self.review_count, 2)
+
+    @property
+    def rating_histogram(self):
+        """Cantidad de reviews por cada rating de 1 a 5"""
+        return {str(r): getattr(self, f'rating_hist_{r}') or 0 for r in range(1, 6)}
+
+    # Validadores estáticos: los usa __init__ y también la carga masiva
+    # (HBnBFacade.create_places_bulk), que valida sin crear objetos Place.
+    @staticmethod
+    def validate_string(value, max_length):
         if not isinstance(value, str) or len(value) > max_length:
-            print("[ERROR] String de longitud inválida")
+            logger.info("String de longitud inválida")
             raise ValueError(f"Máximo {max_length} caracteres permitidos")
         return value.strip()
 
-    def validate_price(self, value):
+    @staticmethod
+    def validate_price(value):
         if not isinstance(value, (int, float)) or value < 0:
-            print("[ERROR] Precio inválido")
+            logger.info("Precio inválido")
             raise ValueError("El precio debe ser positivo")
         return float(value)
 
-    def validate_latitude(self, value):
-        if not (-90.0 <= value <= 90.0):
-            print("[ERROR] Latitud fuera de rango")
+    @staticmethod
+    def validate_latitude(value):
+        if not isinstance(value, (int, float)) or not (-90.0 <= value <= 90.0):
+            logger.info("Latitud fuera de rango")
             raise ValueError("Latitud fuera de rango")
         return float(value)
 
-    def validate_longitude(self, value):
-        if not (-180.0 <= value <= 180.0):
-            print("[ERROR] Longitud fuera de rango")
+    @staticmethod
+    def validate_longitude(value):
+        if not isinstance(value, (int, float)) or not (-180.0 <= value <= 180.0):
+            logger.info("Longitud fuera de rango")
             raise ValueError("Longitud fuera de rango")
         return float(value)
 
     def to_dict(self):
         """Devuelve un diccionario del place incluyendo reviews y amenities"""
-        print(f"[DEBUG] Generando dict para Place id={self.id}")
+        logger.debug("Generando dict para Place id=%s", self.id)
         base = super().to_dict()
 
+        # Usa la relación `user` (backref de User.places) en vez de User.query.get
+        # para que HBnBFacade pueda precargarla junto con amenities y reviews.
         owner_name = "Unknown"
-        if self.user_id:
-            owner = User.query.get(self.user_id)
-            if owner:
-                owner_name = f"{owner.first_name} {owner.last_name}".strip() or owner.email
+        owner = self.user
+        if owner:
+            owner_name = f"{owner.first_name} {owner.last_name}".strip() or owner.email
 
         base.update({
             'title': self.title,
@@ -104,7 +138,36 @@ class Place(BaseModel, db.Model):
             'longitude': self.longitude,
             'user_id': self.user_id,
             'user_name': owner_name,  # <-- 🔥 Aquí incluimos el nombre del usuario
-            'amenities': [a.to_dict() for a in self.amenities],
+            'review_count': self.review_count or 0,
+            'average_rating': self.average_rating,
+            'rating_histogram': self.rating_histogram,
+            # Diccionarios ya armados en el catálogo en memoria (no uno nuevo por lugar)
+            'amenities': amenity_catalog.serialize_all(self.amenities),
             'reviews': [r.to_dict() for r in self.reviews]  # <-- Aquí cada review también incluye su user_name
         })
         return base
+
+
+# Índice para la paginación por clave (created_at, id)
+db.Index('ix_places_created_at_id', Place.created_at, Place.id)
+
+# Índice para los filtros por caja geográfica de /places/search
+db.Index('ix_places_latitude_longitude', Place.latitude, Place.longitude)
+
+# Índice de cobertura para /places/nearby: el prefiltro por celdas se
+# resuelve sin leer la tabla (geohash, coordenadas e id están en el índice)
+db.Index('ix_places_geohash', Place.geohash, Place.latitude, Place.longitude, Place.id)
+
+
+# Índice de texto completo sobre title/description: FTS5 con triggers en
+# SQLite (creado junto con la tabla) e índice FULLTEXT en MySQL
+fulltext.register_ddl(Place.__table__)
+db.Index(fulltext.MYSQL_INDEX, Place.title, Place.description, mysql_prefix='FULLTEXT').ddl_if(dialect='mysql')
+
+
+@db.event.listens_for(Place, 'before_insert')
+@db.event.listens_for(Place, 'before_update')
+def _set_geohash(mapper, connection, target):
+    """Recalcula el geohash del lugar a partir de su latitud y longitud."""
+    if target.latitude is not None and target.longitude is not None:
+        target.geohash = geohash.encode(target.latitude, target.longitude)
@@ -11,7 +11,7 @@ class Review(BaseModel, db.Model):
     rating = db.Column(db.Integer, nullable=False)
 
     # Relación con Place
-    place_id = db.Column(db.String(60), db.ForeignKey('places.id'), nullable=False)
+    place_id = db.Column(db.String(60), db.ForeignKey('places.id'), nullable=False, index=True)
 
     # Relación con User
     user_id = db.Column(db.String(60), db.ForeignKey('users.id'), nullable=False)
@@ -19,13 +19,8 @@ class Review(BaseModel, db.Model):
     def __init__(self, text, rating, place, user):
         super().__init__()
 
-        if not isinstance(text, str) or not text.strip():
-            raise ValueError("Review text is required")
-        self.text = text.strip()
-
-        if not (1 <= rating <= 5):
-            raise ValueError("Rating must be between 1 and 5")
-        self.rating = rating
+        self.text = self.validate_text(text)
+        self.rating = self.validate_rating(rating)
 
         if not place or not getattr(place, 'id', None):
             raise ValueError("Place must be a valid Place instance with id")
@@ -35,13 +30,26 @@ class Review(BaseModel, db.Model):
             raise ValueError("User must be a valid User instance with id")
         self.user_id = user.id
 
+    @staticmethod
+    def validate_text(value):
+        if not isinstance(value, str) or not value.strip():
+            raise ValueError("Review text is required")
+        return value.strip()
+
+    @staticmethod
+    def validate_rating(value):
+        if isinstance(value, bool) or not isinstance(value, int) or not (1 <= value <= 5):
+            raise ValueError("Rating must be between 1 and 5")
+        return value
+
     def to_dict(self):
         """Devuelve un diccionario del review incluyendo nombre del usuario"""
+        # Usa la relación `user` (backref de User.reviews): si fue cargada con
+        # joinedload/selectinload no genera una consulta por review.
         user_name = "Anonymous"
-        if self.user_id:
-            user = User.query.get(self.user_id)
-            if user:
-                user_name = f"{user.first_name} {user.last_name}".strip() or user.email
+        user = self.user
+        if user:
+            user_name = f"{user.first_name} {user.last_name}".strip() or user.email
 
         return {
             'id': self.id,
@@ -53,4 +61,11 @@ class Review(BaseModel, db.Model):
             'created_at': self.created_at,
             'updated_at': self.updated_at
         }
-      
+
+
+# Índice para la paginación por clave (created_at, id)
+db.Index('ix_reviews_created_at_id', Review.created_at, Review.id)
+
+# Un usuario solo puede reseñar un lugar una vez: la restricción atrapa
+# envíos duplicados (incluso concurrentes) y sirve de índice para exists()
+db.Index('uq_reviews_user_place', Review.user_id, Review.place_id, unique=True)
@@ -1,7 +1,10 @@
+import logging
 import re
 from app import db, bcrypt
 from app.models.base_model import BaseModel
 
+logger = logging.getLogger(__name__)
+
 class User(BaseModel):
     """Modelo de usuario con autenticación segura usando Bcrypt."""
 
@@ -13,6 +16,11 @@ class User(BaseModel):
     password = db.Column(db.String(255), nullable=False)  # Espacio suficiente para hash largo
     is_admin = db.Column(db.Boolean, default=False)
 
+    __table_args__ = (
+        # Índice funcional para búsquedas de email sin distinguir mayúsculas
+        db.Index('ix_users_email_lower', db.func.lower(email), unique=True),
+    )
+
     places = db.relationship('Place', backref='user', lazy=True)
     reviews = db.relationship('Review', backref='user', lazy=True)
 
@@ -24,7 +32,8 @@ class User(BaseModel):
         self.is_admin = is_admin
         self.password = self.set_password(password)
 
-    def _validate_string(self, value, max_length):
+    @staticmethod
+    def _validate_string(value, max_length):
         """Valida strings de nombres y apellidos."""
         if not isinstance(value, str) or not value.strip():
             raise ValueError("[ERROR] Campo obligatorio en string.")
@@ -32,42 +41,37 @@ class User(BaseModel):
             raise ValueError(f"[ERROR] Máximo {max_length} caracteres permitidos.")
         return value.strip()
 
-    def _validate_email(self, email):
+    @staticmethod
+    def _validate_email(email):
         """Valida formato correcto de email."""
-        if not re.match(r'^[\w\.-]+@[\w\.-]+\.\w+$', email):
+        if not isinstance(email, str) or not re.match(r'^[\w\.-]+@[\w\.-]+\.\w+$', email):
             raise ValueError("[ERROR] Formato de email inválido.")
         return email.lower()
 
-    def set_password(self, password):
-        """Genera hash de la contraseña solo si no está ya hasheada."""
-        if not password:
+    @staticmethod
+    def hash_password(password):
+        """Devuelve el hash bcrypt de la contraseña (si ya es un hash bcrypt, la deja igual)."""
+        if not isinstance(password, str) or not password:
             raise ValueError("[ERROR] Contraseña requerida.")
-        
         if password.startswith('$2b$'):
-            print(f"[DEBUG] Password ya viene hasheado (bcrypt): {password[:30]}...")
             return password
+        return bcrypt.generate_password_hash(password).decode('utf-8')
 
-        hashed = bcrypt.generate_password_hash(password).decode('utf-8')
-        print(f"[DEBUG] Password original: '{password}'")
-        print(f"[DEBUG] Password hasheado (bcrypt): '{hashed[:30]}...'")
+    def set_password(self, password):
+        """Genera hash de la contraseña solo si no está ya hasheada."""
+        hashed = self.hash_password(password)
+        if hashed == password:
+            logger.debug("Password ya viene hasheado (bcrypt)")
         return hashed
 
     def verify_password(self, password):
-        """Verifica contraseña contra el hash almacenado con DEBUG."""
+        """Verifica contraseña contra el hash almacenado (nunca se registra la contraseña ni el hash)."""
         if not self.password:
-            print("[ERROR] No hay contraseña almacenada para este usuario.")
+            logger.warning("No hay contraseña almacenada para el usuario %s", self.id)
             return False
 
-        print("\n=== [DEBUG] Verificando contraseña ===")
-        print(f"[DEBUG] Contraseña recibida (texto plano): '{password}'")
-        print(f"[DEBUG] Hash almacenado en DB: '{self.password[:30]}...'")
-        print(f"[DEBUG] Longitud del hash: {len(self.password)} caracteres")
-        print(f"[DEBUG] ¿El hash comienza con '$2b$'? {'Sí' if self.password.startswith('$2b$') else 'No'}")
-
         result = bcrypt.check_password_hash(self.password, password)
-        print(f"[DEBUG] Resultado de verificación: {'✅ Correcto' if result else '❌ Falló'}")
-        print("=======================================\n")
-
+        logger.debug("Verificación de contraseña del usuario %s: %s", self.id, 'correcta' if result else 'falló')
         return result
 
     def to_dict(self):
@@ -80,3 +84,7 @@ class User(BaseModel):
             'is_admin': self.is_admin
         })
         return base
+
+
+# Índice para la paginación por clave (created_at, id)
+db.Index('ix_users_created_at_id', User.created_at, User.id)
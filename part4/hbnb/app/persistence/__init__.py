@@ -1,6 +1,7 @@
 # app/persistence/__init__.py
 from .repository import Repository, SQLAlchemyRepository  # Importa SQLAlchemyRepository
 from .user_repository import UserRepository  # Importa UserRepository
+from .pagination import Page
 
-__all__ = ['Repository', 'SQLAlchemyRepository', 'UserRepository']  # Actualiza __all__ para incluir UserRepository
+__all__ = ['Repository', 'SQLAlchemyRepository', 'UserRepository', 'Page']  # Actualiza __all__ para incluir UserRepository
 
@@ -0,0 +1,184 @@
+import bisect
+import threading
+from datetime import datetime
+from types import MappingProxyType
+from flask import current_app, has_app_context
+from sqlalchemy import event, select
+from app import db
+from app.models.amenity import Amenity
+from app.persistence import versions
+from app.persistence.pagination import Page, PREV, encode_cursor, decode_cursor
+
+# Catálogo de amenities en memoria: cada proceso guarda una foto inmutable
+# de la tabla (pocas filas, casi nunca cambian) con el número de versión que
+# tenía la base al leerla. Toda escritura de amenities suma 1 a esa versión
+# (versions.AMENITIES en catalog_versions), dentro de su transacción; al
+# leer, una consulta a esa fila (una vez por transacción) dice si la foto
+# sigue vigente o hay que recargarla. Las escrituras por el ORM suben la
+# versión solas (after_flush); las inserciones con Core (add_many) llaman
+# a bump().
+EXTENSION_KEY = 'hbnb_amenity_catalog'
+SNAPSHOT_KEY = 'amenity_catalog_snapshot'  # Foto validada en la transacción actual
+DIRTY_KEY = 'amenity_catalog_dirty'  # La transacción actual modificó amenities
+
+
+class AmenityCatalog:
+    """Foto inmutable de la tabla amenities en una versión dada."""
+
+    def __init__(self, version, amenities):
+        """`amenities`: objetos Amenity ordenados por (created_at, id)."""
+        self.version = version
+        self._rows = tuple(MappingProxyType(a.to_dict()) for a in amenities)
+        self._keys = [(a.created_at or datetime.min, a.id) for a in amenities]
+        self._by_id = MappingProxyType({a['id']: a for a in self._rows})
+        self._by_name = MappingProxyType({a['name']: a['id'] for a in self._rows})
+
+    def get(self, amenity_id):
+        """Diccionario de la amenity (una copia) o None."""
+        amenity = self._by_id.get(amenity_id)
+        return dict(amenity) if amenity else None
+
+    def all(self):
+        return [dict(a) for a in self._rows]
+
+    def id_for_name(self, name):
+        return self._by_name.get(name)
+
+    def names(self):
+        return self._by_name.keys()
+
+    def page(self, limit, cursor=None):
+        """Misma paginación por (created_at, id) que SQLAlchemyRepository.get_page, sin consultar."""
+        start, end = 0, len(self._rows)
+        backwards = False
+        if cursor:
+            created_at, obj_id, direction = decode_cursor(cursor)
+            backwards = direction == PREV
+            key = (created_at, obj_id)
+            if backwards:
+                end = bisect.bisect_left(self._keys, key)
+            else:
+                start = bisect.bisect_right(self._keys, key)
+        has_more = end - start > limit
+        if backwards:
+            start = max(end - limit, start)
+        else:
+            end = min(start + limit, end)
+        if start >= end:
+            return Page([], None, None)
+
+        first, last = self._keys[start], self._keys[end - 1]
+        if backwards:
+            next_cursor = encode_cursor(*last)
+            prev_cursor = encode_cursor(*first, PREV) if has_more else None
+        else:
+            next_cursor = encode_cursor(*last) if has_more else None
+            prev_cursor = encode_cursor(*first, PREV) if cursor else None
+        return Page([dict(a) for a in self._rows[start:end]], next_cursor, prev_cursor)
+
+    def serialize(self, amenity):
+        """
+        to_dict() de una amenity ya cargada, reutilizando el diccionario de
+        la foto si corresponde a la misma fila (mismo nombre y updated_at).
+        """
+        cached = self._by_id.get(amenity.id)
+        updated_at = amenity.updated_at.isoformat() if amenity.updated_at else None
+        if cached and cached['name'] == amenity.name and cached['updated_at'] == updated_at:
+            return dict(cached)
+        return amenity.to_dict()
+
+
+class CatalogHolder:
+    """La foto más reciente de este proceso (una por aplicación)."""
+
+    def __init__(self):
+        self.snapshot = None
+        self.lock = threading.Lock()
+
+
+def init_app(app):
+    """Una foto por aplicación, en app.extensions."""
+    app.extensions[EXTENSION_KEY] = CatalogHolder()
+
+
+def current(session=None):
+    """
+    Foto vigente para la transacción actual: consulta la versión una vez
+    por transacción y recarga la tabla solo si cambió. Si la transacción
+    modificó amenities se lee directo de la base y no se comparte.
+    """
+    session = session or db.session()
+    if session.info.get(DIRTY_KEY):
+        return _load(session, _read_version(session))
+    snapshot = session.info.get(SNAPSHOT_KEY)
+    if snapshot is not None:
+        return snapshot
+
+    holder = current_app.extensions[EXTENSION_KEY]
+    version = _read_version(session)
+    snapshot = holder.snapshot
+    if snapshot is None or snapshot.version != version:
+        with holder.lock:
+            snapshot = holder.snapshot
+            if snapshot is None or snapshot.version != version:
+                snapshot = holder.snapshot = _load(session, version)
+    session.info[SNAPSHOT_KEY] = snapshot
+    return snapshot
+
+
+def latest():
+    """Última foto cargada por este proceso, sin consultar la base (None si no hay)."""
+    if not has_app_context():
+        return None
+    holder = current_app.extensions.get(EXTENSION_KEY)
+    return holder.snapshot if holder else None
+
+
+def serialize_all(amenities):
+    """Lista de to_dict() de amenities cargadas, usando la última foto para no reconstruirlos."""
+    snapshot = latest()
+    if snapshot is None:
+        return [a.to_dict() for a in amenities]
+    return [snapshot.serialize(a) for a in amenities]
+
+
+def bump(session=None):
+    """Sube la versión del catálogo en la transacción actual (inserciones con Core)."""
+    session = session or db.session()
+    versions.bump(session, versions.AMENITIES)
+    _mark_dirty(session)
+
+
+def _mark_dirty(session):
+    session.info[DIRTY_KEY] = True
+    session.info.pop(SNAPSHOT_KEY, None)
+
+
+def _read_version(session):
+    """Versión del catálogo en la base."""
+    return versions.read(session, versions.AMENITIES)
+
+
+def _load(session, version):
+    """Lee la tabla entera y arma la foto de `version`."""
+    amenities = session.scalars(select(Amenity).order_by(Amenity.created_at, Amenity.id)).all()
+    return AmenityCatalog(version, amenities)
+
+
+@event.listens_for(db.session, 'after_flush')
+def _bump_on_orm_changes(session, flush_context):
+    """Cualquier amenity creada, modificada o borrada por el ORM sube la versión."""
+    changed = any(isinstance(obj, Amenity) for obj in session.new) or \
+        any(isinstance(obj, Amenity) for obj in session.deleted) or \
+        any(isinstance(obj, Amenity) and session.is_modified(obj) for obj in session.dirty)
+    if changed:
+        versions.bump(session.connection(), versions.AMENITIES)
+        _mark_dirty(session)
+
+
+@event.listens_for(db.session, 'after_commit')
+@event.listens_for(db.session, 'after_rollback')
+def _end_of_transaction(session):
+    """La próxima transacción vuelve a validar la versión."""
+    session.info.pop(SNAPSHOT_KEY, None)
+    session.info.pop(DIRTY_KEY, None)
@@ -3,7 +3,7 @@ from models.amenity import Amenity, db
 class AmenityRepository:
     def create(self, amenity):
         db.session.add(amenity)
-        db.session.commit()
+        db.session.flush()
         return amenity
 
     def find_by_id(self, amenity_id):
@@ -13,9 +13,9 @@ class AmenityRepository:
         return Amenity.query.all()
 
     def update(self, amenity):
-        db.session.commit()
+        db.session.flush()
         return amenity
 
     def delete(self, amenity):
         db.session.delete(amenity)
-        db.session.commit()
+        db.session.flush()
@@ -0,0 +1,159 @@
+import re
+from contextlib import contextmanager
+from sqlalchemy import DDL, column, event, literal_column, table, text
+
+# Tabla FTS5 con title/description de `places` y su id (UNINDEXED, solo
+# para unir con places), y triggers que la mantienen al día. places tiene
+# una clave de texto, así que el rowid de cada fila FTS sale de
+# places_fts_ids, que asigna un entero fijo a cada id: el índice no depende
+# del rowid implícito de places, que un VACUUM puede renumerar.
+# Mientras places_fts_pause tenga una fila (solo dentro de la transacción de
+# una carga masiva, ver deferred_index) el trigger de inserción no indexa
+# fila por fila.
+SQLITE_CREATE = [
+    """CREATE VIRTUAL TABLE IF NOT EXISTS places_fts USING fts5(
+        place_id UNINDEXED, title, description,
+        tokenize='unicode61 remove_diacritics 2'
+    )""",
+    """CREATE TABLE IF NOT EXISTS places_fts_ids (
+        rowid INTEGER PRIMARY KEY,
+        place_id VARCHAR(60) NOT NULL UNIQUE
+    )""",
+    "CREATE TABLE IF NOT EXISTS places_fts_pause (id INTEGER PRIMARY KEY)",
+    """CREATE TRIGGER IF NOT EXISTS places_fts_ai AFTER INSERT ON places
+    WHEN NOT EXISTS (SELECT 1 FROM places_fts_pause) BEGIN
+        INSERT INTO places_fts_ids(place_id) VALUES (new.id);
+        INSERT INTO places_fts(rowid, place_id, title, description)
+        VALUES ((SELECT rowid FROM places_fts_ids WHERE place_id = new.id), new.id, new.title, new.description);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS places_fts_ad AFTER DELETE ON places BEGIN
+        DELETE FROM places_fts WHERE rowid = (SELECT rowid FROM places_fts_ids WHERE place_id = old.id);
+        DELETE FROM places_fts_ids WHERE place_id = old.id;
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS places_fts_au AFTER UPDATE OF title, description ON places BEGIN
+        UPDATE places_fts SET title = new.title, description = new.description
+        WHERE rowid = (SELECT rowid FROM places_fts_ids WHERE place_id = old.id);
+    END""",
+]
+
+SQLITE_DROP = [
+    "DROP TRIGGER IF EXISTS places_fts_au",
+    "DROP TRIGGER IF EXISTS places_fts_ad",
+    "DROP TRIGGER IF EXISTS places_fts_ai",
+    "DROP TABLE IF EXISTS places_fts_pause",
+    "DROP TABLE IF EXISTS places_fts_ids",
+    "DROP TABLE IF EXISTS places_fts",
+]
+
+# Indexa las filas de places que cumplen `{where}` y aún no tienen rowid FTS
+SQLITE_INDEX = [
+    "INSERT INTO places_fts_ids(place_id) SELECT id FROM places WHERE {where}",
+    "INSERT INTO places_fts(rowid, place_id, title, description) "
+    "SELECT ids.rowid, places.id, places.title, places.description "
+    "FROM places JOIN places_fts_ids AS ids ON ids.place_id = places.id WHERE {where}",
+]
+
+SQLITE_REBUILD = [
+    "DELETE FROM places_fts",
+    "DELETE FROM places_fts_ids",
+] + [statement.format(where='1') for statement in SQLITE_INDEX]
+
+# Índice FULLTEXT equivalente en MySQL (MATCH ... AGAINST)
+MYSQL_INDEX = 'ix_places_fulltext'
+
+SNIPPET_TOKENS = 12
+
+# Referencias ligeras para las consultas (la tabla FTS no es un modelo)
+places_fts = table('places_fts', column('place_id'))
+
+
+def register_ddl(places_table):
+    """Crea/borra la tabla FTS5 junto con `places` en SQLite (db.create_all/drop_all)."""
+    for statement in SQLITE_CREATE:
+        event.listen(places_table, 'after_create', DDL(statement).execute_if(dialect='sqlite'))
+    for statement in SQLITE_DROP:
+        event.listen(places_table, 'before_drop', DDL(statement).execute_if(dialect='sqlite'))
+
+
+def rebuild(session):
+    """Reconstruye el índice de texto completo desde la tabla places."""
+    if session.get_bind().dialect.name == 'sqlite':
+        for statement in SQLITE_REBUILD:
+            session.execute(text(statement))
+
+
+@contextmanager
+def deferred_index(session):
+    """
+    Para inserciones masivas en places: dentro del bloque el trigger no
+    indexa cada fila, y al salir se indexan todas las filas nuevas con un
+    solo INSERT ... SELECT (mucho más rápido). Todo ocurre en la
+    transacción de la sesión, y la pausa se quita aunque haya un error
+    para que nunca llegue a confirmarse.
+    """
+    if session.get_bind().dialect.name != 'sqlite':
+        yield  # MySQL mantiene el índice FULLTEXT por su cuenta
+        return
+    # La pausa va primero: toma el bloqueo de escritura antes de leer max(rowid)
+    session.execute(text("INSERT INTO places_fts_pause DEFAULT VALUES"))
+    start = session.execute(text("SELECT coalesce(max(rowid), 0) FROM places")).scalar()
+    try:
+        yield
+    finally:
+        session.execute(text("DELETE FROM places_fts_pause"))
+        # rowid de places solo para reconocer las filas de esta transacción
+        for statement in SQLITE_INDEX:
+            session.execute(text(statement.format(where='places.rowid > :start')), {'start': start})
+
+
+def match_query(raw):
+    """
+    Convierte el texto del usuario en una consulta FTS5 segura: cada palabra
+    entre comillas con búsqueda por prefijo, todas requeridas. Devuelve
+    None si no queda ninguna palabra.
+    """
+    terms = re.findall(r'\w+', raw or '', flags=re.UNICODE)
+    if not terms:
+        return None
+    return ' '.join(f'"{term}"*' for term in terms)
+
+
+def apply_search(query, raw, dialect):
+    """
+    Agrega a `query` (sobre Place) el filtro de texto completo de `raw`.
+    Devuelve (query, columna de relevancia, columna de fragmento); la
+    relevancia es menor cuanto mejor en SQLite (bm25) y mayor en MySQL,
+    por eso se devuelve ya lista para ordenar ascendente.
+    """
+    if dialect == 'sqlite':
+        fts_query = match_query(raw)
+        if fts_query is None:
+            return query.filter(text('0')), None, None
+        rank = literal_column('bm25(places_fts)')
+        snippet = literal_column(
+            f"snippet(places_fts, -1, '<mark>', '</mark>', '…', {SNIPPET_TOKENS})")
+        query = (query.join(places_fts, places_fts.c.place_id == literal_column('places.id'))
+                 .filter(text('places_fts MATCH :fts_query'))
+                 .params(fts_query=fts_query))
+        return query, rank, snippet
+
+    if dialect == 'mysql':
+        # El filtro y el orden llevan su propio parámetro ya ligado (.params()
+        # de la consulta no llega a las expresiones del ORDER BY)
+        match = 'MATCH (places.title, places.description) AGAINST (:fts_query IN NATURAL LANGUAGE MODE)'
+        query = query.filter(text(match).bindparams(fts_query=raw))
+        rank = text(f'-{match}').bindparams(fts_query=raw)
+        return query, rank, None
+
+    raise ValueError(f"Full-text search is not supported on {dialect}")
+
+
+def highlight(value, raw, tokens=SNIPPET_TOKENS):
+    """Fragmento con los términos marcados, para motores sin snippet() (MySQL)."""
+    terms = [t.lower() for t in re.findall(r'\w+', raw or '', flags=re.UNICODE)]
+    words = (value or '').split()
+    hit = next((i for i, w in enumerate(words) if any(w.lower().startswith(t) for t in terms)), 0)
+    start = max(hit - tokens // 2, 0)
+    marked = [f'<mark>{w}</mark>' if any(w.lower().startswith(t) for t in terms) else w
+              for w in words[start:start + tokens]]
+    return ('…' if start else '') + ' '.join(marked) + ('…' if start + tokens < len(words) else '')
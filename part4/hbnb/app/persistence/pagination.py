@@ -0,0 +1,29 @@
+import base64
+import json
+from collections import namedtuple
+from datetime import datetime
+
+# Resultado de una consulta paginada: los objetos y los cursores vecinos
+Page = namedtuple('Page', ['items', 'next_cursor', 'prev_cursor'])
+
+NEXT = 'next'
+PREV = 'prev'
+
+
+def encode_cursor(created_at, obj_id, direction=NEXT):
+    """Codifica la clave (created_at, id) en un token opaco para la URL."""
+    payload = [created_at.isoformat() if created_at else None, obj_id, direction]
+    raw = json.dumps(payload, separators=(',', ':')).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+
+def decode_cursor(token):
+    """Decodifica un token de cursor. Lanza ValueError si no es válido."""
+    try:
+        padded = token + '=' * (-len(token) % 4)
+        created_at, obj_id, direction = json.loads(base64.urlsafe_b64decode(padded))
+        if direction not in (NEXT, PREV) or not isinstance(obj_id, str):
+            raise ValueError
+        return datetime.fromisoformat(created_at), obj_id, direction
+    except (TypeError, ValueError, json.JSONDecodeError, UnicodeDecodeError):
+        raise ValueError("Invalid cursor")
@@ -3,7 +3,7 @@ from models.place import Place, db
 class PlaceRepository:
     def create(self, place):
         db.session.add(place)
-        db.session.commit()
+        db.session.flush()
         return place
 
     def find_by_id(self, place_id):
@@ -13,9 +13,9 @@ class PlaceRepository:
         return Place.query.all()
 
     def update(self, place):
-        db.session.commit()
+        db.session.flush()
         return place
 
     def delete(self, place):
         db.session.delete(place)
-        db.session.commit()
+        db.session.flush()
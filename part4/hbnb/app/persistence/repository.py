@@ -1,5 +1,11 @@
 from app import db
 from abc import ABC, abstractmethod
+from itertools import islice
+from sqlalchemy import exists, func, insert, and_, or_
+from app.persistence.pagination import Page, PREV, encode_cursor, decode_cursor
+
+# Filas por sentencia INSERT en add_many
+BULK_CHUNK_SIZE = 1000
 
 class Repository(ABC):
     """Interfaz base para los repositorios"""
@@ -9,11 +15,23 @@ class Repository(ABC):
         pass
 
     @abstractmethod
-    def get(self, obj_id):
+    def add_many(self, rows, chunk_size=BULK_CHUNK_SIZE):
+        pass
+
+    @abstractmethod
+    def get(self, obj_id, options=()):
+        pass
+
+    @abstractmethod
+    def get_all(self, options=()):
+        pass
+
+    @abstractmethod
+    def get_page(self, limit, cursor=None, options=()):
         pass
 
     @abstractmethod
-    def get_all(self):
+    def iter_batches(self, batch_size, options=()):
         pass
 
     @abstractmethod
@@ -28,6 +46,10 @@ class Repository(ABC):
     def get_by_attribute(self, attr_name, attr_value):
         pass
 
+    @abstractmethod
+    def exists(self, **filters):
+        pass
+
 
 class SQLAlchemyRepository(Repository):
     """Implementación del repositorio con SQLAlchemy"""
@@ -38,17 +60,102 @@ class SQLAlchemyRepository(Repository):
         self.model = model
 
     def add(self, obj):
-        """Agrega un objeto a la base de datos"""
+        """Agrega un objeto a la sesión (flush; el commit lo hace la unidad de trabajo)"""
         self.db.session.add(obj)
-        self.db.session.commit()
-
-    def get(self, obj_id):
-        """Obtiene un objeto por su ID"""
-        return self.model.query.get(obj_id)
-
-    def get_all(self):
+        self.db.session.flush()
+
+    def add_many(self, rows, chunk_size=BULK_CHUNK_SIZE):
+        """
+        Inserta muchas filas (dicts columna -> valor, todos con las mismas
+        claves) con insert() de Core en lotes de `chunk_size`: un
+        executemany por lote y sin crear objetos del ORM. Los defaults de
+        columna (id, created_at) se aplican; los eventos del ORM no.
+        Devuelve cuántas filas insertó.
+
+        Los lotes limitan el tamaño de cada sentencia, no de la transacción:
+        todos van en la transacción de la unidad de trabajo, que hace un solo
+        commit. Así una carga que falla a mitad no deja filas confirmadas
+        sin sus amenities, agregados o índice de texto completo, y el
+        llamador puede deshacerla con un savepoint.
+        """
+        statement = insert(self.model.__table__)
+        rows = iter(rows)
+        total = 0
+        while True:
+            chunk = list(islice(rows, chunk_size))
+            if not chunk:
+                return total
+            self.db.session.execute(statement, chunk)
+            total += len(chunk)
+
+    def get(self, obj_id, options=()):
+        """Obtiene un objeto por su ID (options: opciones de carga como selectinload)"""
+        return self.db.session.get(self.model, obj_id, options=options)
+
+    def get_all(self, options=()):
         """Obtiene todos los objetos de la base de datos"""
-        return self.model.query.all()
+        return self.model.query.options(*options).all()
+
+    def get_page(self, limit, cursor=None, options=()):
+        """
+        Obtiene una página de objetos con paginación por clave (keyset)
+        sobre (created_at, id). Devuelve un Page con los objetos y los
+        cursores opacos de la página siguiente y anterior (o None).
+        """
+        created_col, id_col = self.model.created_at, self.model.id
+        query = self.model.query.options(*options)
+        backwards = False
+
+        if cursor:
+            created_at, obj_id, direction = decode_cursor(cursor)
+            backwards = direction == PREV
+            if backwards:
+                query = query.filter(or_(created_col < created_at,
+                                         and_(created_col == created_at, id_col < obj_id)))
+            else:
+                query = query.filter(or_(created_col > created_at,
+                                         and_(created_col == created_at, id_col > obj_id)))
+
+        if backwards:
+            query = query.order_by(created_col.desc(), id_col.desc())
+        else:
+            query = query.order_by(created_col.asc(), id_col.asc())
+
+        # Se pide un elemento extra para saber si hay más páginas
+        items = query.limit(limit + 1).all()
+        has_more = len(items) > limit
+        items = items[:limit]
+        if backwards:
+            items.reverse()
+
+        if not items:
+            return Page([], None, None)
+
+        first, last = items[0], items[-1]
+        if backwards:
+            next_cursor = encode_cursor(last.created_at, last.id)
+            prev_cursor = encode_cursor(first.created_at, first.id, PREV) if has_more else None
+        else:
+            next_cursor = encode_cursor(last.created_at, last.id) if has_more else None
+            prev_cursor = encode_cursor(first.created_at, first.id, PREV) if cursor else None
+        return Page(items, next_cursor, prev_cursor)
+
+    def iter_batches(self, batch_size, options=()):
+        """
+        Generador con todos los objetos en listas de `batch_size`, en el
+        orden (created_at, id) de get_page: cada lote es una página por
+        clave, así que ninguna consulta carga la tabla entera y los objetos
+        de un lote se liberan al pasar al siguiente (el identity map de la
+        sesión guarda referencias débiles).
+        """
+        cursor = None
+        while True:
+            page = self.get_page(batch_size, cursor, options=options)
+            if page.items:
+                yield page.items
+            if not page.next_cursor:
+                return
+            cursor = page.next_cursor
 
     def update(self, obj_id, data):
         """Actualiza un objeto existente"""
@@ -56,16 +163,41 @@ class SQLAlchemyRepository(Repository):
         if obj:
             for key, value in data.items():
                 setattr(obj, key, value)
-            self.db.session.commit()
+            self.db.session.flush()
 
     def delete(self, obj_id):
         """Elimina un objeto por su ID"""
         obj = self.get(obj_id)
         if obj:
             self.db.session.delete(obj)
-            self.db.session.commit()
+            self.db.session.flush()
 
     def get_by_attribute(self, attr_name, attr_value):
         """Obtiene un objeto filtrando por un atributo específico"""
         return self.model.query.filter_by(**{attr_name: attr_value}).first()
 
+    def exists(self, **filters):
+        """
+        Indica si existe algún objeto con esos valores usando SELECT EXISTS,
+        que se resuelve con un índice sin cargar filas.
+        """
+        conditions = [getattr(self.model, name) == value for name, value in filters.items()]
+        return self.db.session.query(exists().where(*conditions)).scalar()
+
+    def filter_by(self, options=(), **filters):
+        """Obtiene todos los objetos que cumplen los filtros dados"""
+        return self.model.query.options(*options).filter_by(**filters).all()
+
+    def get_by_unique_attribute(self, attr_name, attr_value):
+        """
+        Obtiene un objeto por un atributo único sin distinguir mayúsculas.
+        La comparación se hace sobre lower(columna) para que use el índice
+        funcional (p. ej. ix_users_email_lower) en vez de recorrer la tabla.
+        """
+        column = getattr(self.model, attr_name)
+        if isinstance(attr_value, str):
+            condition = func.lower(column) == attr_value.strip().lower()
+        else:
+            condition = column == attr_value
+        return self.model.query.filter(condition).first()
+
@@ -3,7 +3,7 @@ from models.review import Review, db
 class ReviewRepository:
     def create(self, review):
         db.session.add(review)
-        db.session.commit()
+        db.session.flush()
         return review
 
     def find_by_id(self, review_id):
@@ -13,9 +13,9 @@ class ReviewRepository:
         return Review.query.all()
 
     def update(self, review):
-        db.session.commit()
+        db.session.flush()
         return review
 
     def delete(self, review):
         db.session.delete(review)
-        db.session.commit()
+        db.session.flush()
@@ -0,0 +1,85 @@
+from contextlib import contextmanager
+from functools import wraps
+from app import db
+
+# Unidad de trabajo: una sola transacción por petición HTTP o por llamada
+# explícita a la fachada. Los repositorios solo hacen flush; únicamente el
+# nivel más externo confirma (commit) o descarta (rollback). La profundidad
+# se guarda en session.info, así que vive y muere con la sesión.
+DEPTH_KEY = 'unit_of_work_depth'
+
+
+def depth():
+    """Número de unidades de trabajo abiertas en la sesión actual."""
+    return db.session.info.get(DEPTH_KEY, 0)
+
+
+def begin():
+    """Abre una unidad de trabajo (o se une a la que ya está abierta)."""
+    db.session.info[DEPTH_KEY] = depth() + 1
+
+
+def end(commit=True):
+    """
+    Cierra la unidad de trabajo actual. Si era la más externa hace commit
+    (o rollback si `commit` es False); si estaba anidada no hace nada y
+    deja la decisión al nivel de arriba.
+    """
+    remaining = depth() - 1
+    db.session.info[DEPTH_KEY] = max(remaining, 0)
+    if remaining > 0:
+        return
+    if not commit:
+        db.session.rollback()
+        return
+    try:
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        raise
+
+
+def reset():
+    """Descarta cualquier unidad de trabajo que haya quedado abierta (p. ej. tras un error)."""
+    if depth():
+        db.session.info[DEPTH_KEY] = 0
+        db.session.rollback()
+
+
+@contextmanager
+def unit_of_work():
+    """Bloque transaccional: commit al salir, rollback si hay una excepción."""
+    begin()
+    try:
+        yield db.session
+    except BaseException:
+        end(commit=False)
+        raise
+    end()
+
+
+def transactional(func):
+    """Ejecuta el método de la fachada dentro de una unidad de trabajo."""
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        with unit_of_work():
+            return func(*args, **kwargs)
+    return wrapper
+
+
+def init_app(app):
+    """Una unidad de trabajo por petición: commit si la respuesta es < 400."""
+
+    @app.before_request
+    def begin_unit_of_work():
+        begin()
+
+    @app.after_request
+    def end_unit_of_work(response):
+        end(commit=response.status_code < 400)
+        return response
+
+    @app.teardown_request
+    def reset_unit_of_work(exc):
+        # Si la petición terminó con una excepción no pasó por after_request
+        reset()
@@ -1,39 +1,42 @@
+import logging
 from app import db
 from app.models.user import User
 
+logger = logging.getLogger(__name__)
+
 class UserRepository:
     """Repositorio para operaciones CRUD de usuarios."""
 
     def get(self, user_id):
         """Busca un usuario por ID."""
-        print(f"[USER_REPO] Buscando usuario por ID: {user_id}")
+        logger.debug("Buscando usuario por ID: %s", user_id)
         return User.query.get(user_id)
 
     def get_all(self):
         """Obtiene todos los usuarios."""
-        print("[USER_REPO] Obteniendo todos los usuarios")
+        logger.debug("Obteniendo todos los usuarios")
         return User.query.all()
 
     def get_by_email(self, email):
         """Obtiene un usuario por email."""
-        print(f"[USER_REPO] Buscando usuario por email: {email}")
+        logger.debug("Buscando usuario por email: %s", email)
         return User.query.filter_by(email=email).first()
 
     def add(self, user):
         """Agrega un nuevo usuario a la base de datos."""
-        print(f"[USER_REPO] Agregando usuario: {user.email}")
+        logger.debug("Agregando usuario: %s", user.email)
         db.session.add(user)
-        db.session.commit()
-        print("[USER_REPO] Usuario agregado exitosamente")
+        db.session.flush()
+        logger.debug("Usuario agregado exitosamente")
 
     def delete(self, user_id):
         """Elimina un usuario por ID."""
-        print(f"[USER_REPO] Eliminando usuario ID: {user_id}")
+        logger.debug("Eliminando usuario ID: %s", user_id)
         user = self.get(user_id)
         if user:
             db.session.delete(user)
-            db.session.commit()
-            print("[USER_REPO] Usuario eliminado exitosamente")
+            db.session.flush()
+            logger.debug("Usuario eliminado exitosamente")
             return True
-        print("[USER_REPO] Usuario no encontrado para eliminar")
+        logger.debug("Usuario no encontrado para eliminar")
         return False
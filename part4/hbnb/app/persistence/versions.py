@@ -0,0 +1,55 @@
+import os
+import threading
+from sqlalchemy import DDL, event, func, select, update
+from app import db
+
+# Contadores de versión en la base (tabla catalog_versions), uno por nombre.
+# Las escrituras los suben dentro de su propia transacción, así que una
+# lectura ve el contador nuevo exactamente cuando ve los datos nuevos:
+#   amenities - catálogo de amenities en memoria (app.persistence.amenity_catalog)
+#   places    - listados de lugares y reseñas (ETag de GET condicionales)
+# Subir un contador bloquea su fila hasta el commit. 'places' lo sube toda
+# escritura de lugares y reseñas, así que está repartido en SHARDS filas
+# ('places', 'places.1', ...): cada hilo de cada proceso sube siempre la
+# misma (una sola fila bloqueada por transacción, sin deadlocks) y la
+# versión es la suma. Dos escrituras solo se esperan si caen en la misma
+# fila, no todas detrás de una.
+AMENITIES = 'amenities'
+PLACES = 'places'
+NAMES = (AMENITIES, PLACES)
+SHARDS = {PLACES: 16}
+
+
+def shard_names(name):
+    """Filas de catalog_versions de `name` (una sola si no está repartido)."""
+    return [name] + [f'{name}.{shard}' for shard in range(1, SHARDS.get(name, 1))]
+
+
+catalog_versions = db.Table(
+    'catalog_versions',
+    db.Column('name', db.String(50), primary_key=True),
+    db.Column('version', db.Integer, nullable=False, default=0),
+)
+
+# Con db.create_all las filas se crean junto con la tabla (las migraciones las insertan igual)
+event.listen(catalog_versions, 'after_create', DDL(
+    "INSERT INTO catalog_versions (name, version) VALUES "
+    + ', '.join(f"('{row}', 0)" for name in NAMES for row in shard_names(name))))
+
+
+def read(session, name):
+    """Versión actual de `name`: la suma de sus filas (0 si no existen)."""
+    names = shard_names(name)
+    if len(names) == 1:
+        return session.execute(select(catalog_versions.c.version)
+                               .where(catalog_versions.c.name == name)).scalar() or 0
+    return session.execute(select(func.sum(catalog_versions.c.version))
+                           .where(catalog_versions.c.name.in_(names))).scalar() or 0
+
+
+def bump(session, name):
+    """Suma 1 a la versión de `name` en la transacción actual (en la fila de este hilo)."""
+    names = shard_names(name)
+    row = names[hash((os.getpid(), threading.get_ident())) % len(names)]
+    session.execute(update(catalog_versions).where(catalog_versions.c.name == row)
+                    .values(version=catalog_versions.c.version + 1))
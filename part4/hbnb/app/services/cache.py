@@ -0,0 +1,241 @@
+import pickle
+import threading
+import time
+from collections import OrderedDict
+from fnmatch import fnmatchcase
+from flask import current_app, has_app_context
+from sqlalchemy import event
+from app import db, metrics
+
+# Caché de lectura delante de la fachada (detalle de lugares y sus reseñas).
+# Los valores se guardan serializados con pickle: cada lectura devuelve una
+# copia nueva que el llamador puede modificar sin tocar la caché. Las
+# escrituras invalidan claves concretas al momento y otra vez cuando la
+# transacción termina (commit o rollback), así una lectura concurrente que
+# volvió a llenar la clave con datos viejos antes del commit no sobrevive.
+#
+# Backends (config CACHE_BACKEND):
+#   local  - LRU con TTL en la memoria del proceso (por defecto)
+#   shared - compartida entre procesos sobre un cliente tipo Redis
+#            (CACHE_URL); sin CACHE_URL usa LocalSharedClient, un sustituto
+#            en memoria con el mismo API para desarrollo y tests
+#   none   - sin caché
+EXTENSION_KEY = 'hbnb_cache'
+PENDING_KEY = 'cache_pending_invalidations'
+SHARED_PREFIX = 'hbnb:'
+
+
+class LocalCache:
+    """LRU con TTL en memoria del proceso (segura entre hilos)."""
+
+    name = 'local'
+
+    def __init__(self, max_entries, ttl):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires = entry
+            if expires <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._entries[key] = (value, time.monotonic() + self.ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, keys):
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def size(self):
+        return len(self._entries)
+
+
+class SharedCache:
+    """Caché compartida sobre un cliente con get/set(ex=)/delete/scan_iter (Redis o LocalSharedClient)."""
+
+    name = 'shared'
+
+    def __init__(self, client, ttl, prefix=SHARED_PREFIX):
+        self.client = client
+        self.ttl = ttl
+        self.prefix = prefix
+
+    def get(self, key):
+        return self.client.get(self.prefix + key)
+
+    def set(self, key, value):
+        self.client.set(self.prefix + key, value, ex=self.ttl)
+
+    def delete(self, keys):
+        if keys:
+            self.client.delete(*[self.prefix + key for key in keys])
+
+    def clear(self):
+        keys = list(self.client.scan_iter(match=self.prefix + '*'))
+        if keys:
+            self.client.delete(*keys)
+
+    def size(self):
+        return None  # Contar claves en un servidor compartido recorrería todo el espacio
+
+
+class LocalSharedClient:
+    """Sustituto en memoria del cliente Redis (solo lo que usa SharedCache)."""
+
+    def __init__(self):
+        self._data = {}
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            if entry[1] is not None and entry[1] <= time.monotonic():
+                del self._data[key]
+                return None
+            return entry[0]
+
+    def set(self, key, value, ex=None):
+        with self._lock:
+            self._data[key] = (bytes(value), time.monotonic() + ex if ex else None)
+
+    def delete(self, *keys):
+        with self._lock:
+            return sum(self._data.pop(key, None) is not None for key in keys)
+
+    def scan_iter(self, match='*'):
+        with self._lock:
+            return iter([key for key in self._data if fnmatchcase(key, match)])
+
+
+class NullCache:
+    """Backend vacío (CACHE_BACKEND = 'none' o fuera de un contexto de aplicación)."""
+
+    name = 'none'
+
+    def get(self, key):
+        return None
+
+    def set(self, key, value):
+        pass
+
+    def delete(self, keys):
+        pass
+
+    def clear(self):
+        pass
+
+    def size(self):
+        return 0
+
+
+class Cache:
+    """Frente común a los backends: serialización, contadores e invalidación."""
+
+    def __init__(self, backend):
+        self.backend = backend
+        self._lock = threading.Lock()
+        self.counters = {'hits': 0, 'misses': 0, 'sets': 0, 'invalidations': 0}
+
+    def _count(self, name, amount=1):
+        with self._lock:
+            self.counters[name] += amount
+        # Los mismos contadores, sumados entre workers, en /metrics
+        metrics.inc('hbnb_cache_operations_total', {'op': name}, amount)
+
+    def get_or_set(self, key, loader):
+        """
+        Devuelve el valor de `key`; si no está, lo calcula con `loader()` y
+        lo guarda. None no se guarda (un lugar que aún no existe), ni nada
+        leído dentro de una transacción con escrituras sin confirmar.
+        """
+        raw = self.backend.get(key)
+        if raw is not None:
+            self._count('hits')
+            return pickle.loads(raw)
+        self._count('misses')
+        value = loader()
+        if value is not None and not db.session.info.get(PENDING_KEY):
+            self.backend.set(key, pickle.dumps(value, pickle.HIGHEST_PROTOCOL))
+            self._count('sets')
+        return value
+
+    def invalidate(self, *keys):
+        """Borra `keys` ahora y otra vez cuando termine la transacción en curso."""
+        self.backend.delete(keys)
+        db.session.info.setdefault(PENDING_KEY, set()).update(keys)
+        self._count('invalidations', len(keys))
+
+    def clear(self):
+        self.backend.clear()
+
+    def stats(self):
+        with self._lock:
+            counters = dict(self.counters)
+        lookups = counters['hits'] + counters['misses']
+        counters.update({'backend': self.backend.name, 'size': self.backend.size(),
+                         'hit_ratio': round(counters['hits'] / lookups, 4) if lookups else None})
+        return counters
+
+
+NULL_CACHE = Cache(NullCache())
+
+
+def create_backend(config):
+    """Construye el backend según CACHE_BACKEND, CACHE_TTL, CACHE_MAX_ENTRIES y CACHE_URL."""
+    name = config.get('CACHE_BACKEND', 'local')
+    ttl = config.get('CACHE_TTL', 60)
+    if name == 'none':
+        return NullCache()
+    if name == 'local':
+        return LocalCache(config.get('CACHE_MAX_ENTRIES', 10000), ttl)
+    if name == 'shared':
+        url = config.get('CACHE_URL')
+        if not url:
+            return SharedCache(LocalSharedClient(), ttl)
+        try:
+            import redis
+        except ImportError:
+            raise RuntimeError("CACHE_BACKEND='shared' con CACHE_URL requiere el paquete redis")
+        return SharedCache(redis.Redis.from_url(url), ttl)
+    raise ValueError(f"CACHE_BACKEND desconocido: {name}")
+
+
+def init_app(app):
+    """Una caché por aplicación, en app.extensions."""
+    app.extensions[EXTENSION_KEY] = Cache(create_backend(app.config))
+
+
+def get_cache():
+    """Caché de la aplicación actual (NULL_CACHE fuera de un contexto de aplicación)."""
+    if not has_app_context():
+        return NULL_CACHE
+    return current_app.extensions.get(EXTENSION_KEY, NULL_CACHE)
+
+
+@event.listens_for(db.session, 'after_commit')
+@event.listens_for(db.session, 'after_rollback')
+def _flush_pending_invalidations(session):
+    """Segunda invalidación, ya con la transacción confirmada o descartada."""
+    keys = session.info.pop(PENDING_KEY, None)
+    if keys:
+        get_cache().backend.delete(keys)
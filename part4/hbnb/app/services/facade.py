@@ -1,10 +1,62 @@
+import logging
+import uuid
+from datetime import datetime
 from flask_bcrypt import Bcrypt
+from sqlalchemy import and_, bindparam, case, exists, func, insert, or_, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import aliased, configure_mappers, joinedload, load_only, selectinload
 from app import db
 from app.models.user import User
-from app.models.place import Place
+from app.models.place import Place, place_amenity
 from app.models.review import Review
 from app.models.amenity import Amenity
-from app.persistence.repository import SQLAlchemyRepository  # Usamos SQLAlchemyRepository
+from app.models import geohash
+from app.persistence.repository import BULK_CHUNK_SIZE, SQLAlchemyRepository  # Usamos SQLAlchemyRepository
+from app.persistence.pagination import Page
+from app.persistence.unit_of_work import transactional
+from app.persistence import amenity_catalog, fulltext, versions
+from app.services import place_documents
+from app.services.cache import get_cache
+
+logger = logging.getLogger(__name__)
+
+# Los backrefs (Place.user, Review.user) existen solo tras configurar los mappers
+configure_mappers()
+
+# Opciones de carga para serializar lugares en un número constante de consultas:
+# lugares + dueño (JOIN), amenities (IN) y reviews con su autor (IN + JOIN).
+PLACE_LOAD_OPTIONS = (
+    joinedload(Place.user),
+    selectinload(Place.amenities),
+    selectinload(Place.reviews).joinedload(Review.user),
+)
+REVIEW_LOAD_OPTIONS = (joinedload(Review.user),)
+
+# Órdenes válidos para search_places (el desempate final es por id)
+PLACE_SORT_OPTIONS = {
+    'newest': (Place.created_at.desc(), Place.id),
+    'price_asc': (Place.price.asc(), Place.id),
+    'price_desc': (Place.price.desc(), Place.id),
+    'rating': (Place.created_at.desc(), Place.id),  # Tras ordenar por promedio
+    'relevance': (Place.id,),  # Tras ordenar por bm25/MATCH; requiere `q`
+}
+
+# Columnas de cada exportación NDJSON (sin contraseñas); el orden es por id
+EXPORT_COLUMNS = {
+    'users': (User, ('id', 'first_name', 'last_name', 'email', 'is_admin', 'created_at', 'updated_at')),
+    'places': (Place, ('id', 'title', 'description', 'price', 'latitude', 'longitude', 'user_id',
+                       'review_count', 'rating_sum', 'rating_hist_1', 'rating_hist_2', 'rating_hist_3',
+                       'rating_hist_4', 'rating_hist_5', 'created_at', 'updated_at')),
+    'reviews': (Review, ('id', 'text', 'rating', 'place_id', 'user_id', 'created_at', 'updated_at')),
+    'amenities': (Amenity, ('id', 'name', 'created_at', 'updated_at')),
+}
+EXPORT_BATCH_SIZE = 1000
+
+# Objetos por lote en los listados completos en streaming (iter_users, iter_places, iter_reviews)
+STREAM_BATCH_SIZE = 500
+
+# Claves de caché de un lugar: get_place, get_place_by_id y get_reviews_by_place
+PLACE_CACHE_PREFIXES = ('place', 'place_detail', 'place_reviews')
 
 # Instancias únicas
 bcrypt = Bcrypt()
@@ -13,11 +65,27 @@ place_repo = SQLAlchemyRepository(Place)
 review_repo = SQLAlchemyRepository(Review)
 amenity_repo = SQLAlchemyRepository(Amenity)
 
+
+class DuplicateReviewError(ValueError):
+    """El usuario ya reseñó ese lugar (lo detecta uq_reviews_user_place)."""
+
+
+# Cómo nombra cada motor la violación de uq_reviews_user_place: SQLite da
+# las columnas, MySQL y PostgreSQL el nombre del índice
+DUPLICATE_REVIEW_MARKERS = ('uq_reviews_user_place', 'reviews.user_id, reviews.place_id')
+
+
+def _is_duplicate_review(error):
+    """Indica si el IntegrityError viene de uq_reviews_user_place (y no de una FK o un NOT NULL)."""
+    message = str(error.orig)
+    return any(marker in message for marker in DUPLICATE_REVIEW_MARKERS)
+
+
 class HBnBFacade:
     """Fachada que maneja toda la lógica de HBnB."""
 
     def __init__(self):
-        print("[FACADE] Inicializando fachada...")
+        logger.debug("Inicializando fachada...")
         self.user_repo = user_repo
         self.place_repo = place_repo
         self.review_repo = review_repo
@@ -25,27 +93,29 @@ class HBnBFacade:
 
     # --------------- USERS ---------------
     def get_user_by_email(self, email):
-        print(f"[FACADE] Buscando usuario por email: {email}")
-        return next((user for user in self.user_repo.get_all() if user.email == email), None)
+        logger.debug("Buscando usuario por email: %s", email)
+        if not email:
+            return None
+        return self.user_repo.get_by_unique_attribute('email', email)
 
     def get_user(self, user_id):
-        print(f"[FACADE] Buscando usuario por ID: {user_id}")
+        logger.debug("Buscando usuario por ID: %s", user_id)
         user = self.user_repo.get(user_id)
         return user.to_dict() if user else None
 
+    @transactional
     def create_user(self, data):
         """Crea usuario nuevo (hasheando contraseña de forma segura)."""
-        print(f"[FACADE] Intentando crear usuario: {data.get('email')}")
+        logger.debug("Intentando crear usuario: %s", data.get('email'))
 
         if 'password' not in data or not data['password'].strip():
             raise ValueError("[FACADE] Error: Password es obligatorio")
 
         if self.get_user_by_email(data['email']):
-            print("[FACADE] Error: Email ya registrado")
+            logger.info("Error: Email ya registrado")
             return {'error': 'User already exists'}, 400
 
         hashed_password = bcrypt.generate_password_hash(data['password']).decode('utf-8')
-        print(f"[FACADE] Password hasheado: {hashed_password}")
 
         user = User(
             first_name=data['first_name'],
@@ -56,50 +126,66 @@ class HBnBFacade:
         )
 
         self.user_repo.add(user)
-        print(f"[FACADE] Usuario creado exitosamente: {user.email}")
+        logger.info("Usuario creado exitosamente: %s", user.email)
         return user.to_dict(), 201
 
     def get_all_users(self):
-        print("[FACADE] Obteniendo todos los usuarios...")
+        logger.debug("Obteniendo todos los usuarios...")
         return [user.to_dict() for user in self.user_repo.get_all()]
 
+    def iter_users(self, batch_size=STREAM_BATCH_SIZE):
+        """Generador con todos los usuarios (dicts) en lotes, para listados en streaming."""
+        logger.debug("Recorriendo todos los usuarios en lotes de %s...", batch_size)
+        for users in self.user_repo.iter_batches(batch_size):
+            yield [user.to_dict() for user in users]
+
+    def get_users_page(self, limit, cursor=None):
+        logger.debug("Obteniendo página de usuarios (limit=%s)...", limit)
+        return self._get_page(self.user_repo, limit, cursor)
+
+    @transactional
     def update_user(self, user_id, data):
-        print(f"[FACADE] Actualizando usuario ID: {user_id}")
+        logger.debug("Actualizando usuario ID: %s", user_id)
         user = self.user_repo.get(user_id)
         if not user:
-            print("[FACADE] Error: Usuario no encontrado para actualizar.")
+            logger.info("Error: Usuario no encontrado para actualizar.")
             return None
 
         if 'email' in data or 'password' in data:
-            print("[FACADE] Error: No se permite actualizar email o password desde esta función.")
+            logger.info("Error: No se permite actualizar email o password desde esta función.")
             return {"error": "Cannot update email or password"}, 400
 
         for key, value in data.items():
             setattr(user, key, value)
 
+        # El nombre aparece en los lugares del usuario y en sus reseñas
+        self._invalidate_places(self._places_of_user(user_id))
         return user.to_dict()
 
+    @transactional
     def delete_user(self, user_id):
-        print(f"[FACADE] Eliminando usuario ID: {user_id}")
+        logger.debug("Eliminando usuario ID: %s", user_id)
         user = self.user_repo.get(user_id)
         if not user:
-            print("[FACADE] Error: Usuario no encontrado para eliminar.")
+            logger.info("Error: Usuario no encontrado para eliminar.")
             return False
 
+        self._invalidate_places(self._places_of_user(user_id))
         self.user_repo.delete(user_id)
-        print("[FACADE] Usuario eliminado exitosamente.")
+        logger.info("Usuario eliminado exitosamente.")
         return True
 
     # --------------- PLACES ---------------
+    @transactional
     def create_place(self, data):
-        print("[FACADE] Creando un nuevo lugar...")
+        logger.debug("Creando un nuevo lugar...")
 
         # Ahora buscamos con 'user_id'
         owner = self.user_repo.get(data['user_id'])
         if not owner:
             raise ValueError("[FACADE] Error: Usuario propietario no encontrado")
 
-        print(f"[FACADE] Propietario encontrado: {owner.id}")
+        logger.debug("Propietario encontrado: %s", owner.id)
 
         place = Place(
             title=data['title'],
@@ -111,59 +197,218 @@ class HBnBFacade:
         )
 
         self.place_repo.add(place)
-        print(f"[FACADE] Lugar '{place.title}' creado exitosamente con ID {place.id}")
+        versions.bump(db.session, versions.PLACES)
+        logger.info("Lugar '%s' creado exitosamente con ID %s", place.title, place.id)
         return place.to_dict()
 
     def get_place(self, place_id):
-        print(f"[FACADE] Buscando lugar por ID: {place_id}")
-        place = self.place_repo.get(place_id)
-        return place.to_dict() if place else None
+        logger.debug("Buscando lugar por ID: %s", place_id)
+
+        def load():
+            place = self.place_repo.get(place_id, options=PLACE_LOAD_OPTIONS)
+            return place.to_dict() if place else None
+        return get_cache().get_or_set(f'place:{place_id}', load)
 
     def get_all_places(self):
-        print("[FACADE] Obteniendo todos los lugares...")
-        return [place.to_dict() for place in self.place_repo.get_all()]
+        logger.debug("Obteniendo todos los lugares...")
+        return [place.to_dict() for place in self.place_repo.get_all(options=PLACE_LOAD_OPTIONS)]
+
+    def iter_places(self, batch_size=STREAM_BATCH_SIZE):
+        """Generador con todos los lugares (dicts) en lotes, para listados en streaming."""
+        logger.debug("Recorriendo todos los lugares en lotes de %s...", batch_size)
+        for places in self.place_repo.iter_batches(batch_size, options=PLACE_LOAD_OPTIONS):
+            yield [place.to_dict() for place in places]
+
+    def get_places_page(self, limit, cursor=None):
+        logger.debug("Obteniendo página de lugares (limit=%s)...", limit)
+        return self._get_page(self.place_repo, limit, cursor, options=PLACE_LOAD_OPTIONS)
+
+    # Variantes con documentos materializados (PLACE_DOCUMENTS): devuelven
+    # el JSON ya codificado de cada lugar, el mismo que daría place_to_dict.
+    @transactional
+    def get_place_document(self, place_id):
+        logger.debug("Buscando documento del lugar ID: %s", place_id)
+        return place_documents.get_many([place_id]).get(place_id)
+
+    @transactional
+    def get_all_place_documents(self):
+        logger.debug("Obteniendo los documentos de todos los lugares...")
+        place_ids = db.session.scalars(select(Place.id)).all()
+        bodies = place_documents.get_many(place_ids)
+        return [bodies[place_id] for place_id in place_ids if place_id in bodies]
+
+    @transactional
+    def get_place_documents_page(self, limit, cursor=None):
+        logger.debug("Obteniendo página de documentos de lugares (limit=%s)...", limit)
+        # La paginación solo necesita la clave (created_at, id)
+        page = self.place_repo.get_page(limit, cursor, options=(load_only(Place.id, Place.created_at),))
+        place_ids = [place.id for place in page.items]
+        bodies = place_documents.get_many(place_ids)
+        return Page([bodies[place_id] for place_id in place_ids if place_id in bodies],
+                    page.next_cursor, page.prev_cursor)
+
+    def search_places(self, filters, limit=None):
+        """
+        Busca lugares filtrando en SQL (no en Python). Filtros soportados:
+        min_price, max_price, min_lat, max_lat, min_lon, max_lon,
+        amenities (lista de IDs, todas requeridas), min_rating, q (texto
+        completo sobre title/description) y sort (una de PLACE_SORT_OPTIONS;
+        por defecto 'relevance' si hay `q` y 'newest' si no).
+        """
+        logger.debug("Buscando lugares con filtros: %s", filters)
+        query = Place.query.options(*PLACE_LOAD_OPTIONS)
+
+        if filters.get('min_price') is not None:
+            query = query.filter(Place.price >= filters['min_price'])
+        if filters.get('max_price') is not None:
+            query = query.filter(Place.price <= filters['max_price'])
+        if filters.get('min_lat') is not None:
+            query = query.filter(Place.latitude >= filters['min_lat'])
+        if filters.get('max_lat') is not None:
+            query = query.filter(Place.latitude <= filters['max_lat'])
+        if filters.get('min_lon') is not None:
+            query = query.filter(Place.longitude >= filters['min_lon'])
+        if filters.get('max_lon') is not None:
+            query = query.filter(Place.longitude <= filters['max_lon'])
+
+        # Cada amenity requerida es un EXISTS sobre la clave (place_id, amenity_id)
+        for amenity_id in set(filters.get('amenities') or []):
+            query = query.filter(exists().where(place_amenity.c.place_id == Place.id,
+                                                place_amenity.c.amenity_id == amenity_id))
 
+        text_query = (filters.get('q') or '').strip()
+        snippet = None
+        if text_query:
+            query, rank, snippet = fulltext.apply_search(query, text_query, db.engine.dialect.name)
+            if snippet is not None:
+                query = query.add_columns(snippet)
+
+        sort = filters.get('sort') or ('relevance' if text_query else 'newest')
+        if sort not in PLACE_SORT_OPTIONS:
+            raise ValueError(f"sort must be one of: {', '.join(PLACE_SORT_OPTIONS)}")
+        if sort == 'relevance':
+            if not text_query:
+                raise ValueError("sort=relevance requires q")
+            if rank is not None:
+                query = query.order_by(rank)
+
+        # El rating usa los agregados guardados en places (sin leer reviews)
+        if filters.get('min_rating') is not None:
+            query = query.filter(Place.review_count > 0,
+                                 Place.rating_sum >= filters['min_rating'] * Place.review_count)
+        if sort == 'rating':
+            average = Place.rating_sum * 1.0 / func.nullif(Place.review_count, 0)
+            query = query.order_by(func.coalesce(average, 0).desc())
+
+        query = query.order_by(*PLACE_SORT_OPTIONS[sort])
+        if limit:
+            query = query.limit(limit)
+
+        if not text_query:
+            return [place.to_dict() for place in query.all()]
+
+        results = []
+        for row in query.all():
+            place, fragment = (row[0], row[1]) if snippet is not None else (row, None)
+            place_dict = place.to_dict()
+            # MySQL no tiene snippet(): el fragmento se arma en Python
+            place_dict['snippet'] = fragment or fulltext.highlight(place.description or place.title, text_query)
+            results.append(place_dict)
+        return results
+
+    def get_nearby_places(self, latitude, longitude, radius_km, limit=None):
+        """
+        Obtiene los lugares a menos de `radius_km` del punto, ordenados por
+        distancia. Las celdas geohash que cubren el círculo podan los
+        candidatos con el índice ix_places_geohash; luego se aplica la
+        distancia exacta (haversine) solo a esos candidatos.
+        """
+        logger.debug("Buscando lugares a %s km de (%s, %s)", radius_km, latitude, longitude)
+        # select() de Core: los candidatos son tuplas, no filas del ORM
+        candidates = select(Place.id, Place.latitude, Place.longitude)
+        cells = geohash.covering_cells(latitude, longitude, radius_km)
+        if cells:
+            # Rango [celda, celda + '{') == todos los geohash con ese prefijo
+            candidates = candidates.where(or_(*[
+                and_(Place.geohash >= cell, Place.geohash < cell + '{') for cell in cells
+            ]))
+
+        # Descarte aproximado (solo aritmética) evaluado sobre el mismo índice de
+        # cobertura; no se usa cerca del antimeridiano ni con radios grandes.
+        min_lon, max_lon = geohash.bounding_box(latitude, longitude, radius_km)[2:]
+        if -180.0 <= min_lon and max_lon <= 180.0 and radius_km <= geohash.PLANAR_MAX_RADIUS_KM:
+            km_lat, km_lon = geohash.planar_scale(latitude, radius_km)
+            dlat = (Place.latitude - latitude) * km_lat
+            dlon = (Place.longitude - longitude) * km_lon
+            candidates = candidates.where(dlat * dlat + dlon * dlon <= radius_km * radius_km)
+
+        hits = []
+        for place_id, lat, lon in db.session.execute(candidates).all():
+            distance = geohash.haversine_km(latitude, longitude, lat, lon)
+            if distance <= radius_km:
+                hits.append((distance, place_id))
+        hits.sort()
+        if limit:
+            hits = hits[:limit]
+        if not hits:
+            return []
+
+        places = Place.query.options(*PLACE_LOAD_OPTIONS).filter(
+            Place.id.in_([place_id for _, place_id in hits])).all()
+        by_id = {place.id: place for place in places}
+        results = []
+        for distance, place_id in hits:
+            place_dict = by_id[place_id].to_dict()
+            place_dict['distance_km'] = round(distance, 3)
+            results.append(place_dict)
+        return results
+
+    @transactional
     def update_place(self, place_id, user_id, data):
-        print(f"[FACADE] Actualizando lugar ID: {place_id}")
+        logger.debug("Actualizando lugar ID: %s", place_id)
         place = self.place_repo.get(place_id)
         if not place:
-            print("[FACADE] Error: Lugar no encontrado para actualizar")
+            logger.info("Error: Lugar no encontrado para actualizar")
             return None
 
         if place.user_id != user_id:
-            print("[FACADE] Error: Solo el propietario puede actualizar")
+            logger.info("Error: Solo el propietario puede actualizar")
             return None
 
         for key, value in data.items():
             if hasattr(place, key):
                 setattr(place, key, value)
 
-        print(f"[FACADE] Lugar '{place.title}' actualizado correctamente")
+        self._invalidate_places([place_id])
+        logger.info("Lugar '%s' actualizado correctamente", place.title)
         return place.to_dict()
 
+    @transactional
     def delete_place(self, place_id, user_id):
-        print(f"[FACADE] Eliminando lugar ID: {place_id}")
+        logger.debug("Eliminando lugar ID: %s", place_id)
         place = self.place_repo.get(place_id)
         if not place:
-            print("[FACADE] Error: Lugar no encontrado para eliminar")
+            logger.info("Error: Lugar no encontrado para eliminar")
             return False
 
         if place.user_id != user_id:
-            print("[FACADE] Error: Solo el propietario puede eliminar")
+            logger.info("Error: Solo el propietario puede eliminar")
             return False
 
         self.place_repo.delete(place_id)
-        print("[FACADE] Lugar eliminado exitosamente")
+        self._invalidate_places([place_id])
+        logger.info("Lugar eliminado exitosamente")
         return True
     
     # --------------- REVIEWS ---------------
     def get_review_by_user_and_place(self, user_id, place_id):
-        print(f"[FACADE] Buscando reseña para user_id={user_id} y place_id={place_id}")
-        return next((review.to_dict() for review in self.review_repo.get_all()
-                    if review.user_id == user_id and review.place_id == place_id), None)
+        """Indica si el usuario ya reseñó el lugar (consulta EXISTS sobre uq_reviews_user_place)."""
+        logger.debug("Buscando reseña para user_id=%s y place_id=%s", user_id, place_id)
+        return self.review_repo.exists(user_id=user_id, place_id=place_id)
 
+    @transactional
     def create_review(self, data):
-        print("[FACADE] Creando reseña...")
+        logger.debug("Creando reseña...")
 
         user = self.user_repo.get(data['user_id'])
         place = self.place_repo.get(data['place_id'])
@@ -174,9 +419,6 @@ class HBnBFacade:
         if place.user_id == user.id:
             raise ValueError("[FACADE] No puedes reseñar tu propio lugar")
 
-        if self.get_review_by_user_and_place(user.id, place.id):
-            raise ValueError("[FACADE] Ya has reseñado este lugar")
-
         if not (1 <= data['rating'] <= 5):
             raise ValueError("[FACADE] La calificación debe ser entre 1 y 5")
 
@@ -187,16 +429,51 @@ class HBnBFacade:
             user=user
         )
 
-        self.review_repo.add(review)
-        print("[FACADE] Reseña creada exitosamente")
+        # Los agregados del lugar se actualizan en la misma transacción. Las
+        # reseñas duplicadas las rechaza uq_reviews_user_place en el flush;
+        # el savepoint deshace solo este intento, no la unidad de trabajo.
+        try:
+            with db.session.begin_nested():
+                self._update_place_ratings(place.id, new_rating=review.rating)
+                self.review_repo.add(review)
+        except IntegrityError as e:
+            if not _is_duplicate_review(e):
+                raise
+            raise DuplicateReviewError("[FACADE] Ya has reseñado este lugar")
+        self._invalidate_places([place.id])
+        logger.info("Reseña creada exitosamente")
+        return review.to_dict()
+
+    @transactional
+    def update_review(self, review_id, data):
+        logger.debug("Actualizando reseña ID: %s", review_id)
+        review = self.review_repo.get(review_id)
+        if not review:
+            logger.info("Error: Reseña no encontrada")
+            return None
+
+        if 'text' in data:
+            if not isinstance(data['text'], str) or not data['text'].strip():
+                raise ValueError("[FACADE] El texto de la reseña es obligatorio")
+            review.text = data['text'].strip()
+
+        if 'rating' in data and data['rating'] != review.rating:
+            if not isinstance(data['rating'], int) or not (1 <= data['rating'] <= 5):
+                raise ValueError("[FACADE] La calificación debe ser entre 1 y 5")
+            self._update_place_ratings(review.place_id, old_rating=review.rating, new_rating=data['rating'])
+            review.rating = data['rating']
+
+        db.session.flush()
+        self._invalidate_places([review.place_id])
+        logger.info("Reseña actualizada correctamente.")
         return review.to_dict()
 
     def get_reviews_by_place(self, place_id):
         """Obtiene todas las reseñas de un lugar, incluyendo el nombre del usuario."""
-        reviews = []
-        for review in self.review_repo.get_all():
-            if review.place_id == place_id:
-                user = self.user_repo.get(review.user_id)
+        def load():
+            reviews = []
+            for review in self.review_repo.filter_by(options=REVIEW_LOAD_OPTIONS, place_id=place_id):
+                user = review.user
                 review_data = {
                     "id": review.id,
                     "created_at": review.created_at,
@@ -208,75 +485,567 @@ class HBnBFacade:
                     "user_name": f"{user.first_name} {user.last_name}" if user else "Unknown"
                 }
                 reviews.append(review_data)
-        return reviews
+            return reviews
+        return get_cache().get_or_set(f'place_reviews:{place_id}', load)
+
+    def get_all_reviews(self):
+        logger.debug("Obteniendo todas las reseñas...")
+        return [review.to_dict() for review in self.review_repo.get_all(options=REVIEW_LOAD_OPTIONS)]
+
+    def iter_reviews(self, batch_size=STREAM_BATCH_SIZE):
+        """Generador con todas las reseñas (dicts) en lotes, para listados en streaming."""
+        logger.debug("Recorriendo todas las reseñas en lotes de %s...", batch_size)
+        for reviews in self.review_repo.iter_batches(batch_size, options=REVIEW_LOAD_OPTIONS):
+            yield [review.to_dict() for review in reviews]
+
+    def get_reviews_page(self, limit, cursor=None):
+        logger.debug("Obteniendo página de reseñas (limit=%s)...", limit)
+        return self._get_page(self.review_repo, limit, cursor, options=REVIEW_LOAD_OPTIONS)
 
     def get_review(self, review_id):
-        print(f"[FACADE] Buscando reseña ID: {review_id}")
-        review = self.review_repo.get(review_id)
+        logger.debug("Buscando reseña ID: %s", review_id)
+        review = self.review_repo.get(review_id, options=REVIEW_LOAD_OPTIONS)
         return review.to_dict() if review else None
 
+    @transactional
     def delete_review(self, review_id):
-        print(f"[FACADE] Eliminando reseña ID: {review_id}")
+        logger.debug("Eliminando reseña ID: %s", review_id)
         review = self.review_repo.get(review_id)
         if not review:
-            print("[FACADE] Error: Reseña no encontrada")
+            logger.info("Error: Reseña no encontrada")
             return False
 
+        self._update_place_ratings(review.place_id, old_rating=review.rating)
         self.review_repo.delete(review_id)
-        print("[FACADE] Reseña eliminada correctamente.")
+        self._invalidate_places([review.place_id])
+        logger.info("Reseña eliminada correctamente.")
         return True
 
+    def _update_place_ratings(self, place_id, old_rating=None, new_rating=None):
+        """
+        Ajusta review_count, rating_sum y el histograma del lugar con un
+        UPDATE atómico (columna = columna + delta) en la transacción en curso.
+        """
+        if old_rating == new_rating:
+            return
+        values = {}
+        count_delta = (new_rating is not None) - (old_rating is not None)
+        if count_delta:
+            values['review_count'] = Place.review_count + count_delta
+        values['rating_sum'] = Place.rating_sum + ((new_rating or 0) - (old_rating or 0))
+        if old_rating is not None:
+            column = getattr(Place, f'rating_hist_{old_rating}')
+            values[column.key] = column - 1
+        if new_rating is not None:
+            column = getattr(Place, f'rating_hist_{new_rating}')
+            values[column.key] = column + 1
+        db.session.execute(update(Place).where(Place.id == place_id).values(**values))
+
+    @transactional
+    def recompute_place_ratings(self):
+        """
+        Recalcula los agregados de rating de todos los lugares a partir de
+        la tabla reviews con una sola consulta agrupada. Devuelve cuántos
+        lugares con reviews se actualizaron.
+        """
+        logger.debug("Recalculando agregados de rating...")
+        rows = db.session.execute(
+            select(Review.place_id, func.count(), func.sum(Review.rating),
+                   *[func.sum(case((Review.rating == r, 1), else_=0)) for r in range(1, 6)])
+            .group_by(Review.place_id)
+        ).all()
+
+        # Lugares que ya no tienen reviews vuelven a cero
+        db.session.execute(
+            update(Place)
+            .where(Place.review_count != 0, ~exists().where(Review.place_id == Place.id))
+            .values(review_count=0, rating_sum=0, rating_hist_1=0, rating_hist_2=0,
+                    rating_hist_3=0, rating_hist_4=0, rating_hist_5=0),
+            execution_options={'synchronize_session': False}
+        )
+        if rows:
+            db.session.execute(update(Place), [
+                {'id': place_id, 'review_count': count, 'rating_sum': total,
+                 **{f'rating_hist_{r}': hist[r - 1] for r in range(1, 6)}}
+                for place_id, count, total, *hist in rows
+            ])
+        # Puede haber cambiado cualquier lugar
+        get_cache().clear()
+        place_documents.clear()
+        versions.bump(db.session, versions.PLACES)
+        logger.info("Agregados recalculados para %s lugares", len(rows))
+        return len(rows)
+
     def get_place_by_id(self, place_id):
         """Obtiene un lugar por su ID."""
-        place = self.place_repo.get(place_id)
-        if not place:
-            return None
+        def load():
+            place = self.place_repo.get(place_id, options=PLACE_LOAD_OPTIONS)
+            if not place:
+                return None
+
+            place_dict = place.to_dict()
+            reviews = self.get_reviews_by_place(place_id)
+            place_dict["reviews"] = reviews
+            return place_dict
+        return get_cache().get_or_set(f'place_detail:{place_id}', load)
 
-        place_dict = place.to_dict()
-        reviews = self.get_reviews_by_place(place_id)
-        place_dict["reviews"] = reviews
-        return place_dict
+    def _invalidate_places(self, place_ids):
+        """
+        Quita de la caché todo lo cacheado de esos lugares (detalle y
+        reseñas), marca sus documentos materializados para reconstruirlos y
+        sube la versión de los listados.
+        """
+        keys = [f'{prefix}:{place_id}' for place_id in place_ids for prefix in PLACE_CACHE_PREFIXES]
+        if keys:
+            get_cache().invalidate(*keys)
+            # Cambió el listado de lugares o de reseñas (ETag de get_listing_validator)
+            versions.bump(db.session, versions.PLACES)
+        place_documents.mark_stale(place_ids)
+
+    def _places_of_user(self, user_id):
+        """IDs de los lugares donde aparece el usuario: los suyos y los que reseñó."""
+        return db.session.scalars(select(Place.id).where(Place.user_id == user_id)
+                                  .union(select(Review.place_id).where(Review.user_id == user_id))).all()
+
+    def _places_with_amenity(self, amenity_id):
+        """IDs de los lugares que tienen la amenity."""
+        return db.session.scalars(select(place_amenity.c.place_id)
+                                  .where(place_amenity.c.amenity_id == amenity_id)).all()
 
 
     # --------------- AMENITIES ---------------
+    @transactional
     def create_amenity(self, data):
-        print("[FACADE] Creando amenidad...")
+        logger.debug("Creando amenidad...")
         if 'name' not in data or not data['name'].strip():
             raise ValueError("[FACADE] El nombre de la amenidad es obligatorio")
 
-        existing = self.amenity_repo.get_all()
-        if any(a.name == data['name'] for a in existing):
+        # Chequeo en memoria contra el catálogo (sin cargar la tabla)
+        if amenity_catalog.current().id_for_name(data['name']):
             raise ValueError("[FACADE] La amenidad ya existe")
 
         amenity = Amenity(name=data['name'])
         self.amenity_repo.add(amenity)
-        print("[FACADE] Amenidad creada exitosamente")
+        logger.info("Amenidad creada exitosamente")
         return amenity.to_dict()
 
     def get_amenity(self, amenity_id):
-        print(f"[FACADE] Buscando amenidad ID: {amenity_id}")
-        amenity = self.amenity_repo.get(amenity_id)
-        return amenity.to_dict() if amenity else None
+        logger.debug("Buscando amenidad ID: %s", amenity_id)
+        return amenity_catalog.current().get(amenity_id)
 
     def get_all_amenities(self):
-        print("[FACADE] Obteniendo todas las amenidades...")
-        return [amenity.to_dict() for amenity in self.amenity_repo.get_all()]
+        logger.debug("Obteniendo todas las amenidades...")
+        return amenity_catalog.current().all()
 
+    def get_amenities_page(self, limit, cursor=None):
+        logger.debug("Obteniendo página de amenidades (limit=%s)...", limit)
+        return amenity_catalog.current().page(limit, cursor)
+
+    @transactional
     def update_amenity(self, amenity_id, data):
-        print(f"[FACADE] Actualizando amenidad ID: {amenity_id}")
+        logger.debug("Actualizando amenidad ID: %s", amenity_id)
         amenity = self.amenity_repo.get(amenity_id)
         if not amenity:
-            print("[FACADE] Error: Amenidad no encontrada")
+            logger.info("Error: Amenidad no encontrada")
             return None
 
         if 'name' in data and data['name'].strip():
             amenity.name = data['name']
+            self._invalidate_places(self._places_with_amenity(amenity_id))
 
         return amenity.to_dict()
 
+    @transactional
     def delete_amenity(self, amenity_id):
-        print(f"[FACADE] Eliminando amenidad ID: {amenity_id}")
-        return self.amenity_repo.delete(amenity_id)
+        logger.debug("Eliminando amenidad ID: %s", amenity_id)
+        if not self.amenity_repo.get(amenity_id):
+            logger.info("Error: Amenidad no encontrada")
+            return False
+        self._invalidate_places(self._places_with_amenity(amenity_id))
+        self.amenity_repo.delete(amenity_id)
+        return True
+
+    # --------------- CARGA MASIVA ---------------
+    # Cada método valida elemento por elemento con las reglas del modelo,
+    # inserta los válidos con add_many (insert() de Core por lotes) y
+    # devuelve {'created': [ids], 'errors': [{'index', 'error'}]}.
+
+    @transactional
+    def create_places_bulk(self, items, user_id):
+        logger.debug("Creando %s lugares en lote...", len(items))
+        if not self.user_repo.get(user_id):
+            raise ValueError("[FACADE] Error: Usuario propietario no encontrado")
+
+        catalog = amenity_catalog.current()
+        known_amenities = {a for item in items if isinstance(item, dict)
+                           for a in (item.get('amenities') or []) if isinstance(a, str) and catalog.get(a)}
+
+        rows, links, errors = [], [], []
+        for index, item in enumerate(items):
+            try:
+                row = _place_row(item, user_id)
+                amenity_ids = item.get('amenities') or []
+                if not isinstance(amenity_ids, list) or not all(isinstance(a, str) for a in amenity_ids):
+                    raise ValueError("amenities debe ser una lista de IDs")
+                missing = [a for a in amenity_ids if a not in known_amenities]
+                if missing:
+                    raise ValueError(f"Amenity no encontrada: {missing[0]}")
+            except ValueError as e:
+                errors.append({'index': index, 'error': str(e)})
+                continue
+            rows.append(row)
+            links.extend({'place_id': row['id'], 'amenity_id': a} for a in set(amenity_ids))
+
+        # Un solo commit para todo el lote (ver add_many): los lugares, sus
+        # amenities y el índice de texto completo, que se actualiza una vez
+        with fulltext.deferred_index(db.session):
+            self.place_repo.add_many(rows)
+        for chunk in _chunked(links):
+            db.session.execute(insert(place_amenity), chunk)
+        if rows:
+            versions.bump(db.session, versions.PLACES)
+        logger.info("%s lugares creados, %s con errores", len(rows), len(errors))
+        return {'created': [row['id'] for row in rows], 'errors': errors}
+
+    @transactional
+    def create_amenities_bulk(self, items):
+        logger.debug("Creando %s amenidades en lote...", len(items))
+        taken = set(amenity_catalog.current().names())
+
+        rows, errors = [], []
+        for index, item in enumerate(items):
+            try:
+                if not isinstance(item, dict) or not isinstance(item.get('name'), str) \
+                        or not item['name'].strip():
+                    raise ValueError("El nombre de la amenidad es obligatorio")
+                name = Amenity.validate_string(item['name'], 50)
+                if name in taken:
+                    raise ValueError("La amenidad ya existe")
+            except ValueError as e:
+                errors.append({'index': index, 'error': str(e)})
+                continue
+            taken.add(name)
+            rows.append({'id': str(uuid.uuid4()), 'name': name})
+
+        self.amenity_repo.add_many(rows)
+        if rows:
+            amenity_catalog.bump()
+        logger.info("%s amenidades creadas, %s con errores", len(rows), len(errors))
+        return {'created': [row['id'] for row in rows], 'errors': errors}
+
+    @transactional
+    def create_users_bulk(self, items):
+        """Usuarios nuevos; `password` puede venir en texto (se hashea con bcrypt) o ya hasheada."""
+        logger.debug("Creando %s usuarios en lote...", len(items))
+        emails = {item['email'].strip().lower() for item in items
+                  if isinstance(item, dict) and isinstance(item.get('email'), str)}
+        taken = _existing_values(func.lower(User.email), emails)
+
+        rows, errors = [], []
+        for index, item in enumerate(items):
+            try:
+                if not isinstance(item, dict):
+                    raise ValueError("Cada elemento debe ser un objeto")
+                email = User._validate_email((item.get('email') or '').strip())
+                if email in taken:
+                    raise ValueError("Email already registered")
+                row = {
+                    'id': str(uuid.uuid4()),
+                    'first_name': User._validate_string(item.get('first_name'), 50),
+                    'last_name': User._validate_string(item.get('last_name'), 50),
+                    'email': email,
+                    'password': User.hash_password(item.get('password')),
+                    'is_admin': bool(item.get('is_admin', False)),
+                }
+            except ValueError as e:
+                errors.append({'index': index, 'error': str(e)})
+                continue
+            taken.add(email)
+            rows.append(row)
+
+        self.user_repo.add_many(rows)
+        logger.info("%s usuarios creados, %s con errores", len(rows), len(errors))
+        return {'created': [row['id'] for row in rows], 'errors': errors}
+
+    @transactional
+    def import_places_bulk(self, items):
+        """
+        Lugares de una importación: cada uno trae su `id`, el email de su
+        dueño (`owner_email`) y los nombres de sus amenities, resueltos en
+        bloque. Los IDs que ya existen se omiten (`skipped`), así que
+        reimportar un lote ya confirmado no duplica lugares.
+        """
+        logger.debug("Importando %s lugares...", len(items))
+        dicts = [item for item in items if isinstance(item, dict)]
+        emails = {item['owner_email'].strip().lower() for item in dicts if isinstance(item.get('owner_email'), str)}
+        owners = {}
+        for chunk in _chunked(sorted(emails)):
+            owners.update(db.session.execute(
+                select(func.lower(User.email), User.id).where(func.lower(User.email).in_(chunk))).all())
+        catalog = amenity_catalog.current()
+        amenities = {name: catalog.id_for_name(name) for item in dicts if isinstance(item.get('amenities'), list)
+                     for name in item['amenities'] if isinstance(name, str) and catalog.id_for_name(name)}
+        imported = _existing_values(Place.id, {item['id'] for item in dicts if isinstance(item.get('id'), str)})
+
+        rows, links, errors, skipped = [], [], [], 0
+        for index, item in enumerate(items):
+            if isinstance(item, dict) and isinstance(item.get('id'), str) and item['id'] in imported:
+                skipped += 1
+                continue
+            try:
+                if not isinstance(item, dict) or not isinstance(item.get('id'), str):
+                    raise ValueError("Cada elemento debe ser un objeto con id")
+                email = item.get('owner_email')
+                owner_id = owners.get(email.strip().lower()) if isinstance(email, str) else None
+                if not owner_id:
+                    raise ValueError(f"Usuario propietario no encontrado: {item.get('owner_email')}")
+                amenity_names = item.get('amenities') or []
+                if not isinstance(amenity_names, list) or not all(isinstance(n, str) for n in amenity_names):
+                    raise ValueError("amenities debe ser una lista de nombres")
+                missing = [n for n in amenity_names if n not in amenities]
+                if missing:
+                    raise ValueError(f"Amenity no encontrada: {missing[0]}")
+                row = _place_row(item, owner_id)
+            except ValueError as e:
+                errors.append({'index': index, 'error': str(e)})
+                continue
+            row['id'] = item['id']
+            imported.add(row['id'])
+            rows.append(row)
+            links.extend({'place_id': row['id'], 'amenity_id': amenities[n]} for n in set(amenity_names))
+
+        with fulltext.deferred_index(db.session):
+            self.place_repo.add_many(rows)
+        for chunk in _chunked(links):
+            db.session.execute(insert(place_amenity), chunk)
+        if rows:
+            versions.bump(db.session, versions.PLACES)
+        logger.info("%s lugares importados, %s ya existían, %s con errores", len(rows), skipped, len(errors))
+        return {'created': [row['id'] for row in rows], 'errors': errors, 'skipped': skipped}
+
+    @transactional
+    def create_reviews_bulk(self, items, user_id):
+        """Las reseñas son del usuario `user_id`; los agregados de cada lugar se ajustan una vez."""
+        logger.debug("Creando %s reseñas en lote...", len(items))
+        if not self.user_repo.get(user_id):
+            raise ValueError("[FACADE] Usuario inválido")
+
+        place_ids = {item['place_id'] for item in items
+                     if isinstance(item, dict) and isinstance(item.get('place_id'), str)}
+        owners = {}
+        for chunk in _chunked(sorted(place_ids)):
+            owners.update(db.session.execute(
+                select(Place.id, Place.user_id).where(Place.id.in_(chunk))).all())
+        reviewed = set()
+        for chunk in _chunked(sorted(owners)):
+            reviewed.update(db.session.scalars(select(Review.place_id).where(
+                Review.user_id == user_id, Review.place_id.in_(chunk))))
+
+        rows, errors, deltas = [], [], {}
+        for index, item in enumerate(items):
+            try:
+                if not isinstance(item, dict):
+                    raise ValueError("Cada elemento debe ser un objeto")
+                place_id = item.get('place_id')
+                if not isinstance(place_id, str) or place_id not in owners:
+                    raise ValueError("Place not found")
+                if owners[place_id] == user_id:
+                    raise ValueError("No puedes reseñar tu propio lugar")
+                if place_id in reviewed:
+                    raise ValueError("Ya has reseñado este lugar")
+                text = Review.validate_text(item.get('text'))
+                rating = Review.validate_rating(item.get('rating'))
+            except ValueError as e:
+                errors.append({'index': index, 'error': str(e)})
+                continue
+            reviewed.add(place_id)
+            rows.append({'id': str(uuid.uuid4()), 'text': text, 'rating': rating,
+                         'place_id': place_id, 'user_id': user_id})
+            delta = deltas.setdefault(place_id, [0] * 6)  # [count, hist_1..hist_5]
+            delta[0] += 1
+            delta[rating] += 1
+
+        # La consulta de arriba no ve una reseña que otra petición confirme
+        # mientras tanto: uq_reviews_user_place la rechaza y el lote entero
+        # falla (el savepoint no deja agregados a medias)
+        try:
+            with db.session.begin_nested():
+                self.review_repo.add_many(rows)
+                self._add_place_rating_deltas(deltas)
+        except IntegrityError as e:
+            if not _is_duplicate_review(e):
+                raise
+            raise DuplicateReviewError("[FACADE] Otra petición creó una de estas reseñas mientras se procesaba el lote")
+        self._invalidate_places(deltas)
+        logger.info("%s reseñas creadas, %s con errores", len(rows), len(errors))
+        return {'created': [row['id'] for row in rows], 'errors': errors}
+
+    def _add_place_rating_deltas(self, deltas):
+        """
+        Suma a los agregados de cada lugar sus nuevas reseñas con un solo
+        UPDATE executemany. `deltas` es {place_id: [count, hist_1..hist_5]}.
+        """
+        if not deltas:
+            return
+        places = Place.__table__
+        values = {
+            'review_count': places.c.review_count + bindparam('d_count'),
+            'rating_sum': places.c.rating_sum + bindparam('d_sum'),
+        }
+        for r in range(1, 6):
+            values[f'rating_hist_{r}'] = places.c[f'rating_hist_{r}'] + bindparam(f'd_hist_{r}')
+        statement = update(places).where(places.c.id == bindparam('d_id')).values(**values)
+        params = [{'d_id': place_id, 'd_count': delta[0],
+                   'd_sum': sum(r * delta[r] for r in range(1, 6)),
+                   **{f'd_hist_{r}': delta[r] for r in range(1, 6)}}
+                  for place_id, delta in deltas.items()]
+        for chunk in _chunked(params):
+            db.session.execute(statement, chunk)
+
+    # --------------- EXPORTACIÓN ---------------
+    def export_batches(self, resource, after=None, batch_size=EXPORT_BATCH_SIZE):
+        """
+        Generador con toda la tabla `resource` (una de EXPORT_COLUMNS) en
+        lotes de `batch_size` dicts, ordenada por id. Lee con un cursor del
+        lado del servidor (yield_per) en una conexión propia, así que la
+        memoria no crece con la tabla. `after` reanuda tras ese id.
+        """
+        if resource not in EXPORT_COLUMNS:
+            raise ValueError(f"resource must be one of: {', '.join(EXPORT_COLUMNS)}")
+        logger.debug("Exportando %s (after=%s)...", resource, after)
+        model, names = EXPORT_COLUMNS[resource]
+        statement = select(*[getattr(model, name) for name in names]).order_by(model.id)
+        if after:
+            statement = statement.where(model.id > after)
+
+        with db.engine.connect() as conn:
+            result = conn.execution_options(yield_per=batch_size).execute(statement)
+            for rows in result.partitions():
+                batch = [{name: _export_value(value) for name, value in row._mapping.items()} for row in rows]
+                if resource == 'places':
+                    self._add_export_place_fields(batch)
+                yield batch
+
+    def _add_export_place_fields(self, batch):
+        """Agrega a cada lugar del lote su promedio, histograma e IDs de amenities."""
+        amenity_ids = {}
+        # Consulta en la sesión (otra conexión): con un cursor del servidor de
+        # MySQL no se puede consultar por la conexión que está leyendo
+        for place_id, amenity_id in db.session.execute(
+                select(place_amenity.c.place_id, place_amenity.c.amenity_id)
+                .where(place_amenity.c.place_id.in_([place['id'] for place in batch]))):
+            amenity_ids.setdefault(place_id, []).append(amenity_id)
+        for place in batch:
+            count = place['review_count']
+            place['average_rating'] = round(place['rating_sum'] / count, 2) if count else None
+            place['rating_histogram'] = {str(r): place.pop(f'rating_hist_{r}') for r in range(1, 6)}
+            place['amenities'] = sorted(amenity_ids.get(place['id'], []))
+
+    # --------------- VALIDADORES (GET condicional) ---------------
+    # Cada validador es (partes, última modificación): las partes forman el
+    # ETag y salen de una consulta de agregados o de un contador, sin cargar
+    # ni serializar los objetos. None si el recurso no existe.
+
+    def get_place_validator(self, place_id):
+        """Validador del detalle de un lugar: el lugar, su dueño, sus reseñas (y autores) y sus amenities."""
+        owner, reviewer = aliased(User), aliased(User)
+        on_place = Review.place_id == place_id
+        linked = place_amenity.c.place_id == place_id
+        row = db.session.execute(select(
+            Place.updated_at, owner.updated_at,
+            select(func.count()).where(on_place).scalar_subquery(),
+            select(func.max(Review.updated_at)).where(on_place).scalar_subquery(),
+            select(func.max(reviewer.updated_at)).join(Review, Review.user_id == reviewer.id)
+            .where(on_place).scalar_subquery(),
+            select(func.count()).select_from(place_amenity).where(linked).scalar_subquery(),
+            select(func.max(Amenity.updated_at)).join(place_amenity, place_amenity.c.amenity_id == Amenity.id)
+            .where(linked).scalar_subquery(),
+        ).join(owner, owner.id == Place.user_id).where(Place.id == place_id)).first()
+        if row is None:
+            return None
+        return ('place', place_id, *row), _latest(row)
+
+    def get_review_validator(self, review_id):
+        """Validador de una reseña: la reseña y su autor (user_name)."""
+        row = db.session.execute(select(Review.updated_at, User.updated_at)
+                                 .join(User, User.id == Review.user_id).where(Review.id == review_id)).first()
+        if row is None:
+            return None
+        return ('review', review_id, *row), _latest(row)
+
+    def get_listing_validator(self, resource):
+        """
+        Validador de los listados de 'places' o 'reviews': la versión
+        versions.PLACES, que sube toda escritura que afecta a un lugar (en
+        su transacción), así que detecta también borrados. Sin fecha: un
+        máximo de updated_at no vería las filas borradas.
+        """
+        return (resource, versions.read(db.session, versions.PLACES)), None
+
+    def get_amenity_validator(self, amenity_id):
+        """Validador de una amenity, desde el catálogo en memoria."""
+        amenity = amenity_catalog.current().get(amenity_id)
+        if amenity is None:
+            return None
+        updated_at = datetime.fromisoformat(amenity['updated_at']) if amenity['updated_at'] else None
+        return ('amenity', amenity_id, amenity['name'], amenity['updated_at']), updated_at
+
+    def get_amenities_validator(self):
+        """Validador del listado de amenities: la versión del catálogo."""
+        return ('amenities', amenity_catalog.current().version), None
+
+    # --------------- PAGINACIÓN ---------------
+    def _get_page(self, repo, limit, cursor, options=()):
+        """Obtiene una página del repositorio y serializa sus objetos."""
+        page = repo.get_page(limit, cursor, options=options)
+        return Page([obj.to_dict() for obj in page.items], page.next_cursor, page.prev_cursor)
+
+def _chunked(values, size=BULK_CHUNK_SIZE):
+    """Parte una secuencia en listas de `size` (para IN y executemany acotados)."""
+    values = list(values)
+    return [values[i:i + size] for i in range(0, len(values), size)]
+
+
+def _existing_values(column, values):
+    """Devuelve cuáles de `values` ya existen en `column` (consultas IN por lotes)."""
+    found = set()
+    for chunk in _chunked(sorted(values)):
+        found.update(db.session.scalars(select(column).where(column.in_(chunk))))
+    return found
+
+
+def _export_value(value):
+    """Valor exportable a JSON (las fechas van en ISO 8601)."""
+    return value.isoformat() if isinstance(value, datetime) else value
+
+
+def _latest(values):
+    """La fecha más reciente entre `values` (None si no hay ninguna)."""
+    dates = [value for value in values if isinstance(value, datetime)]
+    return max(dates) if dates else None
+
+
+def _place_row(item, user_id):
+    """Valida un lugar de la carga masiva con las reglas de Place y arma su fila."""
+    if not isinstance(item, dict):
+        raise ValueError("Cada elemento debe ser un objeto")
+    for field in ('title', 'price', 'latitude', 'longitude'):
+        if item.get(field) is None:
+            raise ValueError(f"Falta el campo obligatorio '{field}'")
+    latitude = Place.validate_latitude(item['latitude'])
+    longitude = Place.validate_longitude(item['longitude'])
+    return {
+        'id': str(uuid.uuid4()),
+        'title': Place.validate_string(item['title'], 100),
+        'description': Place.validate_string(item.get('description') or "", 500),
+        'price': Place.validate_price(item['price']),
+        'latitude': latitude,
+        'longitude': longitude,
+        # insert() de Core no dispara _set_geohash: se calcula aquí
+        'geohash': geohash.encode(latitude, longitude),
+        'user_id': user_id,
+    }
+
 
 # Crear instancia global
 facade = HBnBFacade()
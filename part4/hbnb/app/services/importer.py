@@ -0,0 +1,181 @@
+import csv
+import hashlib
+import json
+import os
+import uuid
+from itertools import islice
+from app.services.facade import facade
+
+# Importación masiva desde archivos (CSV o NDJSON) para `flask hbnb import`.
+# Los registros se leen en streaming, se validan y se insertan por lotes con
+# los métodos *_bulk de la fachada (un commit por lote), y tras cada commit
+# se guarda un checkpoint para reanudar después de una caída.
+
+# Columnas esperadas por tipo (CSV con encabezado o claves de cada objeto NDJSON):
+#   users:     first_name, last_name, email, password (texto o hash bcrypt), is_admin
+#   amenities: name
+#   places:    title, description, price, latitude, longitude, owner_email,
+#              amenities (nombres; en CSV separados por '|')
+KINDS = ('users', 'amenities', 'places')
+CSV_LIST_SEPARATOR = '|'
+CSV_FLOAT_FIELDS = ('price', 'latitude', 'longitude')
+DEFAULT_CHUNK_SIZE = 1000
+
+
+def detect_format(path):
+    """Formato según la extensión del archivo (.csv o .ndjson/.jsonl)."""
+    extension = os.path.splitext(path)[1].lower()
+    if extension == '.csv':
+        return 'csv'
+    if extension in ('.ndjson', '.jsonl'):
+        return 'ndjson'
+    raise ValueError(f"No se reconoce el formato de {path}: usa --format csv|ndjson")
+
+
+def read_records(path, fmt):
+    """
+    Generador de registros del archivo, sin cargarlo entero. Cada registro
+    es un dict, o un ValueError si la línea no se pudo leer (se informa
+    como error de ese registro sin detener la importación).
+    """
+    with open(path, newline='', encoding='utf-8') as source:
+        if fmt == 'csv':
+            for row in csv.DictReader(source):
+                yield _typed_csv_row(row)
+            return
+        for line in source:
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as e:
+                yield ValueError(f"JSON inválido: {e}")
+                continue
+            yield record if isinstance(record, dict) else ValueError("Cada línea debe ser un objeto JSON")
+
+
+def _typed_csv_row(row):
+    """Convierte los textos del CSV a los tipos que esperan los validadores."""
+    row = {key: value for key, value in row.items() if key is not None}
+    try:
+        for field in CSV_FLOAT_FIELDS:
+            if row.get(field) not in (None, ''):
+                row[field] = float(row[field])
+    except ValueError:
+        return ValueError(f"{field} debe ser un número")
+    if 'is_admin' in row:
+        row['is_admin'] = (row['is_admin'] or '').strip().lower() in ('1', 'true', 'yes', 'si', 'sí')
+    if 'amenities' in row:
+        row['amenities'] = [name.strip() for name in (row['amenities'] or '').split(CSV_LIST_SEPARATOR)
+                            if name.strip()]
+    return row
+
+
+def load_checkpoint(checkpoint_path, source, kind):
+    """Registros ya procesados según el checkpoint (0 si no hay uno para este archivo y tipo)."""
+    if not os.path.exists(checkpoint_path):
+        return 0
+    with open(checkpoint_path, encoding='utf-8') as f:
+        state = json.load(f)
+    if state.get('source') != source or state.get('kind') != kind:
+        raise ValueError(f"El checkpoint {checkpoint_path} es de otra importación")
+    return state['records']
+
+
+def save_checkpoint(checkpoint_path, source, kind, records):
+    """Escribe el checkpoint de forma atómica (archivo temporal + rename)."""
+    tmp_path = checkpoint_path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({'source': source, 'kind': kind, 'records': records}, f)
+    os.replace(tmp_path, checkpoint_path)
+
+
+def source_key(path):
+    """Clave de un archivo según su contenido (sha256), sin cargarlo entero."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return f'sha256:{digest.hexdigest()}'
+
+
+def place_id(source, record_number):
+    """
+    ID determinista de un lugar importado (clave del origen + número de
+    registro): si el proceso cae entre el commit y el checkpoint,
+    reimportar el lote encuentra esos IDs y no duplica los lugares. La
+    clave no depende de la ruta, así que mover o renombrar el archivo (o
+    importarlo desde otro equipo) da los mismos IDs.
+    """
+    return str(uuid.uuid5(uuid.NAMESPACE_URL, f'hbnb-import:{source}#{record_number}'))
+
+
+def import_file(kind, path, fmt=None, chunk_size=DEFAULT_CHUNK_SIZE, checkpoint_path=None, source=None,
+                echo=print):
+    """
+    Importa `path` por lotes de `chunk_size` registros. Reanuda desde el
+    checkpoint si existe y lo borra al terminar. `source` identifica el
+    origen para los IDs de los lugares (por defecto, el hash del contenido
+    del archivo); quien reexporta el mismo origen con cambios puede pasar
+    una clave propia para conservar los IDs. Devuelve un resumen con los
+    registros creados, omitidos (ya importados) y con error.
+    """
+    if kind not in KINDS:
+        raise ValueError(f"kind must be one of: {', '.join(KINDS)}")
+    fmt = fmt or detect_format(path)
+    source = source or source_key(path)
+    checkpoint_path = checkpoint_path or os.path.abspath(path) + '.checkpoint'
+    done = load_checkpoint(checkpoint_path, source, kind)
+    if done:
+        echo(f"Reanudando después de {done} registros (checkpoint {checkpoint_path})")
+
+    summary = {'created': 0, 'skipped': 0, 'errors': 0}
+    records = islice(read_records(path, fmt), done, None)
+    while True:
+        chunk = list(islice(records, chunk_size))
+        if not chunk:
+            break
+        items, unreadable = [], []
+        for offset, record in enumerate(chunk):
+            number = done + offset + 1
+            if isinstance(record, ValueError):
+                unreadable.append((number, str(record)))
+                items.append(None)
+            else:
+                if kind == 'places':
+                    record['id'] = place_id(source, number)
+                items.append(record)
+
+        result = _import_chunk(kind, [item for item in items if item is not None])
+        errors = unreadable + _chunk_errors(result['errors'], items, done)
+        for number, message in sorted(errors):
+            echo(f"registro {number}: {message}")
+        summary['created'] += len(result['created'])
+        summary['skipped'] += result.get('skipped', 0)
+        summary['errors'] += len(errors)
+
+        # El lote ya está confirmado: recién ahora se avanza el checkpoint
+        done += len(chunk)
+        save_checkpoint(checkpoint_path, source, kind, done)
+        echo(f"{done} registros procesados ({summary['created']} creados)")
+
+    if os.path.exists(checkpoint_path):
+        os.remove(checkpoint_path)
+    return summary
+
+
+def _import_chunk(kind, items):
+    """Inserta un lote con el método de la fachada que corresponde (un commit)."""
+    if not items:
+        return {'created': [], 'errors': []}
+    if kind == 'users':
+        return facade.create_users_bulk(items)
+    if kind == 'amenities':
+        return facade.create_amenities_bulk(items)
+    return facade.import_places_bulk(items)
+
+
+def _chunk_errors(errors, items, done):
+    """Traduce los índices de error del lote (solo registros legibles) a números de registro."""
+    numbers = [done + offset + 1 for offset, item in enumerate(items) if item is not None]
+    return [(numbers[error['index']], error['error']) for error in errors]
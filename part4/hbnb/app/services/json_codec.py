@@ -0,0 +1,40 @@
+import json
+import uuid
+from datetime import date, datetime
+
+# Codificador JSON de las respuestas de la API y de los documentos
+# materializados. Usa orjson si está instalado (fechas, UUID y dicts se
+# codifican en C, sin pasar por Python); si no, json de la biblioteca
+# estándar con el mismo formato para fechas y UUID. Las fechas salen en
+# ISO 8601, igual que datetime.isoformat().
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def backend():
+    """Nombre del codificador en uso ('orjson' o 'json')."""
+    return 'orjson' if orjson is not None else 'json'
+
+
+def dumps(data, indent=False):
+    """Codifica `data` a bytes UTF-8 (con `indent`, sangría de 2 espacios)."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(data, default=_default, option=option)
+    return json.dumps(data, default=_stdlib_default, ensure_ascii=False,
+                      indent=2 if indent else None, separators=None if indent else (',', ':')).encode()
+
+
+def _default(value):
+    """Tipos que orjson no conoce (orjson ya codifica datetime y UUID)."""
+    raise TypeError(f"{type(value).__name__} no es serializable a JSON")
+
+
+def _stdlib_default(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    return _default(value)
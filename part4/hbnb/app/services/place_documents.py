@@ -0,0 +1,160 @@
+from datetime import datetime
+from flask import current_app, has_app_context
+from sqlalchemy import delete, event, insert, select
+from sqlalchemy.dialects import mysql, postgresql, sqlite
+from app import db
+from app.models.place import Place
+from app.services import json_codec
+
+# Documentos materializados de lugares (config PLACE_DOCUMENTS): el JSON
+# final de cada lugar, ya codificado, en la tabla place_documents. Las
+# lecturas de /places y /places/<id> concatenan esos bytes en vez de armar
+# Place.to_dict() y volver a pasarlo por place_to_dict.
+#
+# Toda escritura que pasa por HBnBFacade._invalidate_places marca los
+# lugares afectados; antes del commit se borran sus documentos y se
+# reconstruyen en la misma transacción (hasta PLACE_DOCUMENTS_REFRESH_MAX
+# lugares; el resto se arma en la próxima lectura). Los lugares sin
+# documento (cargas masivas, datos previos) se materializan al leerlos.
+# La reconstrucción reemplaza lo que haya (upsert): un lector que armó el
+# documento con los datos previos a la escritura y lo guardó primero no
+# se impone al del escritor. Los rellenos al leer no reemplazan nada.
+# Al activar o desactivar la opción: `flask hbnb rebuild-documents`.
+STALE_KEY = 'place_documents_stale'
+CHUNK_SIZE = 500
+
+place_documents = db.Table(
+    'place_documents',
+    # Sin clave foránea: el documento de un lugar borrado se elimina al confirmar
+    db.Column('place_id', db.String(60), primary_key=True),
+    db.Column('body', db.LargeBinary(length=2**32 - 1), nullable=False),  # LONGBLOB en MySQL
+    db.Column('built_at', db.DateTime, nullable=False, default=datetime.utcnow),
+)
+
+
+def enabled():
+    """True si la aplicación actual sirve lugares desde los documentos materializados."""
+    return has_app_context() and bool(current_app.config.get('PLACE_DOCUMENTS'))
+
+
+def encode(place_dict):
+    """
+    Bytes JSON de Place.to_dict(): json_codec convierte las fechas de las
+    reviews en la misma pasada y el resultado es el que da place_to_dict.
+    """
+    return json_codec.dumps(place_dict)
+
+
+def json_array(bodies):
+    """Concatena documentos ya codificados en un arreglo JSON."""
+    return b'[' + b','.join(bodies) + b']'
+
+
+def mark_stale(place_ids, session=None):
+    """Marca documentos a reconstruir cuando la transacción actual confirme."""
+    if place_ids and enabled():
+        session = session or db.session()
+        session.info.setdefault(STALE_KEY, set()).update(place_ids)
+
+
+def get_many(place_ids, session=None):
+    """
+    Documentos de `place_ids` como {id: bytes} (los lugares que no existen
+    no aparecen). Los que faltan se arman y se guardan; los marcados en la
+    transacción actual se arman sin guardar (el commit los reconstruye).
+    """
+    session = session or db.session()
+    stale = session.info.get(STALE_KEY, set())
+    fresh_ids = [place_id for place_id in place_ids if place_id not in stale]
+    bodies = {}
+    for chunk in _chunked(fresh_ids):
+        bodies.update(session.execute(select(place_documents.c.place_id, place_documents.c.body)
+                                      .where(place_documents.c.place_id.in_(chunk))).all())
+
+    missing = [place_id for place_id in place_ids if place_id not in bodies]
+    if missing:
+        built = _build(session, missing)
+        _store(session, {place_id: body for place_id, body in built.items() if place_id not in stale})
+        bodies.update(built)
+    return bodies
+
+
+def refresh(place_ids, session=None):
+    """Borra los documentos de `place_ids` y los reconstruye (si no son demasiados)."""
+    session = session or db.session()
+    place_ids = list(place_ids)
+    for chunk in _chunked(place_ids):
+        session.execute(delete(place_documents).where(place_documents.c.place_id.in_(chunk)))
+    if len(place_ids) <= current_app.config.get('PLACE_DOCUMENTS_REFRESH_MAX', 500):
+        _store(session, _build(session, place_ids, reload=True), replace=True)
+
+
+def clear(session=None):
+    """Descarta todos los documentos (se vuelven a armar al leerlos)."""
+    session = session or db.session()
+    session.execute(delete(place_documents))
+    session.info.pop(STALE_KEY, None)
+
+
+def _build(session, place_ids, reload=False):
+    """
+    Arma los documentos de los lugares existentes entre `place_ids`. Con
+    `reload` se releen los objetos ya cargados en la sesión: los agregados
+    de rating se actualizan con update() de Core y no los refresca el ORM.
+    """
+    from app.services.facade import PLACE_LOAD_OPTIONS  # La fachada importa este módulo
+    bodies = {}
+    for chunk in _chunked(list(place_ids)):
+        query = select(Place).options(*PLACE_LOAD_OPTIONS).where(Place.id.in_(chunk))
+        if reload:
+            query = query.execution_options(populate_existing=True)
+        for place in session.scalars(query):
+            bodies[place.id] = encode(place.to_dict())
+    return bodies
+
+
+def _store(session, bodies, replace=False):
+    """
+    Inserta documentos. Si otra transacción ya guardó uno, se conserva ese;
+    con `replace` se sobrescribe (reconstrucción tras una escritura).
+    """
+    if not bodies:
+        return
+    table = place_documents
+    dialect = session.get_bind().dialect.name
+    if dialect in ('sqlite', 'postgresql'):
+        statement = (sqlite if dialect == 'sqlite' else postgresql).insert(table)
+        if replace:
+            statement = statement.on_conflict_do_update(
+                index_elements=[table.c.place_id],
+                set_={'body': statement.excluded.body, 'built_at': statement.excluded.built_at})
+        else:
+            statement = statement.on_conflict_do_nothing()
+    elif dialect == 'mysql' and replace:
+        statement = mysql.insert(table)
+        statement = statement.on_duplicate_key_update(body=statement.inserted.body,
+                                                      built_at=statement.inserted.built_at)
+    else:
+        statement = insert(table).prefix_with('IGNORE', dialect='mysql')
+    now = datetime.utcnow()
+    rows = [{'place_id': place_id, 'body': body, 'built_at': now} for place_id, body in bodies.items()]
+    for start in range(0, len(rows), CHUNK_SIZE):
+        session.execute(statement, rows[start:start + CHUNK_SIZE])
+
+
+def _chunked(values):
+    for start in range(0, len(values), CHUNK_SIZE):
+        yield values[start:start + CHUNK_SIZE]
+
+
+@event.listens_for(db.session, 'before_commit')
+def _refresh_stale_documents(session):
+    """Reconstruye, dentro de la transacción que confirma, los documentos marcados."""
+    place_ids = session.info.pop(STALE_KEY, None)
+    if place_ids and enabled():
+        refresh(place_ids, session)
+
+
+@event.listens_for(db.session, 'after_rollback')
+def _discard_stale_marks(session):
+    session.info.pop(STALE_KEY, None)
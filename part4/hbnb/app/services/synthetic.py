@@ -0,0 +1,295 @@
+import math
+import random
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from sqlalchemy import insert, literal, select, text
+from sqlalchemy.schema import CreateIndex, DropIndex
+from app import db
+from app.models import geohash
+from app.models.user import User
+from app.models.place import Place, place_amenity
+from app.models.review import Review
+from app.persistence import amenity_catalog, fulltext, versions
+from app.persistence.unit_of_work import unit_of_work
+from app.services.facade import facade
+
+# Generador de datos sintéticos para pruebas de carga y de escala
+# (`flask hbnb generate`, la suite de tests y los benchmarks). Es
+# determinista: la misma semilla produce los mismos IDs, emails, lugares y
+# reseñas. Escribe con insert() de Core por lotes (sin objetos del ORM) y
+# confirma cada lote en su propia unidad de trabajo, así que la memoria no
+# crece con el tamaño del dataset. Pensado para una base vacía: los emails
+# son user<i>@example.com y el usuario 0 es admin.
+#
+# Para llegar a decenas de millones de reseñas: los IDs crecen (formato
+# UUIDv7), así que cada insert va al final del índice de la clave primaria,
+# y en SQLite los índices secundarios de tablas vacías se crean al final
+# (ordenar una vez es mucho más barato que insertar al azar en el árbol).
+
+# Ciudades (lat, lon, dispersión en grados, precio mediano por noche)
+CITIES = [
+    ('San Juan', 18.4655, -66.1057, 0.08, 120),
+    ('Ponce', 18.0111, -66.6141, 0.05, 80),
+    ('New York', 40.7128, -74.0060, 0.10, 220),
+    ('Paris', 48.8566, 2.3522, 0.06, 180),
+    ('Tokyo', 35.6762, 139.6503, 0.12, 150),
+    ('Sydney', -33.8688, 151.2093, 0.10, 170),
+    ('Mexico City', 19.4326, -99.1332, 0.10, 70),
+    ('Madrid', 40.4168, -3.7038, 0.06, 110),
+]
+# Peso de cada ciudad: unas pocas concentran la mayoría de los lugares
+CITY_WEIGHTS = [8, 2, 10, 7, 6, 4, 5, 3]
+PRICE_SIGMA = 0.5  # log-normal alrededor del precio mediano de la ciudad
+SPARSE_FRACTION = 0.05  # lugares rurales lejos de cualquier ciudad
+
+KINDS = ('Apartment', 'Loft', 'Studio', 'House', 'Villa', 'Cabin', 'Cottage', 'Penthouse', 'Bungalow')
+ADJECTIVES = ('Cozy', 'Modern', 'Sunny', 'Quiet', 'Spacious', 'Charming', 'Rustic', 'Luxury', 'Historic')
+FEATURES = ('near the beach', 'with a terrace', 'in the old town', 'with city views', 'close to the metro',
+            'with a garden', 'next to the park', 'with a pool')
+FIRST_NAMES = ('Ana', 'Luis', 'Maria', 'Carlos', 'Sofia', 'Jorge', 'Elena', 'Pedro', 'Lucia', 'Diego')
+LAST_NAMES = ('Garcia', 'Rivera', 'Lopez', 'Torres', 'Diaz', 'Morales', 'Ortiz', 'Cruz', 'Reyes', 'Vega')
+REVIEW_TEXTS = {
+    1: ('Terrible stay', 'Not as described', 'Dirty and noisy'),
+    2: ('Disappointing', 'Below expectations', 'Would not return'),
+    3: ('It was ok', 'Average place', 'Fine for a night'),
+    4: ('Nice place', 'Good location', 'Comfortable stay'),
+    5: ('Amazing stay', 'Perfect host', 'Highly recommended'),
+}
+
+# Amenities y probabilidad de que un lugar la tenga
+AMENITIES = [('Wifi', 0.9), ('Kitchen', 0.7), ('Air conditioning', 0.6), ('Parking', 0.45),
+             ('Washer', 0.4), ('TV', 0.55), ('Pool', 0.15), ('Hot tub', 0.08), ('Gym', 0.1),
+             ('Pets allowed', 0.2), ('Workspace', 0.3), ('Balcony', 0.25)]
+
+# Reseñas por lugar con ley de potencias (Zipf): el lugar de rango r recibe
+# una parte proporcional a 1 / r**REVIEW_ALPHA
+REVIEW_ALPHA = 1.1
+RATINGS = (1, 2, 3, 4, 5)
+# Distribuciones acumuladas de rating en forma de J, de lugares malos a excelentes
+RATING_PROFILES = [
+    (30, 50, 70, 90, 100),
+    (8, 18, 38, 70, 100),
+    (3, 7, 17, 50, 100),
+    (1, 3, 8, 30, 100),
+]
+RATING_PROFILE_WEIGHTS = (1, 3, 5, 4)
+
+BASE_DATE = datetime(2024, 1, 1)
+END_DATE = BASE_DATE + timedelta(days=730)
+# UUIDv7: 48 bits de "milisegundos" (aquí un contador desde BASE_DATE),
+# versión 7, variante RFC 4122 y 74 bits aleatorios
+UUID7_MASK = ~(0xf << 76) & ~(0x3 << 62) & ((1 << 80) - 1)
+UUID7_BITS = (0x7 << 76) | (0x2 << 62)
+DEFAULT_PASSWORD = 'password123'
+DEFAULT_CHUNK_SIZE = 10000
+
+
+class SyntheticData:
+    """Estado de una generación: semilla, IDs de usuarios y amenities ya creados."""
+
+    def __init__(self, seed):
+        self.rng = random.Random(seed)
+        self.sequence = int((BASE_DATE - datetime(1970, 1, 1)).total_seconds() * 1000)
+        self.user_ids = []
+        self.amenity_ids = {}
+
+    def new_id(self):
+        """UUIDv7 reproducible y creciente: contador + bits del generador con semilla."""
+        self.sequence += 1
+        digits = '%032x' % (self.sequence << 80 | self.rng.getrandbits(80) & UUID7_MASK | UUID7_BITS)
+        return f'{digits[:8]}-{digits[8:12]}-{digits[12:16]}-{digits[16:20]}-{digits[20:]}'
+
+    def timestamp(self, after=None):
+        """Fecha entre BASE_DATE y END_DATE (o posterior a `after`)."""
+        start = after or BASE_DATE
+        return start + timedelta(seconds=self.rng.random() * (END_DATE - start).total_seconds())
+
+
+def generate(users, places, reviews, seed=0, chunk_size=DEFAULT_CHUNK_SIZE, password=DEFAULT_PASSWORD,
+             echo=None):
+    """
+    Genera `users` usuarios, `places` lugares agrupados en ciudades (con
+    amenities) y exactamente `reviews` reseñas repartidas con ley de
+    potencias entre los lugares, con los agregados de rating de cada lugar
+    ya calculados. Devuelve un resumen con las filas insertadas.
+    """
+    if users < 1 and places:
+        raise ValueError("Hacen falta usuarios para ser dueños de los lugares")
+    if reviews > places * max(users - 1, 0):
+        raise ValueError("Demasiadas reseñas: cada usuario reseña un lugar una sola vez y nunca el suyo")
+    echo = echo or (lambda message: None)
+    state = SyntheticData(seed)
+
+    with _deferred_indexes([User.__table__, Place.__table__, place_amenity, Review.__table__]):
+        _generate_users(state, users, chunk_size, User.hash_password(password))
+        echo(f"{users} usuarios")
+        _generate_amenities(state)
+        counts = _review_counts(state.rng, places, reviews, users - 1)
+        links, written = _generate_places(state, counts, chunk_size, echo)
+        echo(f"{places} lugares, {written} reseñas; creando índices...")
+    return {'users': users, 'places': places, 'reviews': written, 'amenity_links': links}
+
+
+@contextmanager
+def _deferred_indexes(tables):
+    """
+    En SQLite, si todas las tablas están vacías, quita sus índices
+    secundarios durante el bloque y los vuelve a crear al salir (aunque haya
+    un error). Con datos previos, o en MySQL (InnoDB ya difiere la escritura
+    de los índices secundarios), no hace nada.
+    """
+    session = db.session
+    if session.get_bind().dialect.name != 'sqlite' or any(
+            session.execute(select(literal(1)).select_from(table).limit(1)).first() for table in tables):
+        yield
+        return
+    # Solo los que existen (p. ej. el FULLTEXT de places es solo de MySQL)
+    existing = set(session.execute(text("SELECT name FROM sqlite_master WHERE type = 'index'")).scalars())
+    indexes = [index for table in tables for index in table.indexes if index.name in existing]
+    with unit_of_work():
+        for index in indexes:
+            session.execute(DropIndex(index))
+    try:
+        yield
+    finally:
+        with unit_of_work():
+            for index in indexes:
+                session.execute(CreateIndex(index))
+
+
+def _generate_users(state, total, chunk_size, password_hash):
+    """Usuarios user<i>@example.com; todos comparten un hash bcrypt (hashear cada uno tardaría horas)."""
+    rng = state.rng
+    for start in range(0, total, chunk_size):
+        rows = []
+        for i in range(start, min(start + chunk_size, total)):
+            created = state.timestamp()
+            rows.append({'id': state.new_id(), 'first_name': rng.choice(FIRST_NAMES),
+                         'last_name': rng.choice(LAST_NAMES), 'email': f'user{i}@example.com',
+                         'password': password_hash, 'is_admin': i == 0,
+                         'created_at': created, 'updated_at': created})
+        with unit_of_work():
+            facade.user_repo.add_many(rows, chunk_size)
+        state.user_ids.extend(row['id'] for row in rows)
+
+
+def _generate_amenities(state):
+    """Crea las amenities de AMENITIES que falten y reutiliza las que ya existen por nombre."""
+    catalog = amenity_catalog.current()
+    state.amenity_ids = {name: catalog.id_for_name(name) for name, _ in AMENITIES if catalog.id_for_name(name)}
+    rows = [{'id': state.new_id(), 'name': name, 'created_at': BASE_DATE, 'updated_at': BASE_DATE}
+            for name, _ in AMENITIES if name not in state.amenity_ids]
+    if rows:
+        with unit_of_work():
+            facade.amenity_repo.add_many(rows)
+            amenity_catalog.bump()
+    state.amenity_ids.update((row['name'], row['id']) for row in rows)
+
+
+def _review_counts(rng, places, total, cap):
+    """
+    Reseñas de cada lugar: reparte exactamente `total` según Zipf (restos
+    mayores primero), sin pasar de `cap` por lugar (lo que sobra pasa al
+    siguiente rango) y en orden aleatorio.
+    """
+    if not places:
+        return []
+    weights = [1.0 / (rank + 1) ** REVIEW_ALPHA for rank in range(places)]
+    scale = total / math.fsum(weights)
+    counts = [int(w * scale) for w in weights]
+    by_remainder = sorted(range(places), key=lambda r: counts[r] - weights[r] * scale)
+    for rank in by_remainder[:total - sum(counts)]:
+        counts[rank] += 1
+    overflow = 0
+    for rank in range(places):
+        counts[rank] += overflow
+        overflow = max(counts[rank] - cap, 0)
+        counts[rank] -= overflow
+    rng.shuffle(counts)
+    return counts
+
+
+def _generate_places(state, counts, chunk_size, echo):
+    """
+    Recorre los lugares generando cada uno junto con sus reseñas, para
+    escribir los agregados de rating en la misma fila. Los lotes de places
+    se escriben antes que sus reseñas (claves foráneas) y el índice FTS se
+    llena una vez por lote.
+    """
+    rng, user_ids = state.rng, state.user_ids
+    amenity_probabilities = [(state.amenity_ids[name], p) for name, p in AMENITIES]
+    place_rows, link_rows, review_rows = [], [], []
+    links = written = 0
+
+    def flush():
+        nonlocal place_rows, link_rows, review_rows
+        with unit_of_work():
+            with fulltext.deferred_index(db.session):
+                facade.place_repo.add_many(place_rows, chunk_size)
+            for start in range(0, len(link_rows), chunk_size):
+                db.session.execute(insert(place_amenity), link_rows[start:start + chunk_size])
+            facade.review_repo.add_many(review_rows, chunk_size)
+            versions.bump(db.session, versions.PLACES)
+        place_rows, link_rows, review_rows = [], [], []
+
+    for index, count in enumerate(counts):
+        owner = rng.randrange(len(user_ids))
+        place = _place_row(state, user_ids[owner])
+        place_rows.append(place)
+        for amenity_id, probability in amenity_probabilities:
+            if rng.random() < probability:
+                link_rows.append({'place_id': place['id'], 'amenity_id': amenity_id})
+                links += 1
+
+        # Reseñadores distintos: usuarios consecutivos desde uno al azar, sin el dueño
+        ratings = rng.choices(RATINGS, cum_weights=rng.choices(RATING_PROFILES, RATING_PROFILE_WEIGHTS)[0],
+                              k=count)
+        first = rng.randrange(len(user_ids))
+        reviewers = [(first + j) % len(user_ids) for j in range(count + 1)]
+        if owner in reviewers:
+            reviewers.remove(owner)
+        for reviewer, rating in zip(reviewers, ratings):
+            created = state.timestamp(after=place['created_at'])
+            review_rows.append({'id': state.new_id(), 'text': rng.choice(REVIEW_TEXTS[rating]), 'rating': rating,
+                                'place_id': place['id'], 'user_id': user_ids[reviewer],
+                                'created_at': created, 'updated_at': created})
+            place[f'rating_hist_{rating}'] += 1
+        place['review_count'] = count
+        place['rating_sum'] = sum(ratings)
+        written += count
+
+        if len(place_rows) >= chunk_size or len(review_rows) >= chunk_size * 10:
+            flush()
+            echo(f"{index + 1} lugares, {written} reseñas")
+    if place_rows:
+        flush()
+    return links, written
+
+
+def _place_row(state, owner_id):
+    """Lugar cerca de una ciudad (o en cualquier parte), con precio log-normal."""
+    rng = state.rng
+    name, city_lat, city_lon, spread, median = rng.choices(CITIES, CITY_WEIGHTS)[0]
+    if rng.random() < SPARSE_FRACTION:
+        latitude, longitude, where = rng.uniform(-60, 60), rng.uniform(-180, 180), 'in the countryside'
+    else:
+        latitude = max(-90.0, min(90.0, rng.gauss(city_lat, spread)))
+        longitude = max(-180.0, min(180.0, rng.gauss(city_lon, spread)))
+        where = f'in {name}'
+    kind = rng.choice(KINDS)
+    created = state.timestamp()
+    row = {
+        'id': state.new_id(),
+        'title': f'{rng.choice(ADJECTIVES)} {kind} {where}',
+        'description': f'{kind} {rng.choice(FEATURES)}',
+        'price': round(rng.lognormvariate(math.log(median), PRICE_SIGMA), 2),
+        'latitude': latitude,
+        'longitude': longitude,
+        # insert() de Core no dispara _set_geohash: se calcula aquí
+        'geohash': geohash.encode(latitude, longitude),
+        'user_id': owner_id,
+        'created_at': created,
+        'updated_at': created,
+    }
+    row.update({f'rating_hist_{rating}': 0 for rating in RATINGS})
+    return row
@@ -0,0 +1 @@
+# Archivo benchmarks/__init__.py
@@ -0,0 +1,79 @@
+"""
+Benchmark de la carga masiva: filas por segundo de POST /places/bulk y
+POST /places/reviews/bulk contra un archivo SQLite local.
+
+Cada petición pasa por la API completa (JWT, validación por elemento,
+insert() de Core por lotes, triggers FTS y agregados de rating) y se
+confirma en una sola transacción. El objetivo es >= 10k filas/s.
+
+Uso (desde part4/hbnb):
+    python -m benchmarks.bench_bulk --places 50000 --batch 5000
+"""
+import argparse
+import contextlib
+import io
+import os
+import random
+import tempfile
+import time
+
+from flask_jwt_extended import create_access_token
+
+from config import TestingConfig
+from app import create_app, db
+from app.models.user import User
+
+FAKE_HASH = '$2b$12$' + 'x' * 53
+
+
+def post_batches(client, path, token, items, batch):
+    """Envía `items` en peticiones de `batch`; devuelve (ids creados, segundos)."""
+    created = []
+    headers = {'Authorization': f'Bearer {token}'}
+    elapsed = 0.0
+    for start in range(0, len(items), batch):
+        # El middleware de logging imprime cada cuerpo: se descarta para no medir la terminal
+        with contextlib.redirect_stdout(io.StringIO()):
+            t0 = time.perf_counter()
+            response = client.post(path, json=items[start:start + batch], headers=headers)
+            elapsed += time.perf_counter() - t0
+        assert response.status_code == 201, response.get_json()
+        created.extend(response.get_json()['created'])
+    return created, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--places', type=int, default=50000)
+    parser.add_argument('--batch', type=int, default=5000)
+    args = parser.parse_args()
+    rng = random.Random(42)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        TestingConfig.SQLALCHEMY_DATABASE_URI = 'sqlite:///' + os.path.join(tmp, 'bench.db')
+        app = create_app('testing')
+        with app.app_context():
+            db.create_all()
+            owner = User(first_name='Owner', last_name='Bench', email='owner@example.com', password=FAKE_HASH)
+            guest = User(first_name='Guest', last_name='Bench', email='guest@example.com', password=FAKE_HASH)
+            db.session.add_all([owner, guest])
+            db.session.commit()
+            client = app.test_client()
+
+            places = [{'title': f'Place {i}', 'description': 'Partner listing near the beach',
+                       'price': rng.randint(20, 500), 'latitude': rng.uniform(17.9, 18.5),
+                       'longitude': rng.uniform(-67.2, -65.6)} for i in range(args.places)]
+            place_ids, seconds = post_batches(client, '/api/v1/places/bulk',
+                                              create_access_token(identity=owner.id), places, args.batch)
+            print(f"{'places':>8} {len(place_ids):>8} filas {seconds:>7.2f} s {len(place_ids) / seconds:>9.0f} filas/s")
+
+            reviews = [{'place_id': place_id, 'text': 'Great stay', 'rating': rng.randint(1, 5)}
+                       for place_id in place_ids]
+            review_ids, seconds = post_batches(client, '/api/v1/places/reviews/bulk',
+                                               create_access_token(identity=guest.id), reviews, args.batch)
+            print(f"{'reviews':>8} {len(review_ids):>8} filas {seconds:>7.2f} s {len(review_ids) / seconds:>9.0f} filas/s")
+            db.session.remove()
+
+
+if __name__ == '__main__':
+    main()
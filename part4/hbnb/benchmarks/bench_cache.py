@@ -0,0 +1,57 @@
+"""
+Benchmark de GET /api/v1/places/<id> con y sin la caché de lectura.
+
+Genera un dataset con app.services.synthetic y pide lugares con acceso
+tipo Zipf (los más populares reciben la mayoría de las visitas), primero
+con CACHE_BACKEND='none' y luego con cada backend. Reporta peticiones/s y
+la tasa de aciertos.
+
+Uso (desde part4/hbnb):
+    python -m benchmarks.bench_cache --places 2000 --reviews 40000 --requests 5000
+"""
+import argparse
+import contextlib
+import io
+import random
+import time
+
+from app import create_app, db
+from app.models.place import Place
+from app.services import cache, synthetic
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--places', type=int, default=2000)
+    parser.add_argument('--reviews', type=int, default=40000)
+    parser.add_argument('--requests', type=int, default=5000)
+    args = parser.parse_args()
+
+    app = create_app('testing')
+    with app.app_context():
+        db.create_all()
+        synthetic.generate(users=args.places, places=args.places, reviews=args.reviews, seed=42)
+        # Los lugares con más reseñas son los "top listings"
+        ids = db.session.scalars(db.select(Place.id).order_by(Place.review_count.desc())).all()
+        rng = random.Random(1)
+        weights = [1.0 / (rank + 1) for rank in range(len(ids))]
+        paths = [f'/api/v1/places/{place_id}' for place_id in rng.choices(ids, weights, k=args.requests)]
+        db.session.remove()
+
+        print(f"{'backend':>8} {'req/s':>8} {'hit ratio':>10}")
+        for backend in ('none', 'local', 'shared'):
+            app.config['CACHE_BACKEND'] = backend
+            cache.init_app(app)
+            client = app.test_client()
+            # El middleware de logging imprime cada cuerpo: se descarta para no medir la terminal
+            with contextlib.redirect_stdout(io.StringIO()):
+                t0 = time.perf_counter()
+                for path in paths:
+                    assert client.get(path).status_code == 200
+                seconds = time.perf_counter() - t0
+            ratio = cache.get_cache().stats()['hit_ratio']
+            print(f"{backend:>8} {len(paths) / seconds:>8.0f} {ratio if ratio is not None else '-':>10}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,50 @@
+"""
+Benchmark de la compresión de respuestas en GET /api/v1/places/.
+
+Genera datos sintéticos y pide el listado completo con el cliente de
+pruebas, una vez por codificación (identity, gzip y br si está
+instalado). Informa bytes en el cable, razón de compresión y la mejor
+latencia de servidor (incluye la compresión, no la red).
+
+Uso (desde part4/hbnb):
+    python -m benchmarks.bench_compression --places 500 --reviews 5000 --repeat 10
+"""
+import argparse
+import contextlib
+import io
+import time
+
+from app import compression, create_app, db
+from app.services import synthetic
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--places', type=int, default=500)
+    parser.add_argument('--reviews', type=int, default=5000)
+    parser.add_argument('--repeat', type=int, default=10)
+    args = parser.parse_args()
+
+    app = create_app('testing')
+    with app.app_context():
+        db.create_all()
+        synthetic.generate(users=args.places, places=args.places, reviews=args.reviews, seed=42)
+        client = app.test_client()
+
+        identity = None
+        print(f"{'encoding':>9} {'bytes':>10} {'ratio':>7} {'ms':>8}")
+        for encoding in ('identity',) + compression.available_encodings():
+            best = float('inf')
+            for _ in range(args.repeat):
+                t0 = time.perf_counter()
+                with contextlib.redirect_stdout(io.StringIO()):
+                    response = client.get('/api/v1/places/', headers={'Accept-Encoding': encoding})
+                best = min(best, time.perf_counter() - t0)
+            assert response.headers.get('Content-Encoding', 'identity') == encoding
+            size = len(response.data)
+            identity = identity or size
+            print(f"{encoding:>9} {size:>10} {identity / size:>6.1f}x {best * 1000:>8.1f}")
+
+
+if __name__ == '__main__':
+    main()
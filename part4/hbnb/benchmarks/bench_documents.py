@@ -0,0 +1,71 @@
+"""
+Benchmark de CPU por petición en GET /api/v1/places con y sin documentos
+materializados (PLACE_DOCUMENTS).
+
+Genera un dataset con app.services.synthetic y pide detalles de lugares y
+páginas del listado, primero armando cada respuesta con Place.to_dict() y
+place_to_dict, y luego concatenando los documentos guardados (tras una
+pasada de calentamiento que los materializa). Reporta ms de CPU del
+proceso por petición (time.process_time) y peticiones/s.
+
+Uso (desde part4/hbnb):
+    python -m benchmarks.bench_documents --places 2000 --reviews 40000 --requests 2000
+"""
+import argparse
+import contextlib
+import io
+import random
+import time
+
+from app import create_app, db
+from app.models.place import Place
+from app.services import cache, synthetic
+
+
+def run(client, paths):
+    """(ms de CPU por petición, peticiones/s) pidiendo `paths` en orden."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        cpu0, wall0 = time.process_time(), time.perf_counter()
+        for path in paths:
+            assert client.get(path).status_code == 200
+        cpu, wall = time.process_time() - cpu0, time.perf_counter() - wall0
+    return cpu * 1000 / len(paths), len(paths) / wall
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--places', type=int, default=2000)
+    parser.add_argument('--reviews', type=int, default=40000)
+    parser.add_argument('--requests', type=int, default=2000)
+    parser.add_argument('--page-size', type=int, default=50)
+    args = parser.parse_args()
+
+    app = create_app('testing')
+    # Sin caché de lectura: se mide la serialización, no los aciertos
+    app.config['CACHE_BACKEND'] = 'none'
+    cache.init_app(app)
+    with app.app_context():
+        db.create_all()
+        synthetic.generate(users=args.places, places=args.places, reviews=args.reviews, seed=42)
+        ids = db.session.scalars(db.select(Place.id)).all()
+        db.session.remove()
+
+        rng = random.Random(1)
+        workloads = {
+            'detail': [f'/api/v1/places/{place_id}' for place_id in rng.choices(ids, k=args.requests)],
+            f'page of {args.page_size}': [f'/api/v1/places/?limit={args.page_size}'] * (args.requests // 10),
+        }
+        client = app.test_client()
+
+        print(f"{'workload':>12} {'mode':>10} {'cpu ms/req':>11} {'req/s':>8}")
+        for name, paths in workloads.items():
+            for mode, documents in (('to_dict', False), ('documents', True)):
+                app.config['PLACE_DOCUMENTS'] = documents
+                if documents:
+                    run(client, sorted(set(paths)))  # Materializa los documentos
+                cpu_ms, rate = run(client, paths)
+                print(f"{name:>12} {mode:>10} {cpu_ms:>11.3f} {rate:>8.0f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,104 @@
+"""
+Benchmark de memoria de GET /api/v1/export/places.ndjson.
+
+Inserta N lugares en un archivo SQLite, consume la exportación por la API
+sin acumular el cuerpo y mide con tracemalloc el pico de memoria durante
+la descarga. El pico debe mantenerse plano aunque crezca la tabla; como
+referencia se mide también GET /places/ (en streaming por lotes con
+STREAM_JSON; ver benchmarks.bench_streaming) en los tamaños más chicos.
+
+Uso (desde part4/hbnb):
+    python -m benchmarks.bench_export --sizes 10000 100000 300000
+"""
+import argparse
+import contextlib
+import io
+import os
+import tempfile
+import time
+import tracemalloc
+import uuid
+from datetime import datetime
+
+from flask_jwt_extended import create_access_token
+
+from config import TestingConfig
+from app import create_app, db
+from app.models import geohash
+from app.models.place import Place
+from app.models.user import User
+
+FAKE_HASH = '$2b$12$' + 'x' * 53
+# GET /places/ carga lugares con reseñas y amenities: solo se mide hasta este tamaño
+FULL_LIST_MAX = 20000
+
+
+def populate(owner_id, total, start):
+    """Inserta lugares [start, total) en lotes con un insert() de Core."""
+    batch = []
+    now = datetime.utcnow()
+    for i in range(start, total):
+        lat, lon = 18.0 + (i % 1000) * 0.0005, -66.0 - (i // 1000) * 0.0005
+        batch.append({'id': str(uuid.uuid4()), 'title': f'Place {i}', 'description': 'Export benchmark listing',
+                      'price': 100, 'latitude': lat, 'longitude': lon, 'geohash': geohash.encode(lat, lon),
+                      'user_id': owner_id, 'created_at': now, 'updated_at': now})
+        if len(batch) == 10000:
+            db.session.execute(Place.__table__.insert(), batch)
+            batch = []
+    if batch:
+        db.session.execute(Place.__table__.insert(), batch)
+    db.session.commit()
+
+
+def measure(client, path, token):
+    """Devuelve (bytes recibidos, pico de memoria en MB, segundos) de una descarga."""
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    received = 0
+    with contextlib.redirect_stdout(io.StringIO()):
+        response = client.get(path, headers={'Authorization': f'Bearer {token}'}, buffered=False)
+        for chunk in response.response:
+            received += len(chunk)
+        response.close()
+    seconds = time.perf_counter() - t0
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return received, peak / 1024 / 1024, seconds
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10000, 100000, 300000])
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        TestingConfig.SQLALCHEMY_DATABASE_URI = 'sqlite:///' + os.path.join(tmp, 'bench.db')
+        app = create_app('testing')
+        with app.app_context():
+            db.create_all()
+            admin = User(first_name='Admin', last_name='Bench', email='admin@example.com',
+                         password=FAKE_HASH, is_admin=True)
+            db.session.add(admin)
+            db.session.commit()
+            admin_id = admin.id
+            token = create_access_token(identity=admin_id)
+            client = app.test_client()
+
+            loaded = 0
+            print(f"{'places':>8} {'endpoint':>22} {'MB recibidos':>13} {'pico MB':>8} {'s':>6}")
+            for size in sorted(args.sizes):
+                populate(admin_id, size, loaded)
+                loaded = size
+                db.session.expunge_all()
+                paths = ['/api/v1/export/places.ndjson']
+                if size <= FULL_LIST_MAX:
+                    paths.append('/api/v1/places/')
+                for path in paths:
+                    received, peak, seconds = measure(client, path, token)
+                    print(f"{size:>8} {path.rsplit('/', 2)[-2] + '/' + path.rsplit('/', 1)[-1]:>22} "
+                          f"{received / 1024 / 1024:>13.1f} {peak:>8.1f} {seconds:>6.2f}")
+            db.session.remove()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,105 @@
+"""
+Benchmark de /places/search?q=: FTS5 (bm25) contra LIKE '%palabra%'.
+
+Inserta N lugares con títulos y descripciones aleatorias en SQLite en
+memoria (los triggers mantienen places_fts) y compara
+HBnBFacade.search_places con un recorrido LIKE sobre la tabla.
+
+Uso (desde part4/hbnb):
+    python -m benchmarks.bench_fulltext --places 500000
+"""
+import argparse
+import random
+import statistics
+import time
+import uuid
+from datetime import datetime
+
+from app import create_app, db
+from app.models import geohash
+from app.models.user import User
+from app.models.place import Place
+from app.persistence import fulltext
+
+WORDS = ("cozy quiet modern rustic sunny spacious charming private luxury budget beach mountain "
+         "city lake forest desert island river garden terrace loft cabin villa studio apartment "
+         "house cottage bungalow penthouse pool view wifi parking kitchen balcony fireplace "
+         "jacuzzi breakfast pets family downtown historic").split()
+# Vocabulario con frecuencias tipo Zipf: unas pocas palabras muy comunes y
+# miles de palabras raras (nombres de barrios, calles, marcas...)
+VOCABULARY = WORDS + [f'{a}{b}' for a in ('nor', 'sol', 'mar', 'val', 'ros', 'can', 'bel', 'tor')
+                      for b in range(400)]
+WEIGHTS = [1.0 / (rank + 1) for rank in range(len(VOCABULARY))]
+QUERIES = ['jacuzzi', 'beach villa', 'mar12', 'sol250 terrace', 'historic downtown loft', 'pen']
+
+
+def populate(total, seed=7):
+    """Inserta un dueño y `total` lugares con insert() de Core."""
+    rng = random.Random(seed)
+    now = datetime.utcnow()
+    owner_id = str(uuid.uuid4())
+    db.session.execute(User.__table__.insert(), [{
+        'id': owner_id, 'first_name': 'Owner', 'last_name': 'Bench', 'email': 'owner@bench.com',
+        'password': 'x', 'is_admin': False, 'created_at': now, 'updated_at': now}])
+    batch = []
+    for i in range(total):
+        lat, lon = rng.uniform(-60, 60), rng.uniform(-170, 170)
+        batch.append({'id': str(uuid.uuid4()),
+                      'title': ' '.join(rng.choices(VOCABULARY, WEIGHTS, k=3)).title(),
+                      'description': ' '.join(rng.choices(VOCABULARY, WEIGHTS, k=rng.randint(10, 40))),
+                      'price': 100.0, 'latitude': lat, 'longitude': lon,
+                      'geohash': geohash.encode(lat, lon), 'user_id': owner_id,
+                      'created_at': now, 'updated_at': now})
+        if len(batch) == 20000:
+            db.session.execute(Place.__table__.insert(), batch)
+            batch = []
+    if batch:
+        db.session.execute(Place.__table__.insert(), batch)
+    db.session.commit()
+
+
+def like_scan(words):
+    """
+    Línea base: LIKE '%palabra%' sobre title y description. Para ordenar por
+    relevancia hay que encontrar todas las coincidencias, así que no hay LIMIT.
+    """
+    query = db.session.query(Place.id)
+    for word in words.split():
+        pattern = f'%{word}%'
+        query = query.filter(db.or_(Place.title.like(pattern), Place.description.like(pattern)))
+    return query.all()
+
+
+def timed(fn, runs):
+    samples = []
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - t0) * 1000)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--places', type=int, default=500000)
+    parser.add_argument('--limit', type=int, default=20)
+    parser.add_argument('--runs', type=int, default=5)
+    args = parser.parse_args()
+
+    app = create_app('testing')
+    with app.app_context():
+        db.create_all()
+        t0 = time.perf_counter()
+        populate(args.places)
+        print(f"places={args.places} (carga con triggers FTS: {time.perf_counter() - t0:.1f} s)")
+        print(f"{'query':<25} {'matches':>8} {'fts5 ms':>10} {'LIKE ms':>10}")
+        for q in QUERIES:
+            matches = db.session.execute(db.text("SELECT count(*) FROM places_fts WHERE places_fts MATCH :q"),
+                                         {'q': fulltext.match_query(q)}).scalar()
+            fts_ms = timed(lambda: app.facade.search_places({'q': q}, limit=args.limit), args.runs)
+            like_ms = timed(lambda: like_scan(q), args.runs)
+            print(f"{q:<25} {matches:>8} {fts_ms:>10.2f} {like_ms:>10.2f}")
+
+
+if __name__ == '__main__':
+    main()
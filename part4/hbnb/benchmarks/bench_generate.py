@@ -0,0 +1,53 @@
+"""
+Benchmark del generador de datos sintéticos (flask hbnb generate).
+
+Genera el dataset en un archivo SQLite y mide filas/s de reseñas por
+tamaño. Como los IDs son crecientes y los índices secundarios se crean al
+final, la velocidad debe mantenerse casi constante al crecer: 10M de
+reseñas tienen que quedar en minutos.
+
+Uso (desde part4/hbnb):
+    python -m benchmarks.bench_generate --reviews 100000 1000000 10000000
+"""
+import argparse
+import contextlib
+import io
+import os
+import tempfile
+import time
+
+from config import TestingConfig
+from app import create_app, db
+from app.services import synthetic
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--reviews', type=int, nargs='+', default=[100000, 1000000])
+    parser.add_argument('--reviews-per-user', type=int, default=20)
+    parser.add_argument('--reviews-per-place', type=int, default=10)
+    args = parser.parse_args()
+
+    print(f"{'reviews':>9} {'users':>8} {'places':>8} {'s':>8} {'reviews/s':>10} {'MB':>8}")
+    for total in args.reviews:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'bench.db')
+            TestingConfig.SQLALCHEMY_DATABASE_URI = 'sqlite:///' + path
+            app = create_app('testing')
+            with app.app_context():
+                db.create_all()
+                users = max(total // args.reviews_per_user, 2)
+                places = max(total // args.reviews_per_place, 1)
+                t0 = time.perf_counter()
+                # El modelo y el hash de la contraseña imprimen trazas: se descartan
+                with contextlib.redirect_stdout(io.StringIO()):
+                    synthetic.generate(users, places, total, seed=42)
+                seconds = time.perf_counter() - t0
+                db.session.remove()
+                db.engine.dispose()
+            print(f"{total:>9} {users:>8} {places:>8} {seconds:>8.1f} {total / seconds:>10.0f} "
+                  f"{os.path.getsize(path) / 1024 / 1024:>8.0f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+"""
+Microbenchmark de codificación JSON de 1000 lugares con sus reseñas.
+
+Arma los diccionarios una sola vez (Place.to_dict() + place_to_dict) y
+mide solo la codificación de la lista completa:
+  - stdlib:  la representación por defecto de Flask-RESTX (json.dumps),
+             con las fechas ya convertidas a texto en Python como hacía
+             place_to_dict antes
+  - codec:   json_codec.dumps (orjson si está instalado) con las fechas
+             como datetime
+
+Uso (desde part4/hbnb):
+    python -m benchmarks.bench_json --places 1000 --reviews 20000 --repeat 20
+"""
+import argparse
+import contextlib
+import io
+import json
+import time
+from datetime import datetime
+
+from app import create_app, db
+from app.api.v1.places import place_to_dict
+from app.services import json_codec, synthetic
+from app.services.facade import facade
+
+
+def isoformat_dates(place):
+    """La conversión de fechas que hacían place_to_dict y review_to_dict."""
+    def convert(data):
+        return {key: value.isoformat() if isinstance(value, datetime) else value for key, value in data.items()}
+    converted = convert(place)
+    converted['reviews'] = [convert(review) for review in place['reviews']]
+    return converted
+
+
+def best_ms(func, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - t0)
+    return best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--places', type=int, default=1000)
+    parser.add_argument('--reviews', type=int, default=20000)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    app = create_app('testing')
+    with app.app_context():
+        db.create_all()
+        synthetic.generate(users=args.places, places=args.places, reviews=args.reviews, seed=42)
+        with contextlib.redirect_stdout(io.StringIO()):
+            places = [place_to_dict(place) for place in facade.get_all_places()]
+
+    results = {
+        'stdlib': best_ms(lambda: json.dumps([isoformat_dates(p) for p in places]).encode(), args.repeat),
+        'codec': best_ms(lambda: json_codec.dumps(places), args.repeat),
+    }
+    size = len(json_codec.dumps(places))
+    print(f"{len(places)} lugares, {sum(len(p['reviews']) for p in places)} reseñas, {size / 1e6:.1f} MB")
+    print(f"{'encoder':>8} {'ms':>8} {'speedup':>8}")
+    for name, ms in results.items():
+        label = json_codec.backend() if name == 'codec' else name
+        print(f"{label:>8} {ms:>8.1f} {results['stdlib'] / ms:>7.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+"""
+Benchmark de peticiones por segundo según la configuración del logging.
+
+Genera datos sintéticos y repite GET /api/v1/places/<id> y
+GET /api/v1/places/?limit=20 con el cliente de pruebas, una vez por modo:
+  - off:          LOG_LEVEL=WARNING (producción): ningún registro se arma
+  - info:         log de acceso, una línea JSON por petición
+  - debug:        todos los módulos en DEBUG (headers y cuerpos incluidos)
+  - debug-async:  igual, escrito desde el hilo del QueueListener
+  - debug-sample: DEBUG con LOG_SAMPLE_RATE=0.1
+Los registros van a /dev/null: se mide el costo de armarlos, no el disco.
+
+Uso (desde part4/hbnb):
+    python -m benchmarks.bench_logging --places 200 --requests 2000
+"""
+import argparse
+import os
+import time
+
+from app import create_app, db, logs
+from app.services import synthetic
+from app.services.facade import facade
+
+MODES = {
+    'off': {'LOG_LEVEL': 'WARNING'},
+    'info': {'LOG_LEVEL': 'INFO', 'LOG_ASYNC': False},
+    'debug': {'LOG_LEVEL': 'DEBUG', 'LOG_ASYNC': False},
+    'debug-async': {'LOG_LEVEL': 'DEBUG', 'LOG_ASYNC': True},
+    'debug-sample': {'LOG_LEVEL': 'DEBUG', 'LOG_ASYNC': True, 'LOG_SAMPLE_RATE': 0.1},
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--places', type=int, default=200)
+    parser.add_argument('--requests', type=int, default=2000)
+    args = parser.parse_args()
+
+    app = create_app('testing')
+    devnull = open(os.devnull, 'w')
+    with app.app_context():
+        db.create_all()
+        synthetic.generate(users=args.places, places=args.places, reviews=args.places * 5, seed=42)
+        paths = ['/api/v1/places/' + place['id'] for place in facade.get_all_places()[:50]]
+        paths.append('/api/v1/places/?limit=20')
+        client = app.test_client()
+
+        results = {}
+        for mode, overrides in MODES.items():
+            app.config.update({'LOG_ASYNC': True, 'LOG_SAMPLE_RATE': 1.0, **overrides})
+            logs.configure(app.config, stream=devnull)
+            t0 = time.perf_counter()
+            for i in range(args.requests):
+                client.get(paths[i % len(paths)])
+            logs.stop()
+            results[mode] = args.requests / (time.perf_counter() - t0)
+
+    print(f"{'mode':>13} {'req/s':>8} {'vs off':>7}")
+    for mode, rate in results.items():
+        print(f"{mode:>13} {rate:>8.0f} {rate / results['off']:>6.2f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+"""
+Benchmark de la búsqueda de usuario por email que hace /auth/login.
+
+Inserta N usuarios en una base SQLite en memoria y mide la latencia de
+HBnBFacade.get_user_by_email para varios tamaños de tabla. El costo de
+bcrypt.check_password_hash es constante y no se incluye.
+
+Uso (desde part4/hbnb):
+    python -m benchmarks.bench_login --sizes 1000 10000 100000 1000000
+"""
+import argparse
+import statistics
+import time
+import uuid
+from datetime import datetime
+
+from app import create_app, db
+from app.models.user import User
+
+# Hash bcrypt fijo para no pagar el hashing al poblar la tabla
+FAKE_HASH = '$2b$12$' + 'x' * 53
+
+
+def populate(total, start):
+    """Inserta usuarios [start, total) en lotes con un insert() de Core."""
+    batch = []
+    now = datetime.utcnow()
+    for i in range(start, total):
+        batch.append({
+            'id': str(uuid.uuid4()),
+            'first_name': 'User',
+            'last_name': str(i),
+            'email': f'user{i}@example.com',
+            'password': FAKE_HASH,
+            'is_admin': False,
+            'created_at': now,
+            'updated_at': now,
+        })
+        if len(batch) == 10000:
+            db.session.execute(User.__table__.insert(), batch)
+            batch = []
+    if batch:
+        db.session.execute(User.__table__.insert(), batch)
+    db.session.commit()
+
+
+def measure(facade, total, lookups):
+    """Devuelve la mediana y el p99 (en ms) de get_user_by_email."""
+    step = max(total // lookups, 1)
+    samples = []
+    for i in range(0, total, step):
+        # Mayúsculas a propósito: la búsqueda debe normalizar el email
+        email = f'USER{i}@Example.com'
+        t0 = time.perf_counter()
+        user = facade.get_user_by_email(email)
+        samples.append((time.perf_counter() - t0) * 1000)
+        assert user is not None, email
+        db.session.expunge_all()
+    samples.sort()
+    return statistics.median(samples), samples[int(len(samples) * 0.99) - 1]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 100000])
+    parser.add_argument('--lookups', type=int, default=200)
+    args = parser.parse_args()
+
+    app = create_app('testing')
+    with app.app_context():
+        db.create_all()
+        loaded = 0
+        print(f"{'users':>10} {'median ms':>10} {'p99 ms':>10}")
+        for size in sorted(args.sizes):
+            populate(size, loaded)
+            loaded = size
+            median, p99 = measure(app.facade, size, args.lookups)
+            print(f"{size:>10} {median:>10.3f} {p99:>10.3f}")
+
+
+if __name__ == '__main__':
+    main()
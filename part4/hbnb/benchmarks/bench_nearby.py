@@ -0,0 +1,68 @@
+"""
+Benchmark de GET /places/nearby: prefiltro por geohash contra recorrido completo.
+
+Genera N lugares agrupados alrededor de varias ciudades con
+app.services.synthetic en SQLite en memoria y mide
+HBnBFacade.get_nearby_places frente a calcular la distancia haversine de
+todas las filas.
+
+Uso (desde part4/hbnb):
+    python -m benchmarks.bench_nearby --places 1000000 --radius 5
+"""
+import argparse
+import statistics
+import time
+
+from app import create_app, db
+from app.models import geohash
+from app.models.place import Place
+from app.services import synthetic
+
+
+def full_scan(lat, lon, radius_km, limit):
+    """Línea base: distancia exacta de todas las filas."""
+    hits = []
+    for place_id, plat, plon in db.session.query(Place.id, Place.latitude, Place.longitude):
+        distance = geohash.haversine_km(lat, lon, plat, plon)
+        if distance <= radius_km:
+            hits.append((distance, place_id))
+    hits.sort()
+    return hits[:limit]
+
+
+def timed(fn, runs):
+    samples = []
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - t0) * 1000)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--places', type=int, default=100000)
+    parser.add_argument('--radius', type=float, default=5.0)
+    parser.add_argument('--limit', type=int, default=20)
+    parser.add_argument('--runs', type=int, default=20)
+    args = parser.parse_args()
+
+    app = create_app('testing')
+    with app.app_context():
+        db.create_all()
+        synthetic.generate(users=1, places=args.places, reviews=0, seed=42)
+        _, lat, lon, _, _ = synthetic.CITIES[0]
+
+        nearby = app.facade.get_nearby_places(lat, lon, args.radius, limit=args.limit)
+        baseline = full_scan(lat, lon, args.radius, args.limit)
+        assert [p['id'] for p in nearby] == [place_id for _, place_id in baseline]
+
+        indexed_ms = timed(lambda: app.facade.get_nearby_places(lat, lon, args.radius, limit=args.limit), args.runs)
+        scan_ms = timed(lambda: full_scan(lat, lon, args.radius, args.limit), max(args.runs // 10, 1))
+        print(f"places={args.places} radius={args.radius}km results={len(nearby)}")
+        print(f"geohash prefilter: {indexed_ms:8.2f} ms (median)")
+        print(f"full scan:         {scan_ms:8.2f} ms (median)")
+
+
+if __name__ == '__main__':
+    main()
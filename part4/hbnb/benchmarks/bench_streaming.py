@@ -0,0 +1,85 @@
+"""
+Benchmark de memoria de GET /api/v1/places/ armado entero vs en streaming.
+
+Inserta N lugares en un archivo SQLite (con benchmarks.bench_export) y
+descarga el listado completo una vez por modo, cada uno en un proceso
+nuevo para que el pico de RSS (ru_maxrss) de un modo no tape al otro:
+  - buffered:  STREAM_JSON=False, la lista de dicts y el JSON enteros en memoria
+  - streamed:  STREAM_JSON=True, lotes de facade.STREAM_BATCH_SIZE lugares
+Informa el pico de RSS del proceso, cuánto creció durante la descarga y el
+pico de tracemalloc.
+
+Uso (desde part4/hbnb):
+    python -m benchmarks.bench_streaming --places 100000
+"""
+import argparse
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from config import TestingConfig
+from app import create_app, db
+from app.models.user import User
+from benchmarks.bench_export import FAKE_HASH, populate
+
+MODES = {'buffered': False, 'streamed': True}
+
+
+def run(db_path, mode):
+    """Descarga el listado en este proceso e imprime una fila de resultados."""
+    TestingConfig.SQLALCHEMY_DATABASE_URI = 'sqlite:///' + db_path
+    app = create_app('testing')
+    app.config['STREAM_JSON'] = MODES[mode]
+    with app.app_context():
+        client = app.test_client()
+        before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        tracemalloc.start()
+        t0 = time.perf_counter()
+        received = 0
+        response = client.get('/api/v1/places/', buffered=False)
+        for chunk in response.response:
+            received += len(chunk)
+        response.close()
+        seconds = time.perf_counter() - t0
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss está en KB en Linux
+    print(f"{mode:>9} {received / 1024 / 1024:>8.1f} {after / 1024:>9.1f} {(after - before) / 1024:>9.1f} "
+          f"{peak / 1024 / 1024:>10.1f} {seconds:>7.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--places', type=int, default=100000)
+    parser.add_argument('--run', nargs=2, metavar=('DB', 'MODE'), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run:
+        run(*args.run)
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, 'bench.db')
+        TestingConfig.SQLALCHEMY_DATABASE_URI = 'sqlite:///' + db_path
+        app = create_app('testing')
+        with app.app_context():
+            db.create_all()
+            owner = User(first_name='Owner', last_name='Bench', email='owner@example.com', password=FAKE_HASH)
+            db.session.add(owner)
+            db.session.commit()
+            populate(owner.id, args.places, 0)
+            db.session.remove()
+
+        print(f"{args.places} lugares")
+        print(f"{'mode':>9} {'MB body':>8} {'RSS MB':>9} {'+RSS MB':>9} {'tracemalloc':>10} {'s':>7}")
+        for mode in MODES:
+            subprocess.run([sys.executable, '-m', 'benchmarks.bench_streaming', '--run', db_path, mode], check=True)
+
+
+if __name__ == '__main__':
+    main()
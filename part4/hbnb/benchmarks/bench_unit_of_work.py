@@ -0,0 +1,94 @@
+"""
+Benchmark de commits por petición: commit en cada llamada vs. unidad de trabajo.
+
+Simula una petición que crea un lugar, le agrega tres reviews y actualiza
+el lugar (cinco llamadas a la fachada). En el modo "por llamada" cada
+llamada es su propia transacción, como hacían los repositorios antes de
+la unidad de trabajo; en el modo "petición" todas comparten una sola
+transacción, como en una petición HTTP. Usa un archivo SQLite (no en
+memoria) para que cada commit pague su fsync.
+
+Uso (desde part4/hbnb):
+    python -m benchmarks.bench_unit_of_work --requests 200
+"""
+import argparse
+import os
+import statistics
+import tempfile
+import time
+
+from sqlalchemy import event
+
+from config import TestingConfig
+from app import create_app, db
+from app.models.user import User
+from app.persistence.unit_of_work import unit_of_work
+
+FAKE_HASH = '$2b$12$' + 'x' * 53
+
+
+def seed():
+    """Crea el dueño y tres huéspedes; devuelve sus IDs."""
+    users = [User(first_name='User', last_name=str(i), email=f'user{i}@example.com', password=FAKE_HASH)
+             for i in range(4)]
+    db.session.add_all(users)
+    db.session.commit()
+    return [user.id for user in users]
+
+
+def simulated_request(facade, owner_id, guest_ids, n):
+    """Las cinco llamadas a la fachada de una petición de ejemplo."""
+    place = facade.create_place({'title': f'Place {n}', 'description': 'Bench', 'price': 100,
+                                 'latitude': 18.0, 'longitude': -66.6, 'user_id': owner_id})
+    for i, guest_id in enumerate(guest_ids):
+        facade.create_review({'text': 'Ok', 'rating': 1 + (n + i) % 5,
+                              'user_id': guest_id, 'place_id': place['id']})
+    facade.update_place(place['id'], owner_id, {'price': 120})
+
+
+def measure(facade, mode, requests, owner_id, guest_ids, offset):
+    """Devuelve (commits por petición, mediana ms, p99 ms) del modo dado."""
+    commits = []
+
+    def count_commit(conn):
+        commits.append(1)
+
+    event.listen(db.engine, 'commit', count_commit)
+    samples = []
+    try:
+        for n in range(offset, offset + requests):
+            t0 = time.perf_counter()
+            if mode == 'petición':
+                with unit_of_work():
+                    simulated_request(facade, owner_id, guest_ids, n)
+            else:
+                simulated_request(facade, owner_id, guest_ids, n)
+            samples.append((time.perf_counter() - t0) * 1000)
+            db.session.expunge_all()
+    finally:
+        event.remove(db.engine, 'commit', count_commit)
+    samples.sort()
+    return len(commits) / requests, statistics.median(samples), samples[int(len(samples) * 0.99) - 1]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--requests', type=int, default=200)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        TestingConfig.SQLALCHEMY_DATABASE_URI = 'sqlite:///' + os.path.join(tmp, 'bench.db')
+        app = create_app('testing')
+        with app.app_context():
+            db.create_all()
+            owner_id, *guest_ids = seed()
+            print(f"{'modo':>12} {'commits/pet.':>13} {'median ms':>10} {'p99 ms':>10}")
+            for i, mode in enumerate(('por llamada', 'petición')):
+                per_request, median, p99 = measure(app.facade, mode, args.requests,
+                                                   owner_id, guest_ids, i * args.requests)
+                print(f"{mode:>12} {per_request:>13.1f} {median:>10.3f} {p99:>10.3f}")
+            db.session.remove()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,32 @@
+"""Documentos materializados de places
+
+Revision ID: 2c7e9b4d5a18
+Revises: 8d4e6a1f3b52
+Create Date: 2026-10-18 22:40:31.207914
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '2c7e9b4d5a18'
+down_revision = '8d4e6a1f3b52'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # JSON ya codificado de cada lugar (app.services.place_documents); se
+    # llena al leer o al confirmar escrituras, no hace falta poblarla aquí
+    op.create_table(
+        'place_documents',
+        sa.Column('place_id', sa.String(length=60), nullable=False),
+        sa.Column('body', sa.LargeBinary(length=2**32 - 1), nullable=False),
+        sa.Column('built_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('place_id')
+    )
+
+
+def downgrade():
+    op.drop_table('place_documents')
@@ -0,0 +1,31 @@
+"""Indice lower(email) en users
+
+Revision ID: 3c9a1e7d2b41
+Revises: 59f0766acd8a
+Create Date: 2026-10-18 09:12:40.118532
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3c9a1e7d2b41'
+down_revision = '59f0766acd8a'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Índice funcional para que get_user_by_email no recorra toda la tabla.
+    # En MySQL requiere 8.0.13+ (índices sobre expresiones).
+    op.create_index(
+        'ix_users_email_lower',
+        'users',
+        [sa.text('lower(email)')],
+        unique=True
+    )
+
+
+def downgrade():
+    op.drop_index('ix_users_email_lower', table_name='users')
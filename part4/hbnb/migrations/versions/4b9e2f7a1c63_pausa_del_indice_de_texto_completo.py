@@ -0,0 +1,46 @@
+"""Pausa del indice de texto completo
+
+Revision ID: 4b9e2f7a1c63
+Revises: c5d83e1f6a27
+Create Date: 2026-10-18 19:31:40.207615
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '4b9e2f7a1c63'
+down_revision = 'c5d83e1f6a27'
+branch_labels = None
+depends_on = None
+
+# Sentencias fijas (no las de app.persistence.fulltext) para que la
+# migración no cambie si el módulo cambia más adelante.
+PAUSE_TABLE = "CREATE TABLE IF NOT EXISTS places_fts_pause (id INTEGER PRIMARY KEY)"
+INSERT_TRIGGER_PAUSABLE = """CREATE TRIGGER places_fts_ai AFTER INSERT ON places
+    WHEN NOT EXISTS (SELECT 1 FROM places_fts_pause) BEGIN
+        INSERT INTO places_fts(rowid, title, description)
+        VALUES (new.rowid, new.title, new.description);
+    END"""
+INSERT_TRIGGER = """CREATE TRIGGER places_fts_ai AFTER INSERT ON places BEGIN
+        INSERT INTO places_fts(rowid, title, description)
+        VALUES (new.rowid, new.title, new.description);
+    END"""
+
+
+def upgrade():
+    # Solo SQLite: en MySQL el índice FULLTEXT no usa triggers
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+    op.execute(PAUSE_TABLE)
+    op.execute("DROP TRIGGER IF EXISTS places_fts_ai")
+    op.execute(INSERT_TRIGGER_PAUSABLE)
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+    op.execute("DROP TRIGGER IF EXISTS places_fts_ai")
+    op.execute(INSERT_TRIGGER)
+    op.execute("DROP TABLE IF EXISTS places_fts_pause")
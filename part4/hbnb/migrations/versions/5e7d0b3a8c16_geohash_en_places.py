@@ -0,0 +1,45 @@
+"""Geohash en places
+
+Revision ID: 5e7d0b3a8c16
+Revises: d82b5f4c1a93
+Create Date: 2026-10-18 12:41:07.330945
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from app.models import geohash
+
+
+# revision identifiers, used by Alembic.
+revision = '5e7d0b3a8c16'
+down_revision = 'd82b5f4c1a93'
+branch_labels = None
+depends_on = None
+
+BATCH_SIZE = 1000
+
+
+def upgrade():
+    with op.batch_alter_table('places') as batch_op:
+        batch_op.add_column(sa.Column('geohash', sa.String(length=12), nullable=True))
+
+    # Rellenar el geohash de los lugares existentes por lotes
+    places = sa.table('places', sa.column('id', sa.String), sa.column('latitude', sa.Float),
+                      sa.column('longitude', sa.Float), sa.column('geohash', sa.String))
+    conn = op.get_bind()
+    rows = conn.execute(sa.select(places.c.id, places.c.latitude, places.c.longitude)).fetchall()
+    for start in range(0, len(rows), BATCH_SIZE):
+        conn.execute(
+            places.update().where(places.c.id == sa.bindparam('place_id')),
+            [{'place_id': place_id, 'geohash': geohash.encode(lat, lon)}
+             for place_id, lat, lon in rows[start:start + BATCH_SIZE]]
+        )
+
+    op.create_index('ix_places_geohash', 'places', ['geohash', 'latitude', 'longitude', 'id'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_places_geohash', table_name='places')
+    with op.batch_alter_table('places') as batch_op:
+        batch_op.drop_column('geohash')
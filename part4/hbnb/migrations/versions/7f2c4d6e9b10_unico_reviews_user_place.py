@@ -0,0 +1,56 @@
+"""Unico reviews (user_id, place_id)
+
+Revision ID: 7f2c4d6e9b10
+Revises: e3a85c91f027
+Create Date: 2026-10-18 16:22:48.250713
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '7f2c4d6e9b10'
+down_revision = 'e3a85c91f027'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    conn = op.get_bind()
+    reviews = sa.table('reviews', sa.column('id', sa.String), sa.column('user_id', sa.String),
+                       sa.column('place_id', sa.String), sa.column('rating', sa.Integer),
+                       sa.column('created_at', sa.DateTime))
+
+    # Quitar duplicados anteriores a la restricción (se conserva la reseña más antigua)
+    duplicates = conn.execute(
+        sa.select(reviews.c.user_id, reviews.c.place_id)
+        .group_by(reviews.c.user_id, reviews.c.place_id)
+        .having(sa.func.count() > 1)
+    ).fetchall()
+    for user_id, place_id in duplicates:
+        ids = conn.execute(
+            sa.select(reviews.c.id)
+            .where(reviews.c.user_id == user_id, reviews.c.place_id == place_id)
+            .order_by(reviews.c.created_at, reviews.c.id)
+        ).scalars().all()
+        conn.execute(reviews.delete().where(reviews.c.id.in_(ids[1:])))
+
+    # Recalcular los agregados de rating de los lugares afectados
+    if duplicates:
+        place_ids = sorted({place_id for _, place_id in duplicates})
+        values = {
+            'review_count': sa.text('(SELECT count(*) FROM reviews WHERE reviews.place_id = places.id)'),
+            'rating_sum': sa.text('(SELECT coalesce(sum(rating), 0) FROM reviews WHERE reviews.place_id = places.id)'),
+        }
+        for r in range(1, 6):
+            values[f'rating_hist_{r}'] = sa.text(
+                f'(SELECT count(*) FROM reviews WHERE reviews.place_id = places.id AND rating = {r})')
+        places = sa.table('places', sa.column('id', sa.String), *[sa.column(name) for name in values])
+        conn.execute(places.update().where(places.c.id.in_(place_ids)).values(**values))
+
+    op.create_index('uq_reviews_user_place', 'reviews', ['user_id', 'place_id'], unique=True)
+
+
+def downgrade():
+    op.drop_index('uq_reviews_user_place', table_name='reviews')
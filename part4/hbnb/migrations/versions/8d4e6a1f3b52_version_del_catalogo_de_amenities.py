@@ -0,0 +1,32 @@
+"""Version del catalogo de amenities
+
+Revision ID: 8d4e6a1f3b52
+Revises: 4b9e2f7a1c63
+Create Date: 2026-10-18 21:12:05.418337
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8d4e6a1f3b52'
+down_revision = '4b9e2f7a1c63'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Contador que suben las escrituras de amenities; cada proceso compara
+    # su foto del catálogo con él (app.persistence.amenity_catalog)
+    catalog_versions = op.create_table(
+        'catalog_versions',
+        sa.Column('name', sa.String(length=50), nullable=False),
+        sa.Column('version', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('name')
+    )
+    op.bulk_insert(catalog_versions, [{'name': 'amenities', 'version': 0}])
+
+
+def downgrade():
+    op.drop_table('catalog_versions')
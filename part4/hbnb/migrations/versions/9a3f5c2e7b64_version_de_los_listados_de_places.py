@@ -0,0 +1,28 @@
+"""Version de los listados de places
+
+Revision ID: 9a3f5c2e7b64
+Revises: 2c7e9b4d5a18
+Create Date: 2026-10-18 23:31:47.602115
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9a3f5c2e7b64'
+down_revision = '2c7e9b4d5a18'
+branch_labels = None
+depends_on = None
+
+catalog_versions = sa.table('catalog_versions', sa.column('name', sa.String), sa.column('version', sa.Integer))
+
+
+def upgrade():
+    # Contador que suben las escrituras de places y reviews; es el ETag de
+    # GET /places/ y /places/reviews/ (app.persistence.versions)
+    op.bulk_insert(catalog_versions, [{'name': 'places', 'version': 0}])
+
+
+def downgrade():
+    op.execute(catalog_versions.delete().where(catalog_versions.c.name == 'places'))
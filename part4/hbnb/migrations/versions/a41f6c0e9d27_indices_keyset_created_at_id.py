@@ -0,0 +1,29 @@
+"""Indices keyset (created_at, id)
+
+Revision ID: a41f6c0e9d27
+Revises: 3c9a1e7d2b41
+Create Date: 2026-10-18 10:03:11.502219
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a41f6c0e9d27'
+down_revision = '3c9a1e7d2b41'
+branch_labels = None
+depends_on = None
+
+TABLES = ['users', 'places', 'reviews', 'amenities']
+
+
+def upgrade():
+    # Índices para la paginación por clave sobre (created_at, id)
+    for table in TABLES:
+        op.create_index(f'ix_{table}_created_at_id', table, ['created_at', 'id'], unique=False)
+
+
+def downgrade():
+    for table in reversed(TABLES):
+        op.drop_index(f'ix_{table}_created_at_id', table_name=table)
@@ -0,0 +1,102 @@
+"""Indice de texto completo ligado a places.id
+
+Revision ID: a7d2e9c4f815
+Revises: f0b7c3d9e412
+Create Date: 2026-10-19 16:48:22.631904
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a7d2e9c4f815'
+down_revision = 'f0b7c3d9e412'
+branch_labels = None
+depends_on = None
+
+# Sentencias fijas (no las de app.persistence.fulltext) para que la
+# migración no cambie si el módulo cambia más adelante. La tabla FTS guarda
+# el id del lugar y toma su rowid de places_fts_ids, en lugar del rowid
+# implícito de places, que un VACUUM puede renumerar.
+TRIGGERS = ['places_fts_au', 'places_fts_ad', 'places_fts_ai']
+
+CREATE = [
+    """CREATE VIRTUAL TABLE places_fts USING fts5(
+        place_id UNINDEXED, title, description,
+        tokenize='unicode61 remove_diacritics 2'
+    )""",
+    """CREATE TABLE places_fts_ids (
+        rowid INTEGER PRIMARY KEY,
+        place_id VARCHAR(60) NOT NULL UNIQUE
+    )""",
+    """CREATE TRIGGER places_fts_ai AFTER INSERT ON places
+    WHEN NOT EXISTS (SELECT 1 FROM places_fts_pause) BEGIN
+        INSERT INTO places_fts_ids(place_id) VALUES (new.id);
+        INSERT INTO places_fts(rowid, place_id, title, description)
+        VALUES ((SELECT rowid FROM places_fts_ids WHERE place_id = new.id), new.id, new.title, new.description);
+    END""",
+    """CREATE TRIGGER places_fts_ad AFTER DELETE ON places BEGIN
+        DELETE FROM places_fts WHERE rowid = (SELECT rowid FROM places_fts_ids WHERE place_id = old.id);
+        DELETE FROM places_fts_ids WHERE place_id = old.id;
+    END""",
+    """CREATE TRIGGER places_fts_au AFTER UPDATE OF title, description ON places BEGIN
+        UPDATE places_fts SET title = new.title, description = new.description
+        WHERE rowid = (SELECT rowid FROM places_fts_ids WHERE place_id = old.id);
+    END""",
+]
+REBUILD = [
+    "INSERT INTO places_fts_ids(place_id) SELECT id FROM places",
+    """INSERT INTO places_fts(rowid, place_id, title, description)
+    SELECT ids.rowid, places.id, places.title, places.description
+    FROM places JOIN places_fts_ids AS ids ON ids.place_id = places.id""",
+]
+
+# Índice anterior (4b9e2f7a1c63): contenido externo sobre el rowid de places
+OLD_CREATE = [
+    """CREATE VIRTUAL TABLE places_fts USING fts5(
+        title, description,
+        content='places', content_rowid='rowid',
+        tokenize='unicode61 remove_diacritics 2'
+    )""",
+    """CREATE TRIGGER places_fts_ai AFTER INSERT ON places
+    WHEN NOT EXISTS (SELECT 1 FROM places_fts_pause) BEGIN
+        INSERT INTO places_fts(rowid, title, description)
+        VALUES (new.rowid, new.title, new.description);
+    END""",
+    """CREATE TRIGGER places_fts_ad AFTER DELETE ON places BEGIN
+        INSERT INTO places_fts(places_fts, rowid, title, description)
+        VALUES ('delete', old.rowid, old.title, old.description);
+    END""",
+    """CREATE TRIGGER places_fts_au AFTER UPDATE OF title, description ON places BEGIN
+        INSERT INTO places_fts(places_fts, rowid, title, description)
+        VALUES ('delete', old.rowid, old.title, old.description);
+        INSERT INTO places_fts(rowid, title, description)
+        VALUES (new.rowid, new.title, new.description);
+    END""",
+]
+OLD_REBUILD = ["INSERT INTO places_fts(places_fts) VALUES ('rebuild')"]
+
+
+def _drop_index():
+    for trigger in TRIGGERS:
+        op.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+    op.execute("DROP TABLE IF EXISTS places_fts")
+
+
+def upgrade():
+    # Solo SQLite: en MySQL el índice FULLTEXT vive en la propia tabla places
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+    _drop_index()
+    for statement in CREATE + REBUILD:
+        op.execute(statement)
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+    _drop_index()
+    op.execute("DROP TABLE IF EXISTS places_fts_ids")
+    for statement in OLD_CREATE + OLD_REBUILD:
+        op.execute(statement)
@@ -0,0 +1,45 @@
+"""Agregados de rating en places
+
+Revision ID: b6f19a2d7e58
+Revises: 5e7d0b3a8c16
+Create Date: 2026-10-18 13:55:21.604118
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b6f19a2d7e58'
+down_revision = '5e7d0b3a8c16'
+branch_labels = None
+depends_on = None
+
+COLUMNS = ['review_count', 'rating_sum'] + [f'rating_hist_{r}' for r in range(1, 6)]
+
+
+def upgrade():
+    with op.batch_alter_table('places') as batch_op:
+        for name in COLUMNS:
+            batch_op.add_column(sa.Column(name, sa.Integer(), nullable=False, server_default='0'))
+
+    # Rellenar los agregados con una consulta agrupada sobre reviews
+    places = sa.table('places', sa.column('id', sa.String), *[sa.column(name, sa.Integer) for name in COLUMNS])
+    reviews = sa.table('reviews', sa.column('place_id', sa.String), sa.column('rating', sa.Integer))
+    conn = op.get_bind()
+    rows = conn.execute(
+        sa.select(reviews.c.place_id, sa.func.count(), sa.func.sum(reviews.c.rating),
+                  *[sa.func.sum(sa.case((reviews.c.rating == r, 1), else_=0)) for r in range(1, 6)])
+        .group_by(reviews.c.place_id)
+    ).fetchall()
+    if rows:
+        conn.execute(
+            places.update().where(places.c.id == sa.bindparam('place_id')),
+            [dict(zip(['place_id'] + COLUMNS, row)) for row in rows]
+        )
+
+
+def downgrade():
+    with op.batch_alter_table('places') as batch_op:
+        for name in reversed(COLUMNS):
+            batch_op.drop_column(name)
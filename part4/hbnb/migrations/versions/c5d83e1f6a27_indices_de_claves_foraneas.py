@@ -0,0 +1,47 @@
+"""Indices de claves foraneas
+
+Revision ID: c5d83e1f6a27
+Revises: 7f2c4d6e9b10
+Create Date: 2026-10-18 17:05:12.418930
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c5d83e1f6a27'
+down_revision = '7f2c4d6e9b10'
+branch_labels = None
+depends_on = None
+
+# reviews.user_id ya está cubierto por uq_reviews_user_place (primera columna)
+# y place_amenity.place_id por la clave primaria (place_id, amenity_id).
+INDEXES = [
+    ('ix_places_user_id', 'places', ['user_id']),
+    ('ix_reviews_place_id', 'reviews', ['place_id']),
+    ('ix_place_amenity_amenity_id', 'place_amenity', ['amenity_id']),
+]
+
+
+def upgrade():
+    dialect = op.get_bind().dialect.name
+    for name, table, columns in INDEXES:
+        if dialect == 'mysql':
+            # Construcción en línea: InnoDB no bloquea lecturas ni escrituras
+            op.execute(f"ALTER TABLE {table} ADD INDEX {name} ({', '.join(columns)}), "
+                       "ALGORITHM=INPLACE, LOCK=NONE")
+        else:
+            # En SQLite create_index no recrea la tabla (se conservan los triggers FTS)
+            with op.batch_alter_table(table) as batch_op:
+                batch_op.create_index(batch_op.f(name), columns, unique=False)
+
+
+def downgrade():
+    if op.get_bind().dialect.name == 'mysql':
+        # InnoDB exige un índice sobre cada clave foránea y estos reemplazan
+        # al índice implícito que creó la FK: no se pueden borrar.
+        return
+    for name, table, columns in reversed(INDEXES):
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.drop_index(batch_op.f(name))
@@ -0,0 +1,27 @@
+"""Indices de busqueda de places
+
+Revision ID: d82b5f4c1a93
+Revises: a41f6c0e9d27
+Create Date: 2026-10-18 11:20:54.871306
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd82b5f4c1a93'
+down_revision = 'a41f6c0e9d27'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Índices usados por GET /places/search (rango de precio y caja geográfica)
+    op.create_index(op.f('ix_places_price'), 'places', ['price'], unique=False)
+    op.create_index('ix_places_latitude_longitude', 'places', ['latitude', 'longitude'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_places_latitude_longitude', table_name='places')
+    op.drop_index(op.f('ix_places_price'), table_name='places')
@@ -0,0 +1,68 @@
+"""Texto completo en places
+
+Revision ID: e3a85c91f027
+Revises: b6f19a2d7e58
+Create Date: 2026-10-18 15:08:36.917452
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e3a85c91f027'
+down_revision = 'b6f19a2d7e58'
+branch_labels = None
+depends_on = None
+
+# Sentencias fijas (no las de app.persistence.fulltext) para que la
+# migración no cambie si el módulo cambia más adelante.
+SQLITE_CREATE = [
+    """CREATE VIRTUAL TABLE IF NOT EXISTS places_fts USING fts5(
+        title, description,
+        content='places', content_rowid='rowid',
+        tokenize='unicode61 remove_diacritics 2'
+    )""",
+    """CREATE TRIGGER IF NOT EXISTS places_fts_ai AFTER INSERT ON places BEGIN
+        INSERT INTO places_fts(rowid, title, description)
+        VALUES (new.rowid, new.title, new.description);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS places_fts_ad AFTER DELETE ON places BEGIN
+        INSERT INTO places_fts(places_fts, rowid, title, description)
+        VALUES ('delete', old.rowid, old.title, old.description);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS places_fts_au AFTER UPDATE OF title, description ON places BEGIN
+        INSERT INTO places_fts(places_fts, rowid, title, description)
+        VALUES ('delete', old.rowid, old.title, old.description);
+        INSERT INTO places_fts(rowid, title, description)
+        VALUES (new.rowid, new.title, new.description);
+    END""",
+]
+SQLITE_DROP = [
+    "DROP TRIGGER IF EXISTS places_fts_au",
+    "DROP TRIGGER IF EXISTS places_fts_ad",
+    "DROP TRIGGER IF EXISTS places_fts_ai",
+    "DROP TABLE IF EXISTS places_fts",
+]
+SQLITE_REBUILD = "INSERT INTO places_fts(places_fts) VALUES ('rebuild')"
+MYSQL_INDEX = 'ix_places_fulltext'
+
+
+def upgrade():
+    dialect = op.get_bind().dialect.name
+    if dialect == 'sqlite':
+        # Tabla FTS5 + triggers, e indexar los lugares existentes
+        for statement in SQLITE_CREATE:
+            op.execute(statement)
+        op.execute(SQLITE_REBUILD)
+    elif dialect == 'mysql':
+        op.create_index(MYSQL_INDEX, 'places', ['title', 'description'], mysql_prefix='FULLTEXT')
+
+
+def downgrade():
+    dialect = op.get_bind().dialect.name
+    if dialect == 'sqlite':
+        for statement in SQLITE_DROP:
+            op.execute(statement)
+    elif dialect == 'mysql':
+        op.drop_index(MYSQL_INDEX, table_name='places')
@@ -0,0 +1,35 @@
+"""Version de los listados de places repartida en filas
+
+Revision ID: f0b7c3d9e412
+Revises: 9a3f5c2e7b64
+Create Date: 2026-10-19 10:12:05.418230
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f0b7c3d9e412'
+down_revision = '9a3f5c2e7b64'
+branch_labels = None
+depends_on = None
+
+catalog_versions = sa.table('catalog_versions', sa.column('name', sa.String), sa.column('version', sa.Integer))
+
+# Filas extra de la versión 'places' (app.persistence.versions.SHARDS); la
+# fila 'places' existente es la primera y conserva su valor
+SHARD_NAMES = [f'places.{shard}' for shard in range(1, 16)]
+
+
+def upgrade():
+    op.bulk_insert(catalog_versions, [{'name': name, 'version': 0} for name in SHARD_NAMES])
+
+
+def downgrade():
+    # La suma queda en la fila 'places' para que el ETag no retroceda
+    bind = op.get_bind()
+    total = bind.execute(sa.select(sa.func.sum(catalog_versions.c.version))
+                         .where(catalog_versions.c.name.in_(['places'] + SHARD_NAMES))).scalar() or 0
+    op.execute(catalog_versions.update().where(catalog_versions.c.name == 'places').values(version=total))
+    op.execute(catalog_versions.delete().where(catalog_versions.c.name.in_(SHARD_NAMES)))
@@ -0,0 +1,193 @@
+"""
+Revisa el plan de ejecución de cada consulta que emite la fachada.
+
+Pobla una base de pruebas con unos pocos datos, ejecuta cada operación
+de HBnBFacade capturando el SQL con un listener del engine y pasa cada
+SELECT/UPDATE/DELETE por EXPLAIN QUERY PLAN (SQLite) o EXPLAIN (MySQL).
+Termina con código 1 si alguna consulta recorre una tabla completa
+(`SCAN tabla` sin índice en SQLite, `type = ALL` en MySQL), salvo las
+operaciones de ALLOWED_FULL_SCANS, que lo hacen a propósito.
+
+Uso (desde part4/hbnb):
+    python -m scripts.explain_queries               # SQLite en memoria, db.create_all()
+    python -m scripts.explain_queries --migrate     # esquema creado con las migraciones
+    TEST_DATABASE_URL=mysql+pymysql://... python -m scripts.explain_queries --migrate
+"""
+import argparse
+import re
+import sys
+
+from flask_migrate import upgrade
+from sqlalchemy import event
+
+from app import create_app, db
+from app.models.amenity import Amenity
+from app.models.place import Place
+from app.models.review import Review
+from app.models.user import User
+from app.services.facade import facade
+
+# Operaciones que leen toda la tabla a propósito (listados sin paginar y reparación)
+ALLOWED_FULL_SCANS = {
+    'get_all_users': 'listado completo sin paginar',
+    'get_all_places': 'listado completo sin paginar',
+    'get_all_reviews': 'listado completo sin paginar',
+    'get_all_amenities': 'listado completo sin paginar',
+    'recompute_place_ratings': 'recalcula los agregados de todos los lugares',
+    'search_places(sort=rating)': 'el orden por promedio es una expresión sin índice',
+}
+
+EXPLAINABLE = re.compile(r'^\s*(SELECT|UPDATE|DELETE)\b', re.IGNORECASE)
+
+
+def seed():
+    """Crea unos pocos usuarios, lugares, amenities y reviews."""
+    users = [User(first_name='User', last_name=str(i), email=f'user{i}@example.com', password='x')
+             for i in range(5)]
+    amenities = [Amenity(name=name) for name in ('Wifi', 'Pool')]
+    db.session.add_all(users + amenities)
+    db.session.flush()
+    places = []
+    for i in range(6):
+        place = Place(title=f'Beach house {i}', description='Quiet house near the sea',
+                      price=50 + i * 10, latitude=18.0 + i * 0.01, longitude=-66.6, owner=users[0])
+        place.amenities.extend(amenities[:i % 3])
+        places.append(place)
+    db.session.add_all(places)
+    db.session.flush()
+    reviews = [Review(text='Ok', rating=1 + (i + j) % 5, place=place, user=user)
+               for i, place in enumerate(places) for j, user in enumerate(users[1:4])]
+    db.session.add_all(reviews)
+    db.session.commit()
+    facade.recompute_place_ratings()
+    return users, places, amenities, reviews
+
+
+def scenarios(users, places, amenities, reviews):
+    """Devuelve [(nombre, función)] con cada consulta de la fachada a revisar."""
+    place, user, review, amenity = places[0], users[1], reviews[0], amenities[0]
+    first_page = {}
+
+    def page(name, getter):
+        def run():
+            first_page[name] = getter(2, None)
+            return getter(2, first_page[name].next_cursor)
+        return run
+
+    def create_and_update_review():
+        created = facade.create_review({'text': 'New', 'rating': 4, 'user_id': users[4].id,
+                                        'place_id': places[-1].id})
+        facade.update_review(created['id'], {'rating': 2})
+        facade.delete_review(created['id'])
+
+    return [
+        ('get_user_by_email', lambda: facade.get_user_by_email('USER1@example.com')),
+        ('get_user', lambda: facade.get_user(user.id)),
+        ('get_all_users', facade.get_all_users),
+        ('get_users_page', page('users', facade.get_users_page)),
+        ('get_place', lambda: facade.get_place(place.id)),
+        ('get_all_places', facade.get_all_places),
+        ('get_places_page', page('places', facade.get_places_page)),
+        ('search_places(price)', lambda: facade.search_places({'min_price': 60, 'max_price': 80})),
+        ('search_places(bbox)', lambda: facade.search_places(
+            {'min_lat': 17.9, 'max_lat': 18.02, 'min_lon': -67, 'max_lon': -66})),
+        ('search_places(amenities)', lambda: facade.search_places(
+            {'amenities': [amenity.id], 'max_price': 100})),
+        ('search_places(q)', lambda: facade.search_places({'q': 'beach'})),
+        ('search_places(sort=price_asc)', lambda: facade.search_places({'sort': 'price_asc'}, limit=3)),
+        ('search_places(sort=rating)', lambda: facade.search_places({'sort': 'rating'}, limit=3)),
+        ('get_nearby_places', lambda: facade.get_nearby_places(18.0, -66.6, 5, limit=3)),
+        ('get_review_by_user_and_place', lambda: facade.get_review_by_user_and_place(user.id, place.id)),
+        ('get_reviews_by_place', lambda: facade.get_reviews_by_place(place.id)),
+        ('get_review', lambda: facade.get_review(review.id)),
+        ('get_all_reviews', facade.get_all_reviews),
+        ('get_reviews_page', page('reviews', facade.get_reviews_page)),
+        ('create/update/delete_review', create_and_update_review),
+        ('get_amenity', lambda: facade.get_amenity(amenity.id)),
+        ('get_all_amenities', facade.get_all_amenities),
+        ('get_amenities_page', page('amenities', facade.get_amenities_page)),
+        ('recompute_place_ratings', facade.recompute_place_ratings),
+    ]
+
+
+def capture(func):
+    """Ejecuta `func` y devuelve [(sql, parámetros)] de lo que mandó a la base."""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if not executemany and EXPLAINABLE.match(statement):
+            statements.append((statement, parameters))
+
+    event.listen(db.engine, 'before_cursor_execute', before_cursor_execute)
+    try:
+        func()
+        db.session.expire_all()
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', before_cursor_execute)
+    return statements
+
+
+def full_scans(statement, parameters):
+    """Devuelve (plan, tablas recorridas completas) de una consulta."""
+    conn = db.session.connection()
+    if conn.dialect.name == 'sqlite':
+        rows = conn.exec_driver_sql('EXPLAIN QUERY PLAN ' + statement, parameters).fetchall()
+        plan = [row[-1] for row in rows]
+        scans = []
+        for detail in plan:
+            match = re.match(r'SCAN (\w+)', detail)
+            # "SCAN t USING [COVERING] INDEX" y las tablas virtuales (FTS) usan índice
+            if match and 'USING' not in detail and 'VIRTUAL TABLE' not in detail \
+                    and match.group(1) != 'CONSTANT':
+                scans.append(match.group(1))
+        return plan, scans
+
+    rows = conn.exec_driver_sql('EXPLAIN ' + statement, parameters).mappings().fetchall()
+    plan = [f"{row['table']}: type={row['type']} key={row['key']}" for row in rows]
+    return plan, [row['table'] for row in rows if row['type'] == 'ALL']
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--migrate', action='store_true',
+                        help='crear el esquema con las migraciones en vez de db.create_all()')
+    parser.add_argument('--verbose', action='store_true', help='mostrar el plan de cada consulta')
+    args = parser.parse_args()
+
+    app = create_app('testing')
+    with app.app_context():
+        if args.migrate:
+            upgrade(directory='migrations')
+        else:
+            db.create_all()
+        data = seed()
+
+        failures = 0
+        for name, func in scenarios(*data):
+            for statement, parameters in capture(func):
+                plan, scans = full_scans(statement, parameters)
+                allowed = ALLOWED_FULL_SCANS.get(name)
+                if scans and not allowed:
+                    failures += 1
+                    status = 'FULL SCAN'
+                elif scans:
+                    status = f'permitido ({allowed})'
+                else:
+                    status = 'ok'
+                if args.verbose or (scans and not allowed):
+                    print(f'[{status}] {name}: {" ".join(statement.split())[:160]}')
+                    for line in plan:
+                        print(f'    {line}')
+            print(f'{name:32} revisado')
+
+        db.session.remove()
+        db.drop_all()
+
+    if failures:
+        print(f'\n{failures} consulta(s) recorren una tabla completa')
+        sys.exit(1)
+    print('\nNinguna consulta recorre una tabla completa')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+"""
+Precomprime los archivos estáticos (paso de build).
+
+Escribe junto a cada archivo de texto de static/ (js, css, html, svg,
+json, txt) su versión gzip (`.gz`, nivel 9) y, si está instalado el
+paquete brotli, la brotli (`.br`, calidad 11). app.compression sirve
+esas versiones directamente cuando el cliente las acepta y son más
+nuevas que el original; una variante que no ahorra bytes se borra.
+
+Uso (desde part4/hbnb):
+    python -m scripts.precompress_static            # carpeta static/ de la app
+    python -m scripts.precompress_static --path otra/carpeta
+"""
+import argparse
+import gzip
+import os
+
+from app import compression
+
+EXTENSIONS = ('.js', '.css', '.html', '.svg', '.json', '.txt')
+DEFAULT_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'static')
+
+
+def compress(data, encoding):
+    if encoding == 'br':
+        return compression.brotli.compress(data, quality=11)
+    return gzip.compress(data, compresslevel=9, mtime=0)
+
+
+def precompress(path):
+    """Genera las variantes de cada archivo; devuelve [(archivo, codificación, bytes antes, bytes después)]."""
+    written = []
+    for root, _, files in os.walk(path):
+        for name in sorted(files):
+            if not name.endswith(EXTENSIONS):
+                continue
+            source = os.path.join(root, name)
+            with open(source, 'rb') as f:
+                data = f.read()
+            for encoding in compression.available_encodings():
+                target = source + compression.SUFFIXES[encoding]
+                packed = compress(data, encoding)
+                if len(packed) >= len(data):
+                    if os.path.exists(target):
+                        os.remove(target)
+                    continue
+                with open(target, 'wb') as f:
+                    f.write(packed)
+                # Misma fecha que el original: si el original cambia, la variante queda vieja y no se sirve
+                stat = os.stat(source)
+                os.utime(target, (stat.st_atime, stat.st_mtime))
+                written.append((os.path.relpath(source, path), encoding, len(data), len(packed)))
+    return written
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--path', default=DEFAULT_PATH)
+    args = parser.parse_args()
+
+    written = precompress(args.path)
+    for name, encoding, before, after in written:
+        print(f"{name:<30} {encoding:>5} {before:>8} -> {after:>7} bytes ({after / before:.0%})")
+    if compression.brotli is None:
+        print("brotli no está instalado: solo se generaron variantes gzip.")
+
+
+if __name__ == '__main__':
+    main()
@@ -123,24 +123,35 @@ function setupPriceFilter() {
 
     priceFilter.addEventListener('change', async () => {
         const selectedPrice = priceFilter.value;
-        const placeCards = document.querySelectorAll('.place-card');
+        const token = getCookie('token');
 
         if (selectedPrice === 'All') {
-            const token = getCookie('token');
             await fetchPlaces(token);
         } else {
-            placeCards.forEach(card => {
-                const price = parseInt(card.getAttribute('data-price'));
-                if (price <= parseInt(selectedPrice)) {
-                    card.style.display = 'block';
-                } else {
-                    card.style.display = 'none';
-                }
-            });
+            await searchPlaces(token, { max_price: selectedPrice });
         }
     });
 }
 
+// Filtra en el servidor con /places/search en vez de ocultar tarjetas
+async function searchPlaces(token, filters) {
+    try {
+        const params = new URLSearchParams(filters);
+        const response = await fetch(`/api/v1/places/search?${params.toString()}`, {
+            headers: token ? { 'Authorization': `Bearer ${token}` } : {}
+        });
+
+        if (!response.ok) {
+            throw new Error('Failed to search places.');
+        }
+
+        const places = await response.json();
+        displayPlaces(places);
+    } catch (error) {
+        console.error('Error searching places:', error);
+    }
+}
+
 // -------------------- PÁGINA DE DETALLE DEL LUGAR -------------------- //
 function setupPlaceDetails() {
     const token = getCookie('token');
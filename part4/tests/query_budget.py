@@ -0,0 +1,81 @@
+import json
+import os
+from sqlalchemy import event
+from app import db
+from app.persistence import amenity_catalog
+from app.services.cache import get_cache
+
+# Presupuesto de consultas SQL por endpoint para las pruebas: cuántas
+# sentencias puede ejecutar como máximo cada ruta (incluido el cuerpo en
+# streaming, el ETag y el commit de la unidad de trabajo), con la caché de
+# lectura y el catálogo de amenities vacíos. Los presupuestos están en
+# query_budgets.json, con la regla de la ruta como clave
+# ("GET /api/v1/places/<string:place_id>"); si un cambio en to_dict, la
+# fachada o un endpoint los supera, la prueba falla y lista las sentencias.
+# Subir un presupuesto es un cambio deliberado en ese archivo.
+BUDGETS_PATH = os.path.join(os.path.dirname(__file__), 'query_budgets.json')
+
+
+def load_budgets():
+    """{'MÉTODO /regla': máximo de consultas} del archivo de presupuestos."""
+    with open(BUDGETS_PATH) as f:
+        return json.load(f)
+
+
+class QueryCounter:
+    """Guarda las sentencias que corren en el engine mientras el bloque está activo."""
+
+    def __init__(self, engine=None):
+        self.engine = engine if engine is not None else db.engine
+        self.statements = []
+
+    def __enter__(self):
+        event.listen(self.engine, 'before_cursor_execute', self._record)
+        return self
+
+    def __exit__(self, *exc_info):
+        event.remove(self.engine, 'before_cursor_execute', self._record)
+
+    def _record(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+
+    @property
+    def count(self):
+        return len(self.statements)
+
+
+class QueryBudgetMixin:
+    """Aserciones de presupuesto para un TestCase con self.app y self.client."""
+
+    budgets = None
+
+    def budget_key(self, method, path):
+        """Clave del presupuesto ('GET /api/v1/places/<string:place_id>') de una URL concreta."""
+        rule, _ = self.app.url_map.bind('localhost').match(path.split('?', 1)[0], method, return_rule=True)
+        return f'{method} {rule.rule}'
+
+    def count_queries(self, method, path, **kwargs):
+        """
+        Hace la petición con las cachés vacías y devuelve (respuesta, sentencias);
+        el cuerpo se lee dentro del conteo, así que cuenta también el streaming.
+        """
+        get_cache().clear()
+        self.app.extensions[amenity_catalog.EXTENSION_KEY].snapshot = None
+        with QueryCounter() as counter:
+            response = self.client.open(path, method=method, **kwargs)
+            response.get_data()
+            response.close()
+        self.assertLess(response.status_code, 400, f'{method} {path}: {response.get_data(as_text=True)}')
+        return response, counter.statements
+
+    def assertWithinQueryBudget(self, method, path, **kwargs):
+        """Falla si la petición ejecuta más consultas que su presupuesto; devuelve cuántas ejecutó."""
+        if QueryBudgetMixin.budgets is None:
+            QueryBudgetMixin.budgets = load_budgets()
+        key = self.budget_key(method, path)
+        self.assertIn(key, self.budgets, f'{key} no tiene presupuesto en query_budgets.json')
+        _, statements = self.count_queries(method, path, **kwargs)
+        budget = self.budgets[key]
+        self.assertLessEqual(len(statements), budget,
+                             f'{key}: {len(statements)} consultas, presupuesto {budget}\n' + '\n'.join(statements))
+        return len(statements)
@@ -0,0 +1,132 @@
+import unittest
+from sqlalchemy import event, update
+from flask_jwt_extended import create_access_token
+from app import create_app, db
+from app.models.user import User
+from app.models.amenity import Amenity
+from app.models.place import Place
+from app.persistence import amenity_catalog, versions
+from app.persistence.unit_of_work import unit_of_work
+from app.services.facade import facade
+
+
+class TestAmenityCatalog(unittest.TestCase):
+    """Pruebas para el catálogo de amenities en memoria (versionado en la base)"""
+
+    def setUp(self):
+        self.app = create_app('testing')
+        self.ctx = self.app.app_context()
+        self.ctx.push()
+        db.create_all()
+        self.admin = User(first_name="Admin", last_name="One", email="admin@example.com", password="x",
+                          is_admin=True)
+        db.session.add(self.admin)
+        db.session.commit()
+        for name in ("Wifi", "Pool", "Gym"):
+            facade.create_amenity({'name': name})
+        self.statements = []
+        event.listen(db.engine, 'before_cursor_execute', self._count)
+
+    def tearDown(self):
+        event.remove(db.engine, 'before_cursor_execute', self._count)
+        db.session.remove()
+        db.drop_all()
+        self.ctx.pop()
+
+    def _count(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+
+    def _new_transaction(self):
+        db.session.commit()
+        self.statements.clear()
+
+    def test_reads_from_memory(self):
+        """Verifica que las lecturas solo consultan la versión, una vez por transacción"""
+        facade.get_all_amenities()
+        self._new_transaction()
+        amenities = facade.get_all_amenities()
+        self.assertEqual([a['name'] for a in amenities], ['Wifi', 'Pool', 'Gym'])
+        self.assertEqual(facade.get_amenity(amenities[0]['id'])['name'], 'Wifi')
+        self.assertIsNone(facade.get_amenity('missing'))
+        self.assertEqual(len(self.statements), 1, self.statements)
+        self.assertIn('catalog_versions', self.statements[0])
+
+    def test_version_bump_reloads(self):
+        """Verifica que otro proceso que sube la versión obliga a recargar la foto"""
+        before = amenity_catalog.current()
+        self._new_transaction()
+        # Otro worker agrega una amenity y confirma su versión
+        db.session.add(Amenity(name="Sauna"))
+        db.session.commit()
+        after = amenity_catalog.current()
+        self.assertEqual(after.version, before.version + 1)
+        self.assertIsNotNone(after.id_for_name('Sauna'))
+
+        # Sin cambios de versión la foto es la misma (no se recarga)
+        db.session.commit()
+        self.assertIs(amenity_catalog.current(), after)
+
+        table = versions.catalog_versions
+        db.session.execute(update(table).where(table.c.name == versions.AMENITIES).values(version=after.version + 5))
+        db.session.commit()
+        self.assertIsNot(amenity_catalog.current(), after)
+
+    def test_name_uniqueness_and_mutations(self):
+        """Verifica duplicados, renombres y borrados contra el catálogo"""
+        with self.assertRaises(ValueError):
+            facade.create_amenity({'name': 'Wifi'})
+        wifi_id = amenity_catalog.current().id_for_name('Wifi')
+        self._new_transaction()
+
+        facade.update_amenity(wifi_id, {'name': 'Fast wifi'})
+        self.assertEqual(facade.get_amenity(wifi_id)['name'], 'Fast wifi')
+        self.assertTrue(facade.delete_amenity(wifi_id))
+        self.assertFalse(facade.delete_amenity(wifi_id))
+        self.assertEqual(sorted(a['name'] for a in facade.get_all_amenities()), ['Gym', 'Pool'])
+
+        bulk = facade.create_amenities_bulk([{'name': 'Pool'}, {'name': 'Spa'}])
+        self.assertEqual([e['index'] for e in bulk['errors']], [0])
+        self.assertIsNotNone(amenity_catalog.current().id_for_name('Spa'))
+
+    def test_rollback_does_not_publish(self):
+        """Verifica que una amenity que no se confirmó no queda en la foto del proceso"""
+        with self.assertRaises(RuntimeError):
+            with unit_of_work():
+                facade.create_amenity({'name': 'Ghost'})
+                self.assertIsNotNone(amenity_catalog.current().id_for_name('Ghost'))
+                raise RuntimeError("rollback")
+        self.assertIsNone(amenity_catalog.current().id_for_name('Ghost'))
+
+    def test_page_matches_repository(self):
+        """Verifica que la paginación en memoria coincide con la de la base"""
+        def collect(get_page):
+            pages, cursor = [], None
+            while True:
+                page = get_page(2, cursor)
+                pages.append([a['name'] if isinstance(a, dict) else a.name for a in page.items])
+                if not page.next_cursor:
+                    return pages, page
+                cursor = page.next_cursor
+        memory, last = collect(facade.get_amenities_page)
+        stored, _ = collect(facade.amenity_repo.get_page)
+        self.assertEqual(memory, stored)
+        previous = facade.get_amenities_page(2, last.prev_cursor)
+        self.assertEqual([a['name'] for a in previous.items], ['Wifi', 'Pool'])
+
+    def test_place_amenities_and_delete_endpoint(self):
+        """Verifica que los lugares muestran las amenities del catálogo y el DELETE responde 200"""
+        catalog = amenity_catalog.current()
+        place = Place(title="Cabin", description="", price=80, latitude=18.2, longitude=-66.5, owner=self.admin,
+                      amenities=[db.session.get(Amenity, catalog.id_for_name('Pool'))])
+        db.session.add(place)
+        db.session.commit()
+        self.assertEqual(facade.get_place(place.id)['amenities'], [catalog.get(catalog.id_for_name('Pool'))])
+
+        token = create_access_token(identity=self.admin.id)
+        response = self.app.test_client().delete(f"/api/v1/amenities/{catalog.id_for_name('Gym')}",
+                                                 headers={'Authorization': f'Bearer {token}'})
+        self.assertEqual(response.status_code, 200)
+
+
+if __name__ == "__main__":
+    unittest.main()
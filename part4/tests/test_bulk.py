@@ -0,0 +1,143 @@
+import unittest
+from unittest import mock
+from flask_jwt_extended import create_access_token
+from sqlalchemy.exc import IntegrityError
+from app import create_app, db
+from app.models.user import User
+from app.models.amenity import Amenity
+from app.models.place import Place
+from app.models.review import Review
+from app.models import geohash
+from app.services.facade import facade, DuplicateReviewError
+
+
+class TestBulk(unittest.TestCase):
+    """Pruebas para los endpoints de carga masiva (/bulk)"""
+
+    def setUp(self):
+        self.app = create_app('testing')
+        self.ctx = self.app.app_context()
+        self.ctx.push()
+        db.create_all()
+        self.owner = User(first_name="Owner", last_name="One", email="owner@example.com", password="x")
+        self.guest = User(first_name="Guest", last_name="Two", email="guest@example.com", password="x")
+        self.admin = User(first_name="Admin", last_name="Three", email="admin@example.com", password="x",
+                          is_admin=True)
+        self.wifi = Amenity(name="Wifi")
+        db.session.add_all([self.owner, self.guest, self.admin, self.wifi])
+        db.session.commit()
+        self.client = self.app.test_client()
+
+    def tearDown(self):
+        db.session.remove()
+        db.drop_all()
+        self.ctx.pop()
+
+    def _post(self, path, user, body):
+        token = create_access_token(identity=user.id)
+        return self.client.post(f'/api/v1{path}', json=body, headers={'Authorization': f'Bearer {token}'})
+
+    def test_places_bulk(self):
+        """Verifica que se insertan los lugares válidos y se informan los errores por índice"""
+        response = self._post('/places/bulk', self.owner, [
+            {'title': 'Cabin', 'price': 80, 'latitude': 18.2, 'longitude': -66.5, 'amenities': [self.wifi.id]},
+            {'title': 'Loft', 'price': -1, 'latitude': 18.4, 'longitude': -66.1},
+            {'title': 'Villa', 'price': 200, 'latitude': 18.3, 'longitude': -66.2, 'amenities': ['nope']},
+            {'title': 'Hut', 'price': 20, 'latitude': 95, 'longitude': -66.2},
+        ])
+        self.assertEqual(response.status_code, 207)
+        body = response.get_json()
+        self.assertEqual(len(body['created']), 1)
+        self.assertEqual([e['index'] for e in body['errors']], [1, 2, 3])
+
+        db.session.expire_all()
+        cabin = db.session.get(Place, body['created'][0])
+        self.assertEqual(cabin.user_id, self.owner.id)
+        self.assertEqual(cabin.geohash, geohash.encode(18.2, -66.5))
+        self.assertEqual([a.name for a in cabin.amenities], ['Wifi'])
+        self.assertEqual(facade.search_places({'q': 'cabin'})[0]['id'], cabin.id)
+
+        # Tras la carga el trigger vuelve a indexar fila por fila
+        self.assertEqual(db.session.execute(db.text("SELECT count(*) FROM places_fts_pause")).scalar(), 0)
+        facade.create_place({'title': 'Lighthouse', 'price': 90, 'latitude': 18.1, 'longitude': -66.3,
+                             'user_id': self.owner.id})
+        self.assertEqual([p['title'] for p in facade.search_places({'q': 'lighthouse'})], ['Lighthouse'])
+
+    def test_reviews_bulk_updates_aggregates(self):
+        """Verifica las reglas de reviews (dueño, duplicados) y los agregados del lugar"""
+        created = self._post('/places/bulk', self.owner, [
+            {'title': f'Place {i}', 'price': 10, 'latitude': 18.0, 'longitude': -66.0} for i in range(2)
+        ]).get_json()['created']
+
+        response = self._post('/places/reviews/bulk', self.guest, [
+            {'place_id': created[0], 'text': 'Great', 'rating': 5},
+            {'place_id': created[0], 'text': 'Again', 'rating': 1},
+            {'place_id': created[1], 'text': 'Ok', 'rating': 3},
+            {'place_id': 'missing', 'text': 'Ok', 'rating': 3},
+            {'place_id': created[1], 'text': '', 'rating': 3},
+        ])
+        self.assertEqual(response.status_code, 207)
+        self.assertEqual([e['index'] for e in response.get_json()['errors']], [1, 3, 4])
+
+        own = self._post('/places/reviews/bulk', self.owner, [{'place_id': created[0], 'text': 'Mine', 'rating': 5}])
+        self.assertEqual(own.status_code, 400)
+
+        db.session.expire_all()
+        first = facade.get_place(created[0])
+        self.assertEqual((first['review_count'], first['average_rating']), (1, 5.0))
+        self.assertEqual(first['rating_histogram']['5'], 1)
+
+    def test_reviews_bulk_concurrent_duplicate(self):
+        """Verifica que una reseña creada en paralelo con el lote da 409 y no toca los agregados"""
+        [place_id] = self._post('/places/bulk', self.owner, [
+            {'title': 'Cabin', 'price': 10, 'latitude': 18.0, 'longitude': -66.0}]).get_json()['created']
+        add_many = facade.review_repo.add_many
+
+        def concurrent_add_many(rows):
+            # Otra petición confirma la misma reseña después de la verificación previa
+            db.session.execute(db.insert(Review.__table__).values(
+                id='concurrent', text='Other', rating=1, place_id=place_id, user_id=self.guest.id))
+            return add_many(rows)
+
+        with mock.patch.object(facade.review_repo, 'add_many', concurrent_add_many):
+            response = self._post('/places/reviews/bulk', self.guest,
+                                  [{'place_id': place_id, 'text': 'Great', 'rating': 5}])
+        self.assertEqual(response.status_code, 409)
+        db.session.expire_all()
+        self.assertEqual(facade.get_place(place_id)['review_count'], 0)
+
+    def test_reviews_bulk_other_integrity_errors(self):
+        """Verifica que solo uq_reviews_user_place se trata como reseña duplicada"""
+        [place_id] = self._post('/places/bulk', self.owner, [
+            {'title': 'Cabin', 'price': 10, 'latitude': 18.0, 'longitude': -66.0}]).get_json()['created']
+        add_many = facade.review_repo.add_many
+
+        def failing_add_many(rows):
+            db.session.execute(db.insert(Review.__table__).values(
+                id='broken', text=None, rating=1, place_id=place_id, user_id=self.guest.id))
+            return add_many(rows)
+
+        with mock.patch.object(facade.review_repo, 'add_many', failing_add_many), \
+                self.assertRaises(IntegrityError) as raised:
+            facade.create_reviews_bulk([{'place_id': place_id, 'text': 'Great', 'rating': 5}], self.guest.id)
+        self.assertNotIsInstance(raised.exception, DuplicateReviewError)
+
+    def test_amenities_bulk(self):
+        """Verifica que solo un admin crea amenities en lote y que se rechazan los duplicados"""
+        items = [{'name': 'Pool'}, {'name': 'Wifi'}, {'name': 'Pool'}, {'name': 'Gym'}]
+        self.assertEqual(self._post('/amenities/bulk', self.owner, items).status_code, 403)
+
+        response = self._post('/amenities/bulk', self.admin, items)
+        self.assertEqual(response.status_code, 207)
+        self.assertEqual([e['index'] for e in response.get_json()['errors']], [1, 2])
+        db.session.expire_all()
+        self.assertEqual(sorted(a.name for a in Amenity.query.all()), ['Gym', 'Pool', 'Wifi'])
+
+    def test_invalid_body(self):
+        """Verifica que el cuerpo debe ser un arreglo no vacío"""
+        self.assertEqual(self._post('/places/bulk', self.owner, {'title': 'x'}).status_code, 400)
+        self.assertEqual(self._post('/places/bulk', self.owner, []).status_code, 400)
+
+
+if __name__ == "__main__":
+    unittest.main()
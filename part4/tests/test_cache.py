@@ -0,0 +1,151 @@
+import unittest
+from unittest import mock
+from sqlalchemy import event
+from flask_jwt_extended import create_access_token
+from app import create_app, db
+from app.models.user import User
+from app.models.amenity import Amenity
+from app.models.place import Place
+from app.persistence.unit_of_work import unit_of_work
+from app.services import cache
+from app.services.facade import facade
+
+
+class TestCache(unittest.TestCase):
+    """Pruebas para la caché de lectura de lugares y reseñas"""
+
+    BACKEND = 'local'
+
+    def setUp(self):
+        self.app = create_app('testing')
+        self.app.config['CACHE_BACKEND'] = self.BACKEND
+        cache.init_app(self.app)
+        self.ctx = self.app.app_context()
+        self.ctx.push()
+        db.create_all()
+        self.owner = User(first_name="Owner", last_name="One", email="owner@example.com", password="x")
+        self.guest = User(first_name="Guest", last_name="Two", email="guest@example.com", password="x",
+                          is_admin=True)
+        self.wifi = Amenity(name="Wifi")
+        db.session.add_all([self.owner, self.guest, self.wifi])
+        db.session.flush()
+        self.place = Place(title="Cabin", description="", price=80, latitude=18.2, longitude=-66.5,
+                           owner=self.owner, amenities=[self.wifi])
+        db.session.add(self.place)
+        db.session.commit()
+        self.place_id = self.place.id
+        self.statements = []
+        event.listen(db.engine, 'before_cursor_execute', self._count)
+
+    def tearDown(self):
+        event.remove(db.engine, 'before_cursor_execute', self._count)
+        db.session.remove()
+        db.drop_all()
+        self.ctx.pop()
+
+    def _count(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+
+    def test_hit_skips_queries(self):
+        """Verifica que la segunda lectura no consulta la base y devuelve una copia"""
+        first = facade.get_place(self.place_id)
+        self.assertTrue(self.statements)
+        self.statements.clear()
+        first['title'] = 'Changed by the caller'
+
+        second = facade.get_place(self.place_id)
+        self.assertEqual(self.statements, [])
+        self.assertEqual(second['title'], 'Cabin')
+        self.assertIsNone(facade.get_place('missing'))
+
+        stats = cache.get_cache().stats()
+        self.assertEqual((stats['hits'], stats['misses'], stats['backend']), (1, 2, self.BACKEND))
+
+    def test_review_mutations_invalidate(self):
+        """Verifica que crear, editar y borrar reseñas invalida el detalle y las reseñas del lugar"""
+        self.assertEqual(facade.get_place_by_id(self.place_id)['reviews'], [])
+        review = facade.create_review({'text': 'Great', 'rating': 5, 'place_id': self.place_id,
+                                       'user_id': self.guest.id})
+        self.assertEqual(facade.get_place(self.place_id)['review_count'], 1)
+        self.assertEqual([r['rating'] for r in facade.get_reviews_by_place(self.place_id)], [5])
+
+        facade.update_review(review['id'], {'rating': 2})
+        self.assertEqual(facade.get_place_by_id(self.place_id)['reviews'][0]['rating'], 2)
+        self.assertEqual(facade.get_place(self.place_id)['average_rating'], 2.0)
+
+        facade.delete_review(review['id'])
+        self.assertEqual(facade.get_place(self.place_id)['review_count'], 0)
+        self.assertEqual(facade.get_reviews_by_place(self.place_id), [])
+
+    def test_place_user_and_amenity_changes_invalidate(self):
+        """Verifica la invalidación por cambios del lugar, del dueño y de sus amenities"""
+        facade.get_place(self.place_id)
+        facade.update_place(self.place_id, self.owner.id, {'title': 'Loft'})
+        self.assertEqual(facade.get_place(self.place_id)['title'], 'Loft')
+
+        facade.update_user(self.owner.id, {'first_name': 'Ana'})
+        self.assertEqual(facade.get_place(self.place_id)['user_name'], 'Ana One')
+
+        facade.update_amenity(self.wifi.id, {'name': 'Fast wifi'})
+        self.assertEqual(facade.get_place(self.place_id)['amenities'][0]['name'], 'Fast wifi')
+
+        facade.delete_place(self.place_id, self.owner.id)
+        self.assertIsNone(facade.get_place(self.place_id))
+
+    def test_uncommitted_reads_not_cached(self):
+        """Verifica que un rollback no deja en caché datos que nunca se confirmaron"""
+        with self.assertRaises(RuntimeError):
+            with unit_of_work():
+                facade.update_place(self.place_id, self.owner.id, {'title': 'Never committed'})
+                self.assertEqual(facade.get_place(self.place_id)['title'], 'Never committed')
+                raise RuntimeError("rollback")
+        db.session.expire_all()
+        self.assertEqual(facade.get_place(self.place_id)['title'], 'Cabin')
+
+    def test_stats_endpoint(self):
+        """Verifica que /cache/stats expone los contadores solo a un admin"""
+        facade.get_place(self.place_id)
+        facade.get_place(self.place_id)
+        client = self.app.test_client()
+
+        def get(user):
+            token = create_access_token(identity=user.id)
+            return client.get('/api/v1/cache/stats', headers={'Authorization': f'Bearer {token}'})
+        self.assertEqual(get(self.owner).status_code, 403)
+        response = get(self.guest)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_json()['hits'], 1)
+
+
+class TestSharedCache(TestCache):
+    """Las mismas pruebas con el backend compartido (sustituto local de Redis)"""
+
+    BACKEND = 'shared'
+
+
+class TestLocalBackend(unittest.TestCase):
+    """Pruebas del backend LRU con TTL"""
+
+    def test_lru_eviction(self):
+        """Verifica que se descarta la entrada usada hace más tiempo"""
+        backend = cache.LocalCache(max_entries=2, ttl=60)
+        backend.set('a', b'1')
+        backend.set('b', b'2')
+        backend.get('a')
+        backend.set('c', b'3')
+        self.assertEqual((backend.get('a'), backend.get('b'), backend.get('c')), (b'1', None, b'3'))
+
+    def test_ttl_expiry(self):
+        """Verifica que una entrada vencida ya no se devuelve"""
+        backend = cache.LocalCache(max_entries=10, ttl=60)
+        with mock.patch('app.services.cache.time.monotonic', return_value=1000.0):
+            backend.set('a', b'1')
+        with mock.patch('app.services.cache.time.monotonic', return_value=1059.0):
+            self.assertEqual(backend.get('a'), b'1')
+        with mock.patch('app.services.cache.time.monotonic', return_value=1061.0):
+            self.assertIsNone(backend.get('a'))
+        self.assertEqual(backend.size(), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,117 @@
+import gzip
+import json
+import os
+import shutil
+import tempfile
+import unittest
+import zlib
+from flask_jwt_extended import create_access_token
+from app import create_app, db, compression
+from app.models.user import User
+from app.models.place import Place
+from scripts import precompress_static
+
+
+class TestCompression(unittest.TestCase):
+    """Pruebas para la compresión negociada de respuestas y los estáticos precomprimidos"""
+
+    def setUp(self):
+        self.app = create_app('testing')
+        self.ctx = self.app.app_context()
+        self.ctx.push()
+        db.create_all()
+        self.admin = User(first_name="Admin", last_name="One", email="admin@example.com", password="x",
+                          is_admin=True)
+        db.session.add(self.admin)
+        db.session.flush()
+        db.session.add_all([Place(title=f"Place {i}", description="A quiet place " * 10, price=10 + i,
+                                  latitude=1.0, longitude=2.0, owner=self.admin) for i in range(20)])
+        db.session.commit()
+        self.client = self.app.test_client()
+
+    def tearDown(self):
+        db.session.remove()
+        db.drop_all()
+        self.ctx.pop()
+
+    def _get(self, path, accept=None, **headers):
+        if accept is not None:
+            headers['Accept-Encoding'] = accept
+        return self.client.get(path, headers=headers)
+
+    def test_gzip_json(self):
+        """Verifica que una página grande viaja con gzip y se descomprime al mismo JSON"""
+        plain = self._get('/api/v1/places/?limit=20')
+        packed = self._get('/api/v1/places/?limit=20', 'gzip, deflate')
+        self.assertEqual(packed.headers['Content-Encoding'], 'gzip')
+        self.assertIn('Accept-Encoding', packed.headers['Vary'])
+        self.assertEqual(int(packed.headers['Content-Length']), len(packed.data))
+        self.assertLess(len(packed.data), len(plain.data) / 3)
+        self.assertEqual(json.loads(gzip.decompress(packed.data)), plain.get_json())
+        self.assertNotIn('Content-Encoding', plain.headers)
+        self.assertIn('Accept-Encoding', plain.headers['Vary'])
+
+        # El ETag pasa a débil y sigue sirviendo para revalidar
+        self.assertTrue(packed.headers['ETag'].startswith('W/'))
+        revalidated = self._get('/api/v1/places/?limit=20', 'gzip', **{'If-None-Match': packed.headers['ETag']})
+        self.assertEqual(revalidated.status_code, 304)
+
+    def test_negotiation_and_threshold(self):
+        """Verifica q=0, codificaciones desconocidas y que las respuestas chicas no se comprimen"""
+        self.assertNotIn('Content-Encoding', self._get('/api/v1/places/', 'gzip;q=0').headers)
+        self.assertNotIn('Content-Encoding', self._get('/api/v1/places/', 'zstd').headers)
+        self.assertNotIn('Content-Encoding', self._get('/api/v1/places/missing', 'gzip').headers)
+        self.app.config['COMPRESSION_ENABLED'] = False
+        self.assertNotIn('Content-Encoding', self._get('/api/v1/places/', 'gzip').headers)
+
+    @unittest.skipUnless(compression.brotli, "brotli no está instalado")
+    def test_brotli_preferred(self):
+        """Verifica que con brotli disponible se prefiere br"""
+        response = self._get('/api/v1/places/', 'gzip, br')
+        self.assertEqual(response.headers['Content-Encoding'], 'br')
+        self.assertEqual(json.loads(compression.brotli.decompress(response.data)),
+                         self._get('/api/v1/places/').get_json())
+        self.assertEqual(self._get('/api/v1/places/', 'gzip, br;q=0.5').headers['Content-Encoding'], 'gzip')
+
+    def test_streamed_export(self):
+        """Verifica que el NDJSON en streaming se comprime por trozos"""
+        token = create_access_token(identity=self.admin.id)
+        path = '/api/v1/export/places.ndjson'
+        headers = {'Authorization': f'Bearer {token}'}
+        plain = self.client.get(path, headers=headers)
+        response = self.client.get(path, headers={**headers, 'Accept-Encoding': 'gzip'}, buffered=False)
+        self.assertEqual(response.headers['Content-Encoding'], 'gzip')
+        self.assertNotIn('Content-Length', response.headers)
+        chunks = list(response.response)
+        self.assertGreater(len(chunks), 1)
+        # Cada trozo termina en un flush: se puede descomprimir lo recibido hasta ahí
+        partial = zlib.decompressobj(31).decompress(chunks[0])
+        self.assertTrue(plain.data.startswith(partial))
+        self.assertEqual(gzip.decompress(b''.join(chunks)), plain.data)
+
+    def test_precompressed_static(self):
+        """Verifica que se sirve la variante .gz de un estático al día, y el original si quedó vieja"""
+        folder = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, folder)
+        with open(os.path.join(folder, 'scripts.js'), 'w') as f:
+            f.write('console.log("hbnb");\n' * 200)
+        self.assertEqual([row[:2] for row in precompress_static.precompress(folder)][-1], ('scripts.js', 'gzip'))
+        self.app.static_folder = folder
+
+        response = self._get('/static/scripts.js', 'gzip')
+        self.assertEqual(response.headers['Content-Encoding'], 'gzip')
+        self.assertEqual(response.mimetype, 'text/javascript')
+        self.assertEqual(gzip.decompress(response.data), self._get('/static/scripts.js').data)
+        self.assertIn('Accept-Encoding', response.headers['Vary'])
+        response.close()
+
+        source = os.path.join(folder, 'scripts.js')
+        os.utime(source, (os.path.getatime(source), os.path.getmtime(source) + 10))
+        response = self._get('/static/scripts.js', 'gzip')
+        self.assertNotIn('Content-Encoding', response.headers)
+        response.close()
+        self.assertEqual(self._get('/static/../config.py', 'gzip').status_code, 404)
+
+
+if __name__ == "__main__":
+    unittest.main()
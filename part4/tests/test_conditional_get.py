@@ -0,0 +1,150 @@
+import unittest
+from unittest import mock
+from sqlalchemy import event, select
+from app import create_app, db
+from app.models.user import User
+from app.models.place import Place
+from app.models.amenity import Amenity
+from app.persistence import versions
+from app.services.facade import facade
+
+
+class TestConditionalGet(unittest.TestCase):
+    """Pruebas para ETag / Last-Modified y las respuestas 304"""
+
+    def setUp(self):
+        self.app = create_app('testing')
+        self.ctx = self.app.app_context()
+        self.ctx.push()
+        db.create_all()
+        self.client = self.app.test_client()
+        self.owner = User(first_name="Owner", last_name="One", email="owner@example.com", password="x")
+        self.guest = User(first_name="Guest", last_name="Two", email="guest@example.com", password="x")
+        self.wifi = Amenity(name="Wifi")
+        db.session.add_all([self.owner, self.guest, self.wifi])
+        db.session.flush()
+        self.places = [Place(title=f"Place {i}", description="", price=10 + i, latitude=1.0, longitude=2.0,
+                             owner=self.owner, amenities=[self.wifi]) for i in range(2)]
+        db.session.add_all(self.places)
+        db.session.commit()
+        self.place_id = self.places[0].id
+        self.review = facade.create_review({'text': 'Nice', 'rating': 4, 'place_id': self.place_id,
+                                            'user_id': self.guest.id})
+        self.statements = []
+        event.listen(db.engine, 'before_cursor_execute', self._count)
+
+    def tearDown(self):
+        event.remove(db.engine, 'before_cursor_execute', self._count)
+        db.session.remove()
+        db.drop_all()
+        self.ctx.pop()
+
+    def _count(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+
+    def _etag(self, path):
+        response = self.client.get(path)
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.headers['ETag'].startswith('"'))
+        return response.headers['ETag']
+
+    def _revalidate(self, path, etag):
+        return self.client.get(path, headers={'If-None-Match': etag}).status_code
+
+    def test_place_detail(self):
+        """Verifica el 304 con una sola consulta y que reseñas, amenities y dueño cambian el ETag"""
+        path = f'/api/v1/places/{self.place_id}'
+        etag = self._etag(path)
+        self.statements.clear()
+        response = self.client.get(path, headers={'If-None-Match': etag})
+        self.assertEqual((response.status_code, response.data), (304, b''))
+        self.assertEqual(response.headers['ETag'], etag)
+        self.assertEqual(len(self.statements), 1, self.statements)
+        self.assertEqual(self._revalidate(path, f'W/{etag}'), 304)
+        self.assertEqual(self._revalidate(path, '*'), 304)
+
+        for change in (lambda: facade.update_review(self.review['id'], {'text': 'Great'}),
+                       lambda: facade.update_amenity(self.wifi.id, {'name': 'Fast wifi'}),
+                       lambda: facade.update_user(self.owner.id, {'first_name': 'Ana'}),
+                       lambda: facade.delete_review(self.review['id'])):
+            change()
+            self.assertEqual(self._revalidate(path, etag), 200)
+            etag = self._etag(path)
+        self.assertEqual(self.client.get('/api/v1/places/missing').status_code, 404)
+
+    def test_if_modified_since(self):
+        """Verifica Last-Modified y que If-None-Match tiene prioridad"""
+        path = f'/api/v1/places/{self.place_id}'
+        response = self.client.get(path)
+        last_modified = response.headers['Last-Modified']
+        self.assertEqual(self.client.get(path, headers={'If-Modified-Since': last_modified}).status_code, 304)
+        self.assertEqual(self.client.get(path, headers={'If-Modified-Since': 'Thu, 01 Jan 1970 00:00:00 GMT'})
+                         .status_code, 200)
+        self.assertEqual(self.client.get(path, headers={'If-Modified-Since': last_modified,
+                                                        'If-None-Match': '"other"'}).status_code, 200)
+
+    def test_listings_detect_deletes(self):
+        """Verifica que los listados de lugares y reseñas cambian de ETag también al borrar"""
+        places, reviews = self._etag('/api/v1/places/'), self._etag('/api/v1/places/reviews/')
+        page = self._etag('/api/v1/places/?limit=1')
+        self.assertEqual(self._revalidate('/api/v1/places/', places), 304)
+        self.assertEqual(self._revalidate('/api/v1/places/?limit=1', page), 304)
+        self.assertNotIn('Last-Modified', self.client.get('/api/v1/places/').headers)
+
+        facade.delete_place(self.places[1].id, self.owner.id)
+        self.assertEqual(self._revalidate('/api/v1/places/', places), 200)
+        places = self._etag('/api/v1/places/')
+        facade.delete_review(self.review['id'])
+        self.assertEqual(self._revalidate('/api/v1/places/reviews/', reviews), 200)
+        self.assertEqual(self._revalidate('/api/v1/places/', places), 200)
+        self.assertEqual(self.client.get('/api/v1/places/?cursor=nope').status_code, 400)
+
+    def test_recompute_ratings_changes_listing_etag(self):
+        """Verifica que recalcular los agregados de rating cambia el ETag del listado de lugares"""
+        places = self._etag('/api/v1/places/')
+        db.session.execute(db.update(Place).where(Place.id == self.place_id).values(review_count=0, rating_sum=0))
+        db.session.commit()
+        facade.recompute_place_ratings()
+        self.assertEqual(self._revalidate('/api/v1/places/', places), 200)
+
+    def test_places_version_is_sharded(self):
+        """Verifica que cada hilo sube siempre una sola fila de la versión de places y que se leen sumadas"""
+        table = versions.catalog_versions
+
+        def rows():
+            return dict(db.session.execute(select(table.c.name, table.c.version)
+                                           .where(table.c.name.like('places%'))).all())
+        before = versions.read(db.session, versions.PLACES)
+        start = rows()
+        self.assertEqual(len(start), versions.SHARDS[versions.PLACES])
+        with mock.patch('app.persistence.versions.threading.get_ident', return_value=1):
+            versions.bump(db.session, versions.PLACES)
+            versions.bump(db.session, versions.PLACES)
+        changed = {name: value - start[name] for name, value in rows().items() if value != start[name]}
+        self.assertEqual(list(changed.values()), [2])
+
+        for ident in range(2, 40):
+            with mock.patch('app.persistence.versions.threading.get_ident', return_value=ident):
+                versions.bump(db.session, versions.PLACES)
+        self.assertEqual(versions.read(db.session, versions.PLACES), before + 40)
+        self.assertGreater(sum(1 for name, value in rows().items() if value != start[name]), 1)
+
+    def test_amenities(self):
+        """Verifica el ETag del catálogo de amenities y de cada amenity"""
+        listing, detail = self._etag('/api/v1/amenities/'), self._etag(f'/api/v1/amenities/{self.wifi.id}')
+        self.assertEqual(self._revalidate('/api/v1/amenities/', listing), 304)
+        self.assertEqual(self._revalidate(f'/api/v1/amenities/{self.wifi.id}', detail), 304)
+        facade.update_amenity(self.wifi.id, {'name': 'Fast wifi'})
+        self.assertEqual(self._revalidate('/api/v1/amenities/', listing), 200)
+        self.assertEqual(self._revalidate(f'/api/v1/amenities/{self.wifi.id}', detail), 200)
+
+    def test_etag_depends_on_encoding(self):
+        """Verifica que el ETag cambia si cambian los bytes (documentos materializados)"""
+        path = f'/api/v1/places/{self.place_id}'
+        etag = self._etag(path)
+        self.app.config['PLACE_DOCUMENTS'] = True
+        self.assertEqual(self._revalidate(path, etag), 200)
+
+
+if __name__ == "__main__":
+    unittest.main()
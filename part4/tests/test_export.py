@@ -0,0 +1,88 @@
+import json
+import unittest
+from flask_jwt_extended import create_access_token
+from app import create_app, db
+from app.models.user import User
+from app.models.amenity import Amenity
+from app.models.place import Place
+from app.models.review import Review
+from app.services.facade import facade
+
+
+class TestExport(unittest.TestCase):
+    """Pruebas para la exportación NDJSON en streaming (/export)"""
+
+    def setUp(self):
+        self.app = create_app('testing')
+        self.ctx = self.app.app_context()
+        self.ctx.push()
+        db.create_all()
+        self.admin = User(first_name="Admin", last_name="One", email="admin@example.com", password="secret-hash",
+                          is_admin=True)
+        self.guest = User(first_name="Guest", last_name="Two", email="guest@example.com", password="x")
+        wifi = Amenity(name="Wifi")
+        db.session.add_all([self.admin, self.guest, wifi])
+        db.session.flush()
+        self.places = [Place(title=f"Place {i}", description="", price=10 + i, latitude=18.0, longitude=-66.0,
+                             owner=self.admin, amenities=[wifi] if i % 2 else None) for i in range(5)]
+        db.session.add_all(self.places)
+        db.session.flush()
+        db.session.add(Review(text="Great", rating=4, place=self.places[1], user=self.guest))
+        db.session.commit()
+        facade.recompute_place_ratings()
+        self.client = self.app.test_client()
+
+    def tearDown(self):
+        db.session.remove()
+        db.drop_all()
+        self.ctx.pop()
+
+    def _export(self, path, user=None):
+        token = create_access_token(identity=(user or self.admin).id)
+        return self.client.get(f'/api/v1/export/{path}', headers={'Authorization': f'Bearer {token}'})
+
+    def _lines(self, response):
+        return [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+
+    def test_export_places(self):
+        """Verifica que cada lugar es una línea JSON, ordenada por id, con amenities y agregados"""
+        response = self._export('places.ndjson')
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.is_streamed)
+        self.assertEqual(response.mimetype, 'application/x-ndjson')
+
+        places = self._lines(response)
+        self.assertEqual([p['id'] for p in places], sorted(p.id for p in self.places))
+        by_id = {p['id']: p for p in places}
+        reviewed = by_id[self.places[1].id]
+        self.assertEqual(len(reviewed['amenities']), 1)
+        self.assertEqual((reviewed['average_rating'], reviewed['rating_histogram']['4']), (4.0, 1))
+        self.assertEqual(by_id[self.places[0].id]['amenities'], [])
+
+    def test_resume_after_id(self):
+        """Verifica que `after` reanuda la exportación justo después del último id recibido"""
+        ids = sorted(p.id for p in self.places)
+        resumed = self._lines(self._export(f'places.ndjson?after={ids[1]}'))
+        self.assertEqual([p['id'] for p in resumed], ids[2:])
+
+    def test_users_without_passwords(self):
+        """Verifica que la exportación de usuarios no incluye contraseñas"""
+        users = self._lines(self._export('users.ndjson'))
+        self.assertEqual(len(users), 2)
+        self.assertTrue(all('password' not in u for u in users))
+        self.assertEqual(len(self._lines(self._export('reviews.ndjson'))), 1)
+        self.assertEqual(len(self._lines(self._export('amenities.ndjson'))), 1)
+
+    def test_batches(self):
+        """Verifica que la fachada entrega la tabla en lotes del tamaño pedido"""
+        sizes = [len(batch) for batch in facade.export_batches('places', batch_size=2)]
+        self.assertEqual(sizes, [2, 2, 1])
+
+    def test_access(self):
+        """Verifica que solo un admin exporta y que un recurso desconocido da 404"""
+        self.assertEqual(self._export('users.ndjson', user=self.guest).status_code, 403)
+        self.assertEqual(self._export('secrets.ndjson').status_code, 404)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,142 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+from app import create_app, db
+from app.models.user import User
+from app.models.amenity import Amenity
+from app.models.place import Place
+from app.services import importer
+from app.services.facade import facade
+
+
+class TestImport(unittest.TestCase):
+    """Pruebas para `flask hbnb import` (CSV/NDJSON por lotes con checkpoint)"""
+
+    def setUp(self):
+        self.app = create_app('testing')
+        self.ctx = self.app.app_context()
+        self.ctx.push()
+        db.create_all()
+        db.session.add_all([User(first_name="Owner", last_name="One", email="owner@example.com",
+                                 password='$2b$12$' + 'x' * 53),
+                            Amenity(name="Wifi"), Amenity(name="Pool")])
+        db.session.commit()
+        self.tmp = tempfile.mkdtemp()
+        self.runner = self.app.test_cli_runner()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+        db.session.remove()
+        db.drop_all()
+        self.ctx.pop()
+
+    def _write(self, name, text):
+        path = os.path.join(self.tmp, name)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(text)
+        return path
+
+    def _places_ndjson(self, count):
+        return self._write('places.ndjson', ''.join(
+            json.dumps({'title': f'Place {i}', 'price': 50 + i, 'latitude': 18.2, 'longitude': -66.5,
+                        'owner_email': 'OWNER@example.com', 'amenities': ['Wifi']}) + '\n'
+            for i in range(count)))
+
+    def test_import_users_csv(self):
+        """Verifica el CSV de usuarios: contraseña hasheada, is_admin y errores por número de registro"""
+        path = self._write('users.csv', "first_name,last_name,email,password,is_admin\n"
+                                        "Ana,Diaz,ana@example.com,secret,true\n"
+                                        "Bad,Mail,not-an-email,secret,false\n"
+                                        "Otro,Owner,owner@example.com,secret,false\n")
+        result = self.runner.invoke(args=['hbnb', 'import', 'users', path])
+        self.assertEqual(result.exit_code, 0, result.output)
+        self.assertIn("registro 2:", result.output)
+        self.assertIn("registro 3: Email already registered", result.output)
+
+        ana = User.query.filter_by(email='ana@example.com').one()
+        self.assertTrue(ana.is_admin)
+        self.assertTrue(ana.verify_password('secret'))
+        self.assertFalse(os.path.exists(path + '.checkpoint'))
+
+    def test_import_places_ndjson(self):
+        """Verifica que se resuelven dueño y amenities por nombre e informa las líneas inválidas"""
+        path = self._write('places.ndjson', "\n".join([
+            json.dumps({'title': 'Cabin', 'price': 80, 'latitude': 18.2, 'longitude': -66.5,
+                        'owner_email': 'owner@example.com', 'amenities': ['Wifi', 'Pool']}),
+            '{not json',
+            json.dumps({'title': 'Hut', 'price': 20, 'latitude': 18.2, 'longitude': -66.5,
+                        'owner_email': 'nobody@example.com'}),
+            json.dumps({'title': 'Shed', 'price': 20, 'latitude': 18.2, 'longitude': -66.5,
+                        'owner_email': 'owner@example.com', 'amenities': ['Sauna']}),
+        ]) + "\n")
+        summary = importer.import_file('places', path, echo=lambda message: None)
+        self.assertEqual(summary, {'created': 1, 'skipped': 0, 'errors': 3})
+
+        cabin = Place.query.one()
+        self.assertEqual(cabin.id, importer.place_id(importer.source_key(path), 1))
+        self.assertEqual(cabin.user.email, 'owner@example.com')
+        self.assertEqual(sorted(a.name for a in cabin.amenities), ['Pool', 'Wifi'])
+        self.assertEqual(facade.search_places({'q': 'cabin'})[0]['id'], cabin.id)
+
+    def test_import_places_csv(self):
+        """Verifica la conversión de tipos del CSV y la lista de amenities separada por '|'"""
+        path = self._write('places.csv', "title,description,price,latitude,longitude,owner_email,amenities\n"
+                                         "Loft,Centro,120.5,18.4,-66.1,owner@example.com,Wifi|Pool\n"
+                                         "Villa,,abc,18.4,-66.1,owner@example.com,\n")
+        summary = importer.import_file('places', path, chunk_size=1, echo=lambda message: None)
+        self.assertEqual((summary['created'], summary['errors']), (1, 1))
+        loft = Place.query.one()
+        self.assertEqual((loft.price, len(loft.amenities)), (120.5, 2))
+
+    def test_resume_from_checkpoint(self):
+        """Verifica que tras una caída se reanuda desde el checkpoint sin duplicar lugares"""
+        path = self._places_ndjson(5)
+        real_import = facade.import_places_bulk
+        calls = []
+
+        def crash_on_second_chunk(items):
+            calls.append(len(items))
+            if len(calls) == 2:
+                raise RuntimeError("caída simulada")
+            return real_import(items)
+
+        with mock.patch.object(facade, 'import_places_bulk', side_effect=crash_on_second_chunk):
+            with self.assertRaises(RuntimeError):
+                importer.import_file('places', path, chunk_size=2, echo=lambda message: None)
+        db.session.rollback()
+        self.assertEqual(Place.query.count(), 2)
+        with open(path + '.checkpoint', encoding='utf-8') as f:
+            self.assertEqual(json.load(f)['records'], 2)
+
+        summary = importer.import_file('places', path, chunk_size=2, echo=lambda message: None)
+        self.assertEqual(summary, {'created': 3, 'skipped': 0, 'errors': 0})
+        self.assertEqual(Place.query.count(), 5)
+        self.assertFalse(os.path.exists(path + '.checkpoint'))
+
+    def test_rerun_without_checkpoint_skips(self):
+        """Verifica que reimportar un lote ya confirmado (checkpoint perdido) no duplica lugares"""
+        path = self._places_ndjson(3)
+        importer.import_file('places', path, echo=lambda message: None)
+        summary = importer.import_file('places', path, echo=lambda message: None)
+        self.assertEqual(summary, {'created': 0, 'skipped': 3, 'errors': 0})
+        self.assertEqual(Place.query.count(), 3)
+
+    def test_ids_follow_content_not_path(self):
+        """Verifica que el mismo archivo en otra ruta da los mismos IDs y que se puede pasar una clave propia"""
+        path = self._places_ndjson(2)
+        importer.import_file('places', path, echo=lambda message: None)
+        moved = os.path.join(self.tmp, 'moved.ndjson')
+        shutil.copy(path, moved)
+        summary = importer.import_file('places', moved, echo=lambda message: None)
+        self.assertEqual(summary, {'created': 0, 'skipped': 2, 'errors': 0})
+
+        summary = importer.import_file('places', moved, source='partner-42', echo=lambda message: None)
+        self.assertEqual(summary['created'], 2)
+        self.assertIsNotNone(db.session.get(Place, importer.place_id('partner-42', 2)))
+
+
+if __name__ == "__main__":
+    unittest.main()
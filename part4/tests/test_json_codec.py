@@ -0,0 +1,67 @@
+import json
+import unittest
+import uuid
+from datetime import datetime
+from unittest import mock
+from app import create_app, db
+from app.models.user import User
+from app.models.place import Place
+from app.models.review import Review
+from app.services import json_codec
+
+
+class TestJsonCodec(unittest.TestCase):
+    """Pruebas para el codificador JSON de la API (orjson o biblioteca estándar)"""
+
+    DATA = {'id': uuid.UUID('12345678-1234-5678-1234-567812345678'), 'name': 'Café',
+            'created_at': datetime(2026, 1, 2, 3, 4, 5), 'updated_at': datetime(2026, 1, 2, 3, 4, 5, 120),
+            'histogram': {'1': 0, 5: 2}, 'price': 80.5, 'tags': [None, True]}
+    EXPECTED = {'id': '12345678-1234-5678-1234-567812345678', 'name': 'Café',
+                'created_at': '2026-01-02T03:04:05', 'updated_at': '2026-01-02T03:04:05.000120',
+                'histogram': {'1': 0, '5': 2}, 'price': 80.5, 'tags': [None, True]}
+
+    def test_both_backends_encode_the_same(self):
+        """Verifica fechas ISO 8601, UUID y claves no texto con orjson y sin él"""
+        self.assertEqual(json.loads(json_codec.dumps(self.DATA)), self.EXPECTED)
+        with mock.patch.object(json_codec, 'orjson', None):
+            self.assertEqual(json_codec.backend(), 'json')
+            self.assertEqual(json.loads(json_codec.dumps(self.DATA)), self.EXPECTED)
+            self.assertIn(b'\n  "id"', json_codec.dumps(self.DATA, indent=True))
+        self.assertIn(b'\n  "id"', json_codec.dumps(self.DATA, indent=True))
+
+    def test_unknown_type(self):
+        """Verifica que un tipo desconocido sigue siendo un error"""
+        with self.assertRaises(TypeError):
+            json_codec.dumps({'value': object()})
+        with mock.patch.object(json_codec, 'orjson', None), self.assertRaises(TypeError):
+            json_codec.dumps({'value': object()})
+
+    def test_api_responses(self):
+        """Verifica que la API codifica las fechas de las reseñas sin convertirlas en las rutas"""
+        app = create_app('testing')
+        with app.app_context():
+            db.create_all()
+            owner = User(first_name="Owner", last_name="One", email="owner@example.com", password="x")
+            guest = User(first_name="Guest", last_name="Two", email="guest@example.com", password="x")
+            db.session.add_all([owner, guest])
+            db.session.flush()
+            place = Place(title="Cabin", description="", price=80, latitude=18.2, longitude=-66.5, owner=owner)
+            db.session.add(place)
+            db.session.flush()
+            review = Review(text="Nice", rating=5, place=place, user=guest)
+            db.session.add(review)
+            db.session.commit()
+            expected = review.created_at.isoformat()
+
+            response = app.test_client().get(f'/api/v1/places/{place.id}')
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.mimetype, 'application/json')
+            self.assertEqual(response.get_json()['reviews'][0]['created_at'], expected)
+            self.assertEqual(app.test_client().get('/api/v1/places/missing').get_json(),
+                             {'error': 'Place not found'})
+            db.session.remove()
+            db.drop_all()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,124 @@
+import io
+import json
+import logging
+import unittest
+from unittest import mock
+from flask import g
+from app import create_app, db, logs
+from app.models.user import User
+from app.models.place import Place
+
+
+class TestLogging(unittest.TestCase):
+    """Pruebas para el logging estructurado"""
+
+    def setUp(self):
+        self.app = create_app('testing')
+        self.ctx = self.app.app_context()
+        self.ctx.push()
+        db.create_all()
+        db.session.add(User(first_name="Ana", last_name="Diaz", email="ana@example.com", password="s3cret-pass"))
+        db.session.commit()
+        self.client = self.app.test_client()
+
+    def tearDown(self):
+        db.session.remove()
+        db.drop_all()
+        self.ctx.pop()
+        # Deja el logging como lo configura TestingConfig
+        logs.configure(self.app.config)
+        logging.getLogger('app.services.facade').setLevel(logging.NOTSET)
+
+    def _configure(self, **overrides):
+        """Reconfigura el logging escribiendo en un buffer; devuelve el buffer."""
+        self.app.config.update(overrides)
+        stream = io.StringIO()
+        logs.configure(self.app.config, stream=stream)
+        return stream
+
+    def _lines(self, stream):
+        logs.stop()
+        return [json.loads(line) for line in stream.getvalue().splitlines()]
+
+    def test_disabled_levels_cost_nothing(self):
+        """Verifica que con WARNING una petición normal no formatea ni escribe nada"""
+        stream = self._configure(LOG_LEVEL='WARNING')
+        with mock.patch.object(logs.JsonFormatter, 'format') as format_record, \
+                mock.patch.object(logs, 'redacted_headers') as headers:
+            self.assertEqual(self.client.get('/api/v1/places/').status_code, 200)
+        format_record.assert_not_called()
+        headers.assert_not_called()
+        self.assertEqual(stream.getvalue(), '')
+
+    def test_access_log_is_structured(self):
+        """Verifica la línea JSON de acceso con estado y duración"""
+        stream = self._configure(LOG_LEVEL='INFO')
+        self.client.get('/api/v1/places/missing')
+        access = [line for line in self._lines(stream) if line['logger'] == 'app.http']
+        self.assertEqual(len(access), 1)
+        self.assertEqual((access[0]['level'], access[0]['status'], access[0]['path']),
+                         ('INFO', 404, '/api/v1/places/missing'))
+        self.assertIn('duration_ms', access[0])
+        self.assertNotIn('body', access[0])
+
+    def test_secrets_never_logged(self):
+        """Verifica que en DEBUG no aparecen la contraseña, el hash ni el token"""
+        stream = self._configure(LOG_LEVEL='DEBUG', LOG_BODIES=True)
+        response = self.client.post('/api/v1/auth/login', json={'email': 'ana@example.com',
+                                                                 'password': 's3cret-pass'})
+        token = response.get_json()['access_token']
+        self.client.get('/api/v1/auth/protected', headers={'Authorization': f'Bearer {token}'})
+        output = stream.getvalue()
+        self.assertIn('Login exitoso', output)
+        self.assertIn('[redacted]', output)
+        self.assertNotIn(token, output)
+        self.assertNotIn(User.query.first().password, output)
+        self.assertNotIn('s3cret-pass', output)
+
+    def test_body_samples(self):
+        """Verifica que los cuerpos solo se registran con LOG_BODIES, acotados y sin leer los streams"""
+        stream = self._configure(LOG_LEVEL='DEBUG')
+        self.client.get('/api/v1/places/missing')
+        self.assertFalse(any('body' in line for line in self._lines(stream)))
+
+        db.session.add(Place(title="Loft", description="", price=10, latitude=1.0, longitude=2.0,
+                             owner=User.query.first()))
+        db.session.commit()
+        stream = self._configure(LOG_LEVEL='DEBUG', LOG_BODIES=True, LOG_BODY_MAX=64)
+        self.client.post('/api/v1/places/bulk', json=[{'title': 'x' * 100}])
+        self.client.get('/api/v1/places/missing')
+        self.client.get('/api/v1/places/')
+        bodies = [line['body'] for line in self._lines(stream) if 'body' in line]
+        self.assertRegex(bodies[0], r'^\[\d+ bytes\]$')
+        self.assertEqual(bodies[-1], '[streamed]')
+        self.assertIn({'error': 'Place not found'}, bodies)
+
+    def test_per_module_levels(self):
+        """Verifica que LOG_LEVELS enciende un módulo sin encender el resto"""
+        stream = self._configure(LOG_LEVEL='WARNING', LOG_LEVELS={'app.services.facade': 'DEBUG'})
+        self.client.get('/api/v1/places/')
+        loggers = {line['logger'] for line in self._lines(stream)}
+        self.assertEqual(loggers, {'app.services.facade'})
+
+    def test_sampling_keeps_warnings(self):
+        """Verifica que sin muestreo se descartan INFO pero se escriben los WARNING"""
+        stream = self._configure(LOG_LEVEL='INFO', LOG_SAMPLE_RATE=0)
+        self.client.get('/api/v1/places/')
+        self.client.post('/api/v1/auth/register', json={'email': 'ana@example.com', 'password': 'x',
+                                                        'first_name': 'A', 'last_name': 'B'})
+        with self.app.test_request_context():
+            g.log_sampled = False
+            logging.getLogger('app.api.v1.places').warning("Acción no autorizada para eliminar.")
+        self.assertEqual([line['level'] for line in self._lines(stream)], ['WARNING'])
+
+    def test_async_writer(self):
+        """Verifica que con LOG_ASYNC los registros llegan desde el hilo escritor"""
+        stream = self._configure(LOG_LEVEL='INFO', LOG_ASYNC=True)
+        for _ in range(3):
+            self.client.get('/api/v1/places/')
+        lines = self._lines(stream)
+        self.assertEqual([line['status'] for line in lines if line['logger'] == 'app.http'], [200] * 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
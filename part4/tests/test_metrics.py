@@ -0,0 +1,146 @@
+import multiprocessing
+import os
+import re
+import shutil
+import unittest
+from unittest import mock
+from flask import Flask
+from sqlalchemy import create_engine, text
+from app import create_app, db, metrics
+from app.models.user import User
+from app.models.place import Place
+from app.services.facade import facade
+
+
+class TestMetrics(unittest.TestCase):
+    """Pruebas para /metrics y el store compartido entre procesos"""
+
+    def setUp(self):
+        self.app = create_app('testing')
+        self.ctx = self.app.app_context()
+        self.ctx.push()
+        db.create_all()
+        owner = User(first_name="Owner", last_name="One", email="owner@example.com", password="x")
+        db.session.add(owner)
+        db.session.flush()
+        place = Place(title="Loft", description="", price=10, latitude=1.0, longitude=2.0, owner=owner)
+        db.session.add(place)
+        db.session.commit()
+        self.place_id = place.id
+        self.client = self.app.test_client()
+        self.store = self.app.extensions['hbnb_metrics']
+        self.dir = self.store.directory
+
+    def tearDown(self):
+        db.session.remove()
+        db.drop_all()
+        self.ctx.pop()
+
+    def _samples(self):
+        """Muestras de /metrics como {línea sin valor: valor}."""
+        response = self.client.get('/metrics')
+        self.assertEqual(response.headers['Content-Type'], metrics.CONTENT_TYPE)
+        return {line.rsplit(' ', 1)[0]: float(line.rsplit(' ', 1)[1])
+                for line in response.get_data(as_text=True).splitlines() if not line.startswith('#')}
+
+    def test_request_counters_and_histogram(self):
+        """Verifica los contadores por ruta y estado y que el histograma es acumulado"""
+        for _ in range(3):
+            self.client.get(f'/api/v1/places/{self.place_id}')
+        self.client.get('/api/v1/places/missing')
+        samples = self._samples()
+        route = 'method="GET",route="/api/v1/places/<string:place_id>"'
+        self.assertEqual(samples[f'hbnb_http_requests_total{{{route},status="200"}}'], 3)
+        self.assertEqual(samples[f'hbnb_http_requests_total{{{route},status="404"}}'], 1)
+
+        buckets = [(name, value) for name, value in samples.items()
+                   if name.startswith(f'hbnb_http_request_duration_seconds_bucket{{{route},le=')]
+        counts = [value for _, value in buckets]
+        self.assertEqual(counts, sorted(counts))
+        self.assertIn('le="+Inf"', buckets[-1][0])
+        self.assertEqual(buckets[-1][1], 4)
+        self.assertEqual(samples[f'hbnb_http_request_duration_seconds_count{{{route}}}'], 4)
+        self.assertGreater(samples[f'hbnb_http_request_duration_seconds_sum{{{route}}}'], 0)
+
+    def test_aggregates_across_processes(self):
+        """Verifica que los workers suman sus contadores y que los gauges de procesos muertos no cuentan"""
+        def worker():
+            for _ in range(10):
+                self.store.inc('hbnb_http_requests_total', {'method': 'GET', 'route': '/x', 'status': '200'})
+            self.store.set('hbnb_db_pool_connections', {'state': 'checked_out'}, 7)
+
+        processes = [multiprocessing.get_context('fork').Process(target=worker) for _ in range(3)]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+        worker()
+
+        totals = self.store.collect()
+        self.assertEqual(totals[('hbnb_http_requests_total', (('method', 'GET'), ('route', '/x'),
+                                                              ('status', '200')))], 40)
+        self.assertEqual(totals[('hbnb_db_pool_connections', (('state', 'checked_out'),))], 7)
+        self.assertEqual(len(os.listdir(self.dir)), 4)
+
+    def test_cache_hit_ratio(self):
+        """Verifica los contadores de la caché y su tasa de aciertos"""
+        for _ in range(4):
+            facade.get_place(self.place_id)
+        samples = self._samples()
+        self.assertEqual(samples['hbnb_cache_operations_total{op="hits"}'], 3)
+        self.assertEqual(samples['hbnb_cache_operations_total{op="misses"}'], 1)
+        self.assertEqual(samples['hbnb_cache_hit_ratio'], 0.75)
+
+    def test_pool_stats(self):
+        """Verifica el estado de un pool con tamaño fijo"""
+        engine = create_engine('sqlite:///' + os.path.join(self.dir, 'pool.db'))
+        self.addCleanup(engine.dispose)
+        with engine.connect() as conn:
+            conn.execute(text('SELECT 1'))
+            metrics.record_pool(engine)
+            samples = self._samples()
+        self.assertEqual(samples['hbnb_db_pool_connections{state="checked_out"}'], 1)
+        self.assertIn('hbnb_db_pool_connections{state="size"}', samples)
+
+    def test_file_grows_and_reopens(self):
+        """Verifica que el archivo crece más allá del tamaño inicial y se vuelve a leer igual"""
+        for i in range(3000):
+            self.store.inc('hbnb_http_requests_total', {'method': 'GET', 'route': f'/r{i}', 'status': '200'}, i)
+        self.store.close()
+        self.store.inc('hbnb_http_requests_total', {'method': 'GET', 'route': '/r5', 'status': '200'})
+        [path] = os.listdir(self.dir)
+        self.assertGreater(os.path.getsize(os.path.join(self.dir, path)), metrics.MmapedDict.INITIAL_SIZE)
+        values = metrics.read_file(os.path.join(self.dir, path))
+        self.assertEqual(len(values), 3000)
+        self.assertEqual(values[metrics.MetricsStore.key('hbnb_http_requests_total',
+                                                         {'method': 'GET', 'route': '/r5', 'status': '200'})], 6)
+        self.assertTrue(re.match(r'metrics-\d+\.db$', path))
+
+    def test_write_failures_do_not_fail_requests(self):
+        """Verifica que una escritura fallida se registra sin dar 500 y que el directorio se vuelve a crear"""
+        with mock.patch.object(metrics.MmapedDict, 'add', side_effect=OSError("disk full")), \
+                self.assertLogs('app.metrics', 'WARNING'):
+            self.assertEqual(self.client.get(f'/api/v1/places/{self.place_id}').status_code, 200)
+
+        self.store.close()
+        shutil.rmtree(self.dir)
+        self.assertEqual(self.client.get(f'/api/v1/places/{self.place_id}').status_code, 200)
+        self.assertEqual(len(os.listdir(self.dir)), 1)
+
+    def test_temporary_directory_removed_only_by_owner(self):
+        """Verifica que un worker hijo que sale no borra el directorio temporal del proceso que lo creó"""
+        metrics._remove_directory(self.dir, os.getpid() + 1)
+        self.assertTrue(os.path.isdir(self.dir))
+        metrics._remove_directory(self.dir, os.getpid())
+        self.assertFalse(os.path.isdir(self.dir))
+
+    def test_metrics_dir_required_outside_testing(self):
+        """Verifica que sin METRICS_DIR solo se aceptan pruebas y desarrollo"""
+        app = Flask(__name__)
+        app.config.update(METRICS_ENABLED=True, METRICS_DIR=None, METRICS_BUCKETS=(1.0,))
+        with self.assertRaises(ValueError):
+            metrics.init_app(app)
+
+
+if __name__ == "__main__":
+    unittest.main()
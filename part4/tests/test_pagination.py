@@ -0,0 +1,72 @@
+import re
+import unittest
+from datetime import datetime, timedelta
+from app import create_app, db
+from app.models.amenity import Amenity
+from app.persistence.pagination import encode_cursor
+
+
+class TestPagination(unittest.TestCase):
+    """Pruebas para la paginación por cursor de los listados"""
+
+    def setUp(self):
+        self.app = create_app('testing')
+        self.ctx = self.app.app_context()
+        self.ctx.push()
+        db.create_all()
+        base = datetime(2025, 1, 1)
+        for i in range(7):
+            amenity = Amenity(name=f"Amenity {i}")
+            # Dos amenidades comparten created_at para probar el desempate por id
+            amenity.created_at = base + timedelta(minutes=min(i, 5))
+            db.session.add(amenity)
+        db.session.commit()
+        self.client = self.app.test_client()
+
+    def tearDown(self):
+        db.session.remove()
+        db.drop_all()
+        self.ctx.pop()
+
+    def _links(self, response):
+        header = response.headers.get('Link', '')
+        return dict((rel, url) for url, rel in re.findall(r'<([^>]+)>; rel="(\w+)"', header))
+
+    def test_walk_forward_and_back(self):
+        """Verifica que se recorren todas las páginas sin repetir elementos"""
+        response = self.client.get('/api/v1/amenities/?limit=3')
+        self.assertEqual(response.status_code, 200)
+        seen = [a['name'] for a in response.get_json()]
+        links = self._links(response)
+        self.assertNotIn('prev', links)
+
+        pages = [list(seen)]
+        while 'next' in links:
+            response = self.client.get(links['next'])
+            page = [a['name'] for a in response.get_json()]
+            pages.append(page)
+            seen += page
+            links = self._links(response)
+
+        expected = [a.name for a in Amenity.query.order_by(Amenity.created_at, Amenity.id)]
+        self.assertEqual(seen, expected)
+        self.assertEqual([len(p) for p in pages], [3, 3, 1])
+
+        response = self.client.get(links['prev'])
+        self.assertEqual([a['name'] for a in response.get_json()], pages[1])
+
+    def test_invalid_arguments(self):
+        """Verifica que un limit o cursor inválido devuelve 400"""
+        self.assertEqual(self.client.get('/api/v1/amenities/?limit=0').status_code, 400)
+        self.assertEqual(self.client.get('/api/v1/amenities/?limit=abc').status_code, 400)
+        self.assertEqual(self.client.get('/api/v1/amenities/?cursor=nope').status_code, 400)
+
+    def test_cursor_is_opaque_key(self):
+        """Verifica que el cursor continúa después de la clave codificada"""
+        ordered = Amenity.query.order_by(Amenity.created_at, Amenity.id).all()
+        cursor = encode_cursor(ordered[4].created_at, ordered[4].id)
+        response = self.client.get(f'/api/v1/amenities/?cursor={cursor}')
+        self.assertEqual([a['name'] for a in response.get_json()], [a.name for a in ordered[5:]])
+
+if __name__ == "__main__":
+    unittest.main()
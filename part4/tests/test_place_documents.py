@@ -0,0 +1,149 @@
+import json
+import unittest
+from unittest import mock
+from sqlalchemy import event, func, select
+from sqlalchemy.dialects import mysql
+from sqlalchemy.schema import CreateTable
+from app import create_app, db
+from app.models.user import User
+from app.models.place import Place
+from app.models.amenity import Amenity
+from app.persistence.unit_of_work import unit_of_work
+from app.services import place_documents
+from app.services.facade import facade
+
+
+class TestPlaceDocuments(unittest.TestCase):
+    """Pruebas para los documentos JSON materializados de lugares (PLACE_DOCUMENTS)"""
+
+    def setUp(self):
+        self.app = create_app('testing')
+        self.app.config['PLACE_DOCUMENTS'] = True
+        self.ctx = self.app.app_context()
+        self.ctx.push()
+        db.create_all()
+        self.client = self.app.test_client()
+        self.owner = User(first_name="Owner", last_name="One", email="owner@example.com", password="x")
+        self.guest = User(first_name="Guest", last_name="Two", email="guest@example.com", password="x")
+        self.wifi = Amenity(name="Wifi")
+        db.session.add_all([self.owner, self.guest, self.wifi])
+        db.session.flush()
+        self.places = [Place(title=f"Place {i}", description="", price=10 + i, latitude=1.0, longitude=2.0,
+                             owner=self.owner, amenities=[self.wifi]) for i in range(3)]
+        db.session.add_all(self.places)
+        db.session.commit()
+        self.place_id = self.places[0].id
+        facade.create_review({'text': 'Nice', 'rating': 4, 'place_id': self.place_id, 'user_id': self.guest.id})
+        self.statements = []
+        event.listen(db.engine, 'before_cursor_execute', self._count)
+
+    def tearDown(self):
+        event.remove(db.engine, 'before_cursor_execute', self._count)
+        db.session.remove()
+        db.drop_all()
+        self.ctx.pop()
+
+    def _count(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+
+    def _get(self, path):
+        response = self.client.get(path)
+        self.assertEqual(response.status_code, 200)
+        return response
+
+    def _stored(self):
+        return db.session.scalar(select(func.count()).select_from(place_documents.place_documents))
+
+    def test_same_json_as_place_to_dict(self):
+        """Verifica que lista, página y detalle responden lo mismo con y sin documentos"""
+        paths = ('/api/v1/places/', '/api/v1/places/?limit=2', f'/api/v1/places/{self.place_id}')
+        with_documents = [self._get(path) for path in paths]
+        self.app.config['PLACE_DOCUMENTS'] = False
+        for path, response in zip(paths, with_documents):
+            expected = self._get(path)
+            self.assertEqual(response.get_json(), expected.get_json(), path)
+            self.assertEqual(response.headers.get('Link'), expected.headers.get('Link'), path)
+        self.assertEqual(with_documents[2].get_json()['reviews'][0]['user_name'], 'Guest Two')
+
+    def test_reads_use_stored_documents(self):
+        """Verifica que la segunda lectura solo consulta el ETag y place_documents"""
+        self._get(f'/api/v1/places/{self.place_id}')
+        self.assertEqual(self._stored(), 1)
+        self.statements.clear()
+        self._get(f'/api/v1/places/{self.place_id}')
+        self.assertEqual(len(self.statements), 2, self.statements)
+        self.assertIn('place_documents', self.statements[1])
+        self.assertEqual(self.client.get('/api/v1/places/missing').status_code, 404)
+
+    def test_writes_refresh_documents(self):
+        """Verifica que editar el lugar, sus reseñas, sus amenities o su dueño reconstruye el documento"""
+        def document():
+            return json.loads(facade.get_place_document(self.place_id))
+        self.assertEqual(document()['review_count'], 1)
+
+        facade.update_place(self.place_id, self.owner.id, {'title': 'Loft'})
+        facade.update_amenity(self.wifi.id, {'name': 'Fast wifi'})
+        facade.update_user(self.guest.id, {'first_name': 'Ana'})
+        self.statements.clear()
+        current = document()
+        self.assertEqual(len(self.statements), 1)  # Reconstruido al confirmar, no al leer
+        self.assertEqual((current['title'], current['amenities'][0]['name'], current['reviews'][0]['user_name']),
+                         ('Loft', 'Fast wifi', 'Ana Two'))
+
+        review_id = current['reviews'][0]['id']
+        facade.update_review(review_id, {'rating': 2})
+        self.assertEqual((document()['average_rating'], document()['rating_histogram']['2']), (2.0, 1))
+        facade.delete_review(review_id)
+        self.assertEqual((document()['review_count'], document()['reviews']), (0, []))
+
+        facade.delete_place(self.place_id, self.owner.id)
+        self.assertIsNone(facade.get_place_document(self.place_id))
+        self.assertEqual(self.client.get(f'/api/v1/places/{self.place_id}').status_code, 404)
+
+    def test_refresh_replaces_concurrent_stale_document(self):
+        """Verifica que la reconstrucción sobrescribe un documento viejo guardado por un lector en paralelo"""
+        stale = facade.get_place_document(self.place_id)
+        build = place_documents._build
+
+        def build_after_reader(session, place_ids, reload=False):
+            # Un lector guarda el documento previo a la escritura justo después del DELETE
+            place_documents._store(session, {self.place_id: stale})
+            return build(session, place_ids, reload)
+
+        with mock.patch.object(place_documents, '_build', build_after_reader):
+            facade.update_place(self.place_id, self.owner.id, {'title': 'Loft'})
+        db.session.expire_all()
+        self.assertEqual(json.loads(facade.get_place_document(self.place_id))['title'], 'Loft')
+
+    def test_rollback_keeps_document(self):
+        """Verifica que una escritura descartada no cambia el documento guardado"""
+        before = facade.get_place_document(self.place_id)
+        with self.assertRaises(RuntimeError):
+            with unit_of_work():
+                facade.update_place(self.place_id, self.owner.id, {'title': 'Never committed'})
+                # Dentro de la transacción se ve el cambio, sin guardarlo
+                self.assertEqual(json.loads(facade.get_place_document(self.place_id))['title'],
+                                 'Never committed')
+                raise RuntimeError("rollback")
+        db.session.expire_all()
+        self.assertEqual(facade.get_place_document(self.place_id), before)
+
+    def test_large_writes_rebuild_on_read(self):
+        """Verifica que por encima de PLACE_DOCUMENTS_REFRESH_MAX el documento se arma al leerlo"""
+        facade.get_all_place_documents()
+        self.assertEqual(self._stored(), 3)
+        self.app.config['PLACE_DOCUMENTS_REFRESH_MAX'] = 0
+        facade.update_amenity(self.wifi.id, {'name': 'Fast wifi'})
+        self.assertEqual(self._stored(), 0)
+        names = [json.loads(body)['amenities'][0]['name'] for body in facade.get_all_place_documents()]
+        self.assertEqual(names, ['Fast wifi'] * 3)
+        self.assertEqual(self._stored(), 3)
+
+    def test_body_is_longblob_on_mysql(self):
+        """Verifica que body admite documentos de más de 64 KB en MySQL (BLOB de 4 GB, es decir LONGBLOB)"""
+        ddl = str(CreateTable(place_documents.place_documents).compile(dialect=mysql.dialect()))
+        self.assertIn('body BLOB(4294967295) NOT NULL', ddl)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+import unittest
+from sqlalchemy import event
+from app import create_app, db
+from app.models.user import User
+from app.models.place import Place
+from app.models.review import Review
+from app.models.amenity import Amenity
+from app.services.facade import facade
+
+
+class TestPlaceQueries(unittest.TestCase):
+    """Pruebas del número de consultas al serializar lugares"""
+
+    def setUp(self):
+        self.app = create_app('testing')
+        self.ctx = self.app.app_context()
+        self.ctx.push()
+        db.create_all()
+        self.client = self.app.test_client()
+        self.statements = []
+        event.listen(db.engine, 'before_cursor_execute', self._count)
+
+    def tearDown(self):
+        event.remove(db.engine, 'before_cursor_execute', self._count)
+        db.session.remove()
+        db.drop_all()
+        self.ctx.pop()
+
+    def _count(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+
+    def _seed(self, places, reviews_per_place):
+        """Crea lugares con amenities y reviews de usuarios distintos"""
+        owner = User(first_name="Owner", last_name="One", email="owner@example.com", password="x")
+        reviewers = [User(first_name="Guest", last_name=str(i), email=f"guest{i}@example.com", password="x")
+                     for i in range(reviews_per_place)]
+        amenities = [Amenity(name="Wifi"), Amenity(name="Pool")]
+        db.session.add_all([owner] + reviewers + amenities)
+        db.session.flush()
+        for i in range(places):
+            place = Place(title=f"Place {i}", description="", price=10 + i, latitude=1.0, longitude=2.0,
+                          owner=owner, amenities=amenities)
+            db.session.add(place)
+            db.session.flush()
+            for reviewer in reviewers:
+                db.session.add(Review(text="Nice", rating=4, place=place, user=reviewer))
+        db.session.commit()
+        db.session.expunge_all()
+        self.statements.clear()
+
+    def test_get_all_places_constant_queries(self):
+        """Verifica que get_all_places usa 3 consultas sin importar el tamaño"""
+        for places, reviews in ((1, 1), (8, 5)):
+            with self.subTest(places=places, reviews=reviews):
+                db.drop_all()
+                db.create_all()
+                self._seed(places, reviews)
+                result = facade.get_all_places()
+                self.assertEqual(len(result), places)
+                self.assertEqual(len(result[0]['reviews']), reviews)
+                self.assertEqual(result[0]['user_name'], "Owner One")
+                self.assertEqual(result[0]['reviews'][0]['user_name'].split()[0], "Guest")
+                self.assertEqual(len(self.statements), 3, self.statements)
+
+    def test_place_list_endpoint_constant_queries(self):
+        """Verifica que GET /places/ no crece con lugares ni reviews"""
+        self._seed(6, 4)
+        response = self.client.get('/api/v1/places/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.get_json()), 6)
+        # 3 para serializar + 1 para el ETag (versión de los listados)
+        self.assertEqual(len(self.statements), 4, self.statements)
+
+    def test_place_detail_constant_queries(self):
+        """Verifica que GET /places/<id> no hace una consulta por review"""
+        self._seed(1, 6)
+        place_id = Place.query.first().id
+        self.statements.clear()
+        response = self.client.get(f'/api/v1/places/{place_id}')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.get_json()['reviews']), 6)
+        # 3 para serializar + 1 de agregados para el ETag
+        self.assertEqual(len(self.statements), 4, self.statements)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+import unittest
+from flask_jwt_extended import create_access_token
+from app import create_app, db
+from app.models.user import User
+from app.models.place import Place
+from app.services.facade import facade, DuplicateReviewError
+
+
+class TestPlaceRatings(unittest.TestCase):
+    """Pruebas para los agregados de rating guardados en places"""
+
+    def setUp(self):
+        self.app = create_app('testing')
+        self.ctx = self.app.app_context()
+        self.ctx.push()
+        db.create_all()
+        owner = User(first_name="Owner", last_name="One", email="owner@example.com", password="x")
+        self.guests = [User(first_name="Guest", last_name=str(i), email=f"guest{i}@example.com", password="x")
+                       for i in range(3)]
+        db.session.add_all([owner] + self.guests)
+        db.session.flush()
+        self.place = Place(title="Cabin", description="", price=50, latitude=18.0, longitude=-66.6, owner=owner)
+        db.session.add(self.place)
+        db.session.commit()
+
+    def tearDown(self):
+        db.session.remove()
+        db.drop_all()
+        self.ctx.pop()
+
+    def _review(self, guest, rating):
+        return facade.create_review({'text': "Ok", 'rating': rating,
+                                     'user_id': guest.id, 'place_id': self.place.id})
+
+    def _aggregates(self):
+        place = facade.get_place(self.place.id)
+        return place['review_count'], place['average_rating'], place['rating_histogram']
+
+    def test_create_update_delete(self):
+        """Verifica que los agregados siguen a cada cambio de review"""
+        first = self._review(self.guests[0], 5)
+        self._review(self.guests[1], 2)
+        self.assertEqual(self._aggregates(), (2, 3.5, {'1': 0, '2': 1, '3': 0, '4': 0, '5': 1}))
+
+        facade.update_review(first['id'], {'rating': 3})
+        self.assertEqual(self._aggregates(), (2, 2.5, {'1': 0, '2': 1, '3': 1, '4': 0, '5': 0}))
+
+        facade.delete_review(first['id'])
+        self.assertEqual(self._aggregates(), (1, 2.0, {'1': 0, '2': 1, '3': 0, '4': 0, '5': 0}))
+
+    def test_repair_command(self):
+        """Verifica que `flask hbnb repair-ratings` recalcula desde reviews"""
+        self._review(self.guests[0], 4)
+        self._review(self.guests[1], 4)
+        db.session.query(Place).update({'review_count': 7, 'rating_sum': 1, 'rating_hist_4': 0})
+        db.session.commit()
+
+        result = self.app.test_cli_runner().invoke(args=['hbnb', 'repair-ratings'])
+        self.assertEqual(result.exit_code, 0, result.output)
+        db.session.expire_all()
+        self.assertEqual(self._aggregates(), (2, 4.0, {'1': 0, '2': 0, '3': 0, '4': 2, '5': 0}))
+
+    def test_duplicate_review_rejected(self):
+        """Verifica que la restricción única rechaza una segunda review y no toca los agregados"""
+        self._review(self.guests[0], 5)
+        self.assertTrue(facade.get_review_by_user_and_place(self.guests[0].id, self.place.id))
+        self.assertFalse(facade.get_review_by_user_and_place(self.guests[1].id, self.place.id))
+
+        with self.assertRaises(DuplicateReviewError):
+            self._review(self.guests[0], 1)
+        self.assertEqual(self._aggregates(), (1, 5.0, {'1': 0, '2': 0, '3': 0, '4': 0, '5': 1}))
+
+    def test_duplicate_review_api_message(self):
+        """Verifica que las dos rutas POST responden con el mensaje público de reseña duplicada"""
+        client = self.app.test_client()
+        auth = {'Authorization': f'Bearer {create_access_token(identity=self.guests[0].id)}'}
+        review = {'text': "Ok", 'rating': 4, 'place_id': self.place.id}
+        self.assertEqual(client.post('/api/v1/places/reviews/', json=review, headers=auth).status_code, 201)
+        for path in ('/api/v1/places/reviews/', f'/api/v1/places/reviews/{self.place.id}'):
+            response = client.post(path, json=review, headers=auth)
+            self.assertEqual(response.status_code, 400, path)
+            self.assertEqual(response.get_json(), {"error": "You have already reviewed this place"})
+
+if __name__ == "__main__":
+    unittest.main()
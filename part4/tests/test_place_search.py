@@ -0,0 +1,135 @@
+import unittest
+from sqlalchemy.dialects import mysql
+from app import create_app, db
+from app.models.user import User
+from app.models.place import Place
+from app.models.review import Review
+from app.models.amenity import Amenity
+from app.persistence import fulltext
+from app.services.facade import facade
+
+
+class TestPlaceSearch(unittest.TestCase):
+    """Pruebas para GET /places/search"""
+
+    def setUp(self):
+        self.app = create_app('testing')
+        self.ctx = self.app.app_context()
+        self.ctx.push()
+        db.create_all()
+        owner = User(first_name="Owner", last_name="One", email="owner@example.com", password="x")
+        guest = User(first_name="Guest", last_name="Two", email="guest@example.com", password="x")
+        self.wifi = Amenity(name="Wifi")
+        db.session.add_all([owner, guest, self.wifi])
+        db.session.flush()
+        cabin = Place(title="Cabin", description="Quiet mountain cabin near the río", price=50, latitude=18.0, longitude=-66.6,
+                      owner=owner, amenities=[self.wifi])
+        loft = Place(title="Loft", description="Modern loft with a mountain mural", price=200, latitude=40.7, longitude=-74.0, owner=owner)
+        db.session.add_all([cabin, loft])
+        db.session.flush()
+        db.session.add_all([Review(text="Great", rating=5, place=cabin, user=guest),
+                            Review(text="Meh", rating=2, place=loft, user=guest)])
+        db.session.commit()
+        # Las reviews se insertaron sin la fachada: recalcular los agregados
+        facade.recompute_place_ratings()
+        self.client = self.app.test_client()
+
+    def tearDown(self):
+        db.session.remove()
+        db.drop_all()
+        self.ctx.pop()
+
+    def _titles(self, query):
+        response = self.client.get(f'/api/v1/places/search?{query}')
+        self.assertEqual(response.status_code, 200)
+        return [place['title'] for place in response.get_json()]
+
+    def test_filters(self):
+        """Verifica los filtros de precio, caja geográfica, amenities y rating"""
+        self.assertEqual(self._titles('max_price=100'), ["Cabin"])
+        self.assertEqual(self._titles('min_lat=30&max_lat=45&min_lon=-80&max_lon=-70'), ["Loft"])
+        self.assertEqual(self._titles(f'amenities={self.wifi.id}'), ["Cabin"])
+        self.assertEqual(self._titles('min_rating=3'), ["Cabin"])
+
+    def test_sort(self):
+        """Verifica los órdenes por precio y por rating"""
+        self.assertEqual(self._titles('sort=price_desc'), ["Loft", "Cabin"])
+        self.assertEqual(self._titles('sort=rating'), ["Cabin", "Loft"])
+
+    def test_full_text(self):
+        """Verifica la búsqueda por palabras con ranking y fragmento resaltado"""
+        response = self.client.get('/api/v1/places/search?q=cabin')
+        results = response.get_json()
+        self.assertEqual([p['title'] for p in results], ["Cabin"])
+        self.assertIn("<mark>cabin</mark>", results[0]["snippet"].lower())
+
+        # Prefijos, acentos ignorados y combinación con otros filtros
+        self.assertEqual(sorted(self._titles('q=mount')), ["Cabin", "Loft"])
+        self.assertEqual(self._titles('q=rio'), ["Cabin"])
+        self.assertEqual(self._titles('q=mountain&min_price=100'), ["Loft"])
+        self.assertEqual(self._titles('q="unmatched'), [])
+
+        # Los cambios en la descripción se reflejan en el índice (triggers)
+        loft = Place.query.filter_by(title="Loft").first()
+        loft.description = "Rooftop terrace"
+        db.session.commit()
+        self.assertEqual(self._titles('q=mountain'), ["Cabin"])
+
+    def test_full_text_survives_rowid_changes(self):
+        """Verifica que el índice sigue ligado al id del lugar si cambia el rowid de places (VACUUM)"""
+        db.session.execute(db.text("UPDATE places SET rowid = rowid + 100"))
+        db.session.commit()
+        self.assertEqual(self._titles('q=cabin'), ["Cabin"])
+
+        loft = Place.query.filter_by(title="Loft").first()
+        loft.description = "Rooftop terrace"
+        db.session.commit()
+        self.assertEqual(self._titles('q=rooftop'), ["Loft"])
+        self.assertEqual(self._titles('q=mountain'), ["Cabin"])
+
+        Review.query.filter_by(place_id=loft.id).delete()
+        db.session.delete(loft)
+        db.session.commit()
+        self.assertEqual(self._titles('q=rooftop'), [])
+        self.assertEqual(db.session.execute(db.text("SELECT count(*) FROM places_fts")).scalar(), 1)
+
+    def test_full_text_mysql_binds_rank(self):
+        """Verifica que en MySQL el filtro y el orden por relevancia llevan el parámetro ligado"""
+        query, rank, _ = fulltext.apply_search(Place.query, 'cabin beach', 'mysql')
+        compiled = query.order_by(rank).statement.compile(dialect=mysql.dialect())
+        sql = str(compiled)
+        self.assertNotIn(':fts_query', sql)
+        self.assertEqual(sql.count('AGAINST (%s IN NATURAL LANGUAGE MODE)'), 2)
+        self.assertIn('ORDER BY -MATCH', sql)
+        self.assertEqual(compiled.params, {'fts_query': 'cabin beach'})
+
+    def test_nearby(self):
+        """Verifica /places/nearby: radio exacto y orden por distancia"""
+        response = self.client.get('/api/v1/places/nearby?lat=18.4655&lon=-66.1057&radius_km=80')
+        self.assertEqual([p['title'] for p in response.get_json()], ["Cabin"])
+        self.assertAlmostEqual(response.get_json()[0]['distance_km'], 73.7, places=0)
+
+        response = self.client.get('/api/v1/places/nearby?lat=18.4655&lon=-66.1057&radius_km=2600')
+        self.assertEqual([p['title'] for p in response.get_json()], ["Cabin", "Loft"])
+
+        self.assertEqual(self.client.get('/api/v1/places/nearby?lat=18.4655&lon=-66.1057&radius_km=70')
+                         .get_json(), [])
+
+    def test_geohash_follows_coordinates(self):
+        """Verifica que el geohash se recalcula al mover un lugar"""
+        place = Place.query.filter_by(title="Loft").first()
+        self.assertTrue(place.geohash.startswith("dr5r"))
+        place.latitude, place.longitude = 48.8566, 2.3522
+        db.session.commit()
+        self.assertTrue(place.geohash.startswith("u09t"))
+
+    def test_invalid_arguments(self):
+        """Verifica que los parámetros inválidos devuelven 400"""
+        self.assertEqual(self.client.get('/api/v1/places/search?max_price=cheap').status_code, 400)
+        self.assertEqual(self.client.get('/api/v1/places/search?sort=random').status_code, 400)
+        for radius in ('nan', 'inf', '-inf', '20001'):
+            self.assertEqual(self.client.get(f'/api/v1/places/nearby?lat=1&lon=2&radius_km={radius}').status_code,
+                             400, radius)
+
+if __name__ == "__main__":
+    unittest.main()
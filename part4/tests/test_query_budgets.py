@@ -0,0 +1,103 @@
+import unittest
+from flask_jwt_extended import create_access_token
+from app import create_app, db
+from app.models.user import User
+from app.models.place import Place
+from app.models.review import Review
+from app.models.amenity import Amenity
+from query_budget import QueryBudgetMixin, load_budgets
+
+# Peticiones medidas; {place}, {review}, {amenity} y {user} se reemplazan
+# por ids de los datos sembrados. Cada una corre con pocos y con muchos
+# datos: el número de consultas debe ser el mismo y no pasar del presupuesto.
+REQUESTS = (
+    ('GET', '/api/v1/places/', False),
+    ('GET', '/api/v1/places/?limit=5', False),
+    ('GET', '/api/v1/places/{place}', False),
+    ('GET', '/api/v1/places/search?q=Place&min_price=1', False),
+    ('GET', '/api/v1/places/nearby?lat=1&lon=2&radius_km=50', False),
+    ('GET', '/api/v1/places/reviews/', False),
+    ('GET', '/api/v1/places/reviews/{review}', False),
+    ('GET', '/api/v1/amenities/', False),
+    ('GET', '/api/v1/amenities/{amenity}', False),
+    ('GET', '/api/v1/users/', True),
+    ('GET', '/api/v1/users/?limit=5', True),
+    ('GET', '/api/v1/users/{user}', True),
+    ('GET', '/api/v1/auth/protected', True),
+    ('GET', '/api/v1/export/places.ndjson', True),
+    ('GET', '/api/v1/cache/stats', True),
+)
+
+# Rutas GET sin presupuesto: documentación de la API y la ruta de reseñas
+# por lugar, a la que nunca llega un GET (la misma URL la atiende
+# /places/reviews/<review_id>, registrada antes)
+UNBUDGETED = {'/api/v1/', '/api/v1/doc', '/api/v1/swagger.json', '/api/v1/places/reviews/<string:place_id>'}
+
+
+class TestQueryBudgets(QueryBudgetMixin, unittest.TestCase):
+    """Pruebas del número de consultas SQL de cada endpoint contra query_budgets.json"""
+
+    def setUp(self):
+        self.app = create_app('testing')
+        self.ctx = self.app.app_context()
+        self.ctx.push()
+        db.create_all()
+        self.client = self.app.test_client()
+        admin = User(first_name="Admin", last_name="One", email="admin@example.com", password="x", is_admin=True)
+        amenities = [Amenity(name="Wifi"), Amenity(name="Pool")]
+        db.session.add_all([admin] + amenities)
+        db.session.commit()
+        self.ids = {'user': admin.id, 'amenity': amenities[0].id}
+        self.auth = {'Authorization': f'Bearer {create_access_token(identity=admin.id)}'}
+        self.reviewers = 0
+
+    def tearDown(self):
+        db.session.remove()
+        db.drop_all()
+        self.ctx.pop()
+
+    def _add_places(self, places, reviews_per_place):
+        """Agrega lugares con amenities y reviews de usuarios nuevos"""
+        admin = db.session.get(User, self.ids['user'])
+        amenities = Amenity.query.all()
+        for i in range(places):
+            reviewers = [User(first_name="Guest", last_name=str(n), email=f"guest{n}@example.com", password="x")
+                         for n in range(self.reviewers, self.reviewers + reviews_per_place)]
+            self.reviewers += reviews_per_place
+            place = Place(title=f"Place {i}", description="", price=10 + i, latitude=1.0, longitude=2.0,
+                          owner=admin, amenities=amenities)
+            db.session.add_all([place] + reviewers)
+            db.session.flush()
+            reviews = [Review(text="Nice", rating=4, place=place, user=reviewer) for reviewer in reviewers]
+            db.session.add_all(reviews)
+        db.session.commit()
+        self.ids.update(place=place.id, review=reviews[0].id)
+        db.session.expunge_all()
+
+    def _counts(self):
+        """{petición: consultas} con los datos actuales"""
+        return {path: self.assertWithinQueryBudget(method, path.format(**self.ids),
+                                                   headers=self.auth if needs_auth else {})
+                for method, path, needs_auth in REQUESTS}
+
+    def test_endpoints_within_budget_regardless_of_rows(self):
+        """Verifica que cada endpoint respeta su presupuesto y no crece con lugares ni reviews"""
+        self._add_places(1, 1)
+        small = self._counts()
+        self._add_places(7, 5)
+        large = self._counts()
+        for path in small:
+            with self.subTest(path=path):
+                self.assertEqual(large[path], small[path])
+
+    def test_budgets_match_routes(self):
+        """Verifica que toda ruta GET de la API tiene presupuesto y que no sobran presupuestos"""
+        routes = {f'GET {rule.rule}' for rule in self.app.url_map.iter_rules()
+                  if rule.rule.startswith('/api/v1/') and 'GET' in rule.methods and rule.rule not in UNBUDGETED}
+        self.assertEqual(set(load_budgets()), routes)
+        measured = {self.budget_key(method, path) for method, path, _ in REQUESTS}
+        self.assertEqual(measured, routes)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,97 @@
+import io
+import json
+import logging
+import re
+import unittest
+from sqlalchemy import event
+from app import create_app, db, logs
+from app.models.user import User
+from app.models.place import Place
+from app.models.review import Review
+from app.services.facade import facade
+
+
+class TestServerTiming(unittest.TestCase):
+    """Pruebas para la instrumentación SQL por petición (Server-Timing)"""
+
+    def setUp(self):
+        self.app = create_app('testing')
+        self.ctx = self.app.app_context()
+        self.ctx.push()
+        db.create_all()
+        owner = User(first_name="Owner", last_name="One", email="owner@example.com", password="x")
+        guests = [User(first_name="Guest", last_name=str(i), email=f"guest{i}@example.com", password="x")
+                  for i in range(3)]
+        db.session.add_all([owner, *guests])
+        db.session.flush()
+        place = Place(title="Loft", description="", price=10, latitude=1.0, longitude=2.0, owner=owner)
+        db.session.add(place)
+        db.session.flush()
+        db.session.add_all([Review(text="Nice", rating=4, place=place, user=guest) for guest in guests])
+        db.session.commit()
+        self.place_id = place.id
+        db.session.expunge_all()
+        self.client = self.app.test_client()
+        self.statements = []
+        event.listen(db.engine, 'before_cursor_execute', self._count)
+
+    def tearDown(self):
+        event.remove(db.engine, 'before_cursor_execute', self._count)
+        db.session.remove()
+        db.drop_all()
+        self.ctx.pop()
+        logs.configure(self.app.config)
+        logging.getLogger('app.sql').setLevel(logging.NOTSET)
+
+    def _count(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+
+    def _metrics(self, response):
+        """Server-Timing como {nombre: {'dur': float, 'desc': str}}."""
+        metrics = {}
+        for entry in response.headers['Server-Timing'].split(','):
+            name, *params = [part.strip() for part in entry.split(';')]
+            metrics[name] = {key: value.strip('"') for key, value in (param.split('=', 1) for param in params)}
+        return metrics
+
+    def test_place_detail(self):
+        """Verifica que el header cuenta las consultas reales, los objetos cargados y los tiempos"""
+        response = self.client.get(f'/api/v1/places/{self.place_id}')
+        self.assertEqual(response.status_code, 200)
+        metrics = self._metrics(response)
+        self.assertEqual(int(metrics['db-queries']['desc']), len(self.statements))
+        # El lugar, su dueño, 3 reseñas y sus autores
+        self.assertGreaterEqual(int(metrics['db-entities']['desc']), 5)
+        self.assertGreater(float(metrics['db']['dur']), 0)
+        self.assertGreater(float(metrics['serialize']['dur']), 0)
+        self.assertGreaterEqual(float(metrics['app']['dur']), float(metrics['db']['dur']))
+
+    def test_requests_are_independent(self):
+        """Verifica que cada petición empieza de cero y que fuera de una petición no se cuenta nada"""
+        facade.get_all_places()
+        self.client.get(f'/api/v1/places/{self.place_id}')
+        self.statements.clear()
+        metrics = self._metrics(self.client.get('/api/v1/amenities/'))
+        self.assertEqual(int(metrics['db-queries']['desc']), len(self.statements))
+
+    def test_disabled(self):
+        """Verifica que SERVER_TIMING apaga el header"""
+        self.app.config['SERVER_TIMING'] = False
+        self.assertNotIn('Server-Timing', self.client.get('/api/v1/places/').headers)
+
+    def test_log_line_with_statements(self):
+        """Verifica la línea de 'app.sql' y la lista de sentencias con SQL_DEBUG"""
+        stream = io.StringIO()
+        self.app.config.update(LOG_LEVEL='WARNING', LOG_LEVELS={'app.sql': 'INFO'}, SQL_DEBUG=True)
+        logs.configure(self.app.config, stream=stream)
+        self.client.get(f'/api/v1/places/{self.place_id}')
+        [line] = [json.loads(line) for line in stream.getvalue().splitlines()]
+        self.assertEqual(line['logger'], 'app.sql')
+        self.assertEqual(line['queries'], len(self.statements))
+        self.assertEqual([s['sql'] for s in line['statements']], self.statements)
+        self.assertTrue(all(s['ms'] >= 0 for s in line['statements']))
+        self.assertTrue(re.match(r'GET /api/v1/places/\S+: \d+ consultas en [\d.]+ ms', line['msg']))
+
+
+if __name__ == "__main__":
+    unittest.main()
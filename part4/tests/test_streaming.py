@@ -0,0 +1,85 @@
+import json
+import unittest
+from flask_jwt_extended import create_access_token
+from app import create_app, db
+from app.api.v1.representations import json_array_response
+from app.models.user import User
+from app.models.place import Place
+from app.models.review import Review
+from app.services.facade import facade
+
+
+class TestStreaming(unittest.TestCase):
+    """Pruebas para los listados completos en streaming"""
+
+    def setUp(self):
+        self.app = create_app('testing')
+        self.ctx = self.app.app_context()
+        self.ctx.push()
+        db.create_all()
+        self.owner = User(first_name="Owner", last_name="One", email="owner@example.com", password="x")
+        self.guest = User(first_name="Guest", last_name="Two", email="guest@example.com", password="x")
+        db.session.add_all([self.owner, self.guest])
+        db.session.flush()
+        self.places = [Place(title=f"Place {i}", description="", price=10 + i, latitude=1.0, longitude=2.0,
+                             owner=self.owner) for i in range(5)]
+        db.session.add_all(self.places)
+        db.session.flush()
+        db.session.add_all([Review(text="Nice", rating=4, place=place, user=self.guest) for place in self.places])
+        db.session.commit()
+        self.client = self.app.test_client()
+        self.auth = {'Authorization': f'Bearer {create_access_token(identity=self.guest.id)}'}
+
+    def tearDown(self):
+        db.session.remove()
+        db.drop_all()
+        self.ctx.pop()
+
+    def test_iter_batches(self):
+        """Verifica que los lotes recorren todo en orden (created_at, id) sin repetir"""
+        batches = list(facade.iter_places(batch_size=2))
+        self.assertEqual([len(batch) for batch in batches], [2, 2, 1])
+        expected = sorted(self.places, key=lambda place: (place.created_at, place.id))
+        self.assertEqual([place['id'] for batch in batches for place in batch], [place.id for place in expected])
+        users = [user['id'] for batch in facade.iter_users(batch_size=1) for user in batch]
+        self.assertEqual(sorted(users), sorted([self.owner.id, self.guest.id]))
+
+    def test_listings_are_streamed(self):
+        """Verifica que los listados salen en streaming con el mismo JSON que armados enteros"""
+        for path, headers in (('/api/v1/places/', {}), ('/api/v1/places/reviews/', {}),
+                              ('/api/v1/users/', self.auth)):
+            self.app.config['STREAM_JSON'] = True
+            response = self.client.get(path, headers=headers, buffered=False)
+            self.assertTrue(response.is_streamed, path)
+            self.assertNotIn('Content-Length', response.headers)
+            streamed = json.loads(b''.join(response.response))
+            response.close()
+            self.assertEqual(len(streamed), 5 if 'places' in path else 2)
+
+            self.app.config['STREAM_JSON'] = False
+            self.assertEqual(self.client.get(path, headers=headers).get_json(), streamed, path)
+
+    def test_streamed_listing_revalidates(self):
+        """Verifica que el listado en streaming conserva su ETag y el 304"""
+        response = self.client.get('/api/v1/places/')
+        self.assertEqual(self.client.get('/api/v1/places/', headers={'If-None-Match': response.headers['ETag']})
+                         .status_code, 304)
+
+    def test_empty_listings(self):
+        """Verifica las respuestas de lista vacía"""
+        Review.query.delete()
+        Place.query.delete()
+        db.session.commit()
+        self.assertEqual(self.client.get('/api/v1/places/').get_json(), [])
+        self.assertEqual(self.client.get('/api/v1/places/reviews/').get_json(), {"message": "No reviews found"})
+
+    def test_json_array_across_batches(self):
+        """Verifica que el arreglo se arma bien con varios lotes"""
+        with self.app.test_request_context():
+            response = json_array_response(iter([[{'a': 1}, {'a': 2}], [{'a': 3}]]), lambda item: item['a'])
+            self.assertEqual(b''.join(response.response), b'[1,2,3]\n')
+            self.assertIsNone(json_array_response(iter([])))
+
+
+if __name__ == "__main__":
+    unittest.main()
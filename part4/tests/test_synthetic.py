@@ -0,0 +1,83 @@
+import unittest
+from sqlalchemy import func, select
+from app import create_app, db
+from app.models.user import User
+from app.models.place import Place, place_amenity
+from app.models.review import Review
+from app.services import synthetic
+from app.services.facade import facade
+
+
+class TestSynthetic(unittest.TestCase):
+    """Pruebas para el generador de datos sintéticos (`flask hbnb generate`)"""
+
+    def setUp(self):
+        self.app = create_app('testing')
+        self.ctx = self.app.app_context()
+        self.ctx.push()
+        db.create_all()
+
+    def tearDown(self):
+        db.session.remove()
+        db.drop_all()
+        self.ctx.pop()
+
+    def _snapshot(self):
+        return (db.session.execute(select(User.id, User.email).order_by(User.id)).all(),
+                db.session.execute(select(Place.id, Place.title, Place.price, Place.latitude)
+                                   .order_by(Place.id)).all(),
+                db.session.execute(select(Review.id, Review.place_id, Review.user_id, Review.rating)
+                                   .order_by(Review.id)).all())
+
+    def test_counts_and_invariants(self):
+        """Verifica los totales exactos, que nadie reseña su lugar y que los agregados cuadran"""
+        summary = synthetic.generate(users=30, places=40, reviews=400, seed=3)
+        self.assertEqual((summary['users'], summary['places'], summary['reviews']), (30, 40, 400))
+        self.assertEqual(Review.query.count(), 400)
+
+        own = (db.session.query(Review).join(Place, Place.id == Review.place_id)
+               .filter(Review.user_id == Place.user_id).count())
+        self.assertEqual(own, 0)
+        pairs = db.session.query(Review.user_id, Review.place_id).distinct().count()
+        self.assertEqual(pairs, 400)
+        self.assertEqual(db.session.query(place_amenity).count(), summary['amenity_links'])
+
+        stored = {p.id: (p.review_count, p.rating_sum, p.rating_hist_5) for p in Place.query.all()}
+        facade.recompute_place_ratings()
+        db.session.expire_all()
+        self.assertEqual(stored, {p.id: (p.review_count, p.rating_sum, p.rating_hist_5) for p in Place.query.all()})
+
+    def test_power_law_reviews(self):
+        """Verifica que unos pocos lugares concentran la mayoría de las reseñas"""
+        synthetic.generate(users=200, places=100, reviews=2000, seed=1)
+        counts = sorted((c for c, in db.session.query(Place.review_count)), reverse=True)
+        self.assertGreater(sum(counts[:10]), sum(counts) / 2)
+        self.assertLess(counts[50], counts[0] / 10)
+
+    def test_deterministic(self):
+        """Verifica que la misma semilla genera exactamente los mismos datos"""
+        synthetic.generate(users=10, places=15, reviews=60, seed=7)
+        first = self._snapshot()
+        db.drop_all()
+        db.create_all()
+        synthetic.generate(users=10, places=15, reviews=60, seed=7)
+        self.assertEqual(self._snapshot(), first)
+
+    def test_indexes_and_search_after_generation(self):
+        """Verifica que se recrean los índices (email único) y que el índice FTS queda poblado"""
+        synthetic.generate(users=5, places=20, reviews=10, seed=2)
+        names = set(db.session.execute(db.text("SELECT name FROM sqlite_master WHERE type = 'index'")).scalars())
+        self.assertTrue({'uq_reviews_user_place', 'ix_users_email_lower', 'ix_places_geohash'} <= names)
+        title_word = Place.query.first().title.split()[1]
+        self.assertTrue(facade.search_places({'q': title_word}))
+        self.assertTrue(User.query.filter_by(email='user0@example.com').one().verify_password('password123'))
+
+    def test_too_many_reviews(self):
+        """Verifica que se rechaza un total imposible sin duplicar reseñas"""
+        with self.assertRaises(ValueError):
+            synthetic.generate(users=3, places=2, reviews=5)
+        self.assertEqual(db.session.scalar(select(func.count()).select_from(User)), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+import unittest
+from sqlalchemy import event
+from app import create_app, db
+from app.models.amenity import Amenity
+from app.persistence.unit_of_work import unit_of_work
+from app.services.facade import facade
+
+
+class TestUnitOfWork(unittest.TestCase):
+    """Pruebas para la unidad de trabajo (un commit por petición o llamada)"""
+
+    def setUp(self):
+        self.app = create_app('testing')
+        self.ctx = self.app.app_context()
+        self.ctx.push()
+        db.create_all()
+        self.commits = 0
+        event.listen(db.engine, 'commit', self._count_commit)
+
+        @self.app.route('/uow-test/<int:status>', methods=['POST'])
+        def create_two_amenities(status):
+            facade.create_amenity({'name': 'Wifi'})
+            facade.create_amenity({'name': 'Pool'})
+            return {}, status
+
+    def tearDown(self):
+        event.remove(db.engine, 'commit', self._count_commit)
+        db.session.remove()
+        db.drop_all()
+        self.ctx.pop()
+
+    def _count_commit(self, conn):
+        self.commits += 1
+
+    def _names(self):
+        db.session.expire_all()
+        return sorted(a.name for a in Amenity.query.all())
+
+    def test_facade_call_commits_once(self):
+        """Verifica que una llamada a la fachada fuera de una petición confirma sus cambios"""
+        amenity = facade.create_amenity({'name': 'Wifi'})
+        self.assertEqual(self.commits, 1)
+        facade.update_amenity(amenity['id'], {'name': 'Fast Wifi'})
+        db.session.remove()
+        self.assertEqual(self._names(), ['Fast Wifi'])
+
+    def test_nested_calls_share_one_commit(self):
+        """Verifica que las llamadas anidadas confirman una sola vez, al final"""
+        with unit_of_work():
+            facade.create_amenity({'name': 'Wifi'})
+            facade.create_amenity({'name': 'Pool'})
+            self.assertEqual(self.commits, 0)
+        self.assertEqual(self.commits, 1)
+        self.assertEqual(self._names(), ['Pool', 'Wifi'])
+
+    def test_error_rolls_back_everything(self):
+        """Verifica que una excepción descarta todo lo hecho en la unidad de trabajo"""
+        with self.assertRaises(ValueError):
+            with unit_of_work():
+                facade.create_amenity({'name': 'Wifi'})
+                facade.create_amenity({'name': ''})
+        self.assertEqual(self._names(), [])
+
+    def test_request_scope(self):
+        """Verifica que una petición hace un solo commit y que una respuesta de error no confirma"""
+        client = self.app.test_client()
+        self.assertEqual(client.post('/uow-test/201').status_code, 201)
+        self.assertEqual(self.commits, 1)
+        self.assertEqual(self._names(), ['Pool', 'Wifi'])
+
+        db.session.query(Amenity).delete()
+        db.session.commit()
+        self.assertEqual(client.post('/uow-test/400').status_code, 400)
+        self.assertEqual(self._names(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,46 @@
+import unittest
+from app import create_app, db
+from app.services.facade import facade
+
+
+class TestUserLookup(unittest.TestCase):
+    """Pruebas para la búsqueda de usuarios por email"""
+
+    def setUp(self):
+        self.app = create_app('testing')
+        self.ctx = self.app.app_context()
+        self.ctx.push()
+        db.create_all()
+        facade.create_user({
+            'first_name': 'Alice',
+            'last_name': 'Smith',
+            'email': 'alice@example.com',
+            'password': 'secret'
+        })
+
+    def tearDown(self):
+        db.session.remove()
+        db.drop_all()
+        self.ctx.pop()
+
+    def test_lookup_is_case_insensitive(self):
+        """Verifica que el email se normaliza al buscar"""
+        user = facade.get_user_by_email('  Alice@Example.COM ')
+        self.assertIsNotNone(user)
+        self.assertEqual(user.email, 'alice@example.com')
+
+    def test_lookup_missing_email(self):
+        """Verifica que un email inexistente devuelve None"""
+        self.assertIsNone(facade.get_user_by_email('bob@example.com'))
+        self.assertIsNone(facade.get_user_by_email(None))
+
+    def test_lookup_uses_lower_email_index(self):
+        """Verifica que la consulta usa el índice funcional y no recorre la tabla"""
+        plan = db.session.execute(db.text(
+            "EXPLAIN QUERY PLAN SELECT * FROM users WHERE lower(email) = :email"
+        ), {'email': 'alice@example.com'}).fetchall()
+        detail = ' '.join(row[-1] for row in plan)
+        self.assertIn('ix_users_email_lower', detail)
+
+if __name__ == "__main__":
+    unittest.main()